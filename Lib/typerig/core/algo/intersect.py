@@ -7,9 +7,11 @@
 #   curve_curve_intersections(c1, c2, tol)   cubic vs cubic
 #   line_to_cubic(p0, p1)                    degree-elevate a segment
 #   split_cubic(curve, t)                    de Casteljau split
+#   box_overlap_pairs(boxes, others)         sweep-and-prune candidate pairs
 #
 # Object-level wrappers live on CubicBezier.intersect_curve()
-# and Contour.intersections() / self_intersections().
+# and Contour.intersections() / self_intersections(),
+# Layer.intersections().
 # -----------------------------------------------------------
 # (C) Vassil Kateliev, 2026       (http://www.kateliev.com)
 # (C) TypeRig                      (http://www.typerig.com)
@@ -19,7 +21,7 @@
 # No warranties. By using this you agree
 # that you use it at your own risk!
 
-__version__ = '1.0.0'
+__version__ = '1.1.0'
 
 # - Config -------------------------------
 MAX_DEPTH = 40			# recursion cap — bounds work on coincident/overlapping curves
@@ -75,6 +77,45 @@ def _boxes_overlap(a, b):
 	return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
 
 
+def box_overlap_pairs(boxes, others=None):
+	'''Overlapping (xmin, ymin, xmax, ymax) box pairs by sweep-and-prune.
+	Boxes are swept in xmin order against the boxes still open on x, so
+	only neighbours on x are compared — near-linear for outline segments.
+
+	With one list: pairs (i, j), i < j, within it. With two: pairs (i, j)
+	with i indexing boxes and j others. Sorted; touching boxes overlap.
+	'''
+	if others is None:
+		events = sorted((box[0], i, 0) for i, box in enumerate(boxes))
+	else:
+		events = sorted([(box[0], i, 0) for i, box in enumerate(boxes)] + [(box[0], j, 1) for j, box in enumerate(others)])
+
+	lists = (boxes, boxes if others is None else others)
+	active = ([], [])
+	pairs = []
+
+	for x_min, i, side in events:
+		box = lists[side][i]
+		other_side = side if others is None else 1 - side
+		candidates = lists[other_side]
+
+		# - Prune boxes that closed before this one opened
+		open_side = [j for j in active[other_side] if candidates[j][2] >= x_min]
+		active[other_side][:] = open_side
+
+		for j in open_side:
+			if box[1] <= candidates[j][3] and candidates[j][1] <= box[3]:
+				if others is None:
+					pairs.append((j, i) if j < i else (i, j))
+				else:
+					pairs.append((j, i) if side else (i, j))
+
+		active[side].append(i)
+
+	pairs.sort()
+	return pairs
+
+
 # - Intersection -------------------------
 def curve_curve_intersections(c1, c2, tolerance=0.1):
 	'''All intersections of two cubic beziers given as 4-point tuples
@@ -187,6 +228,16 @@ if __name__ == '__main__':
 	far = ((500., 500.), (550., 600.), (650., 600.), (700., 500.))
 	check('disjoint: no hits', curve_curve_intersections(arch, far) == [])
 
+	# Sweep-and-prune agrees with the all-pairs box test
+	import random
+	rnd = random.Random(7)
+	boxes = [(x, y, x + rnd.uniform(0, 60), y + rnd.uniform(0, 60)) for x, y in
+		((rnd.uniform(0, 500), rnd.uniform(0, 500)) for _ in range(120))]
+	check('sweep pairs: within one list', box_overlap_pairs(boxes) ==
+		[(i, j) for i in range(120) for j in range(i + 1, 120) if _boxes_overlap(boxes[i], boxes[j])])
+	check('sweep pairs: across two lists', box_overlap_pairs(boxes[:50], boxes[50:]) ==
+		[(i, j) for i in range(50) for j in range(70) if _boxes_overlap(boxes[i], boxes[50 + j])])
+
 	# Identical curves: depth cap terminates, sample of hits (unspecified)
 	hits = curve_curve_intersections(arch, arch)
 	check('identical: terminates', True)
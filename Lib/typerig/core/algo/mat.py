@@ -15,9 +15,6 @@ import heapq
 from collections import defaultdict
 
 from typerig.core.objects.point import Point
-from typerig.core.objects.line import Line
-from typerig.core.objects.cubicbezier import CubicBezier
-from typerig.core.objects.quadraticbezier import QuadraticBezier
 from typerig.core.objects.node import Node
 from typerig.core.objects.contour import Contour
 from typerig.core.objects.sdf import SignedDistanceField
@@ -25,7 +22,7 @@ from typerig.core.func.geometry import point_in_polygon
 from typerig.core.func.math import three_point_circle
 
 # - Init -------------------------------
-__version__ = '0.1.2'
+__version__ = '0.2.0'
 
 # - Constants --------------------------
 _EPS = 1e-9
@@ -443,8 +440,9 @@ def _branch_to_cubic_contour(branch, tolerance=1.0, return_radii=False):
 def sample_contour(contour, step=3.0):
 	"""Sample points along a contour at approximately `step` unit intervals.
 
-	Uses arc-length stepping for CubicBezier segments and uniform
-	parametric stepping for Line and QuadraticBezier segments.
+	Uses the contour's equidistant arc-length samples: every segment is
+	split into equal arc-length parts from its cached length table, so
+	curves are sampled as evenly as lines.
 
 	Args:
 		contour: TypeRig Contour object
@@ -453,45 +451,7 @@ def sample_contour(contour, step=3.0):
 	Returns:
 		list of (x, y) tuples, ordered along the contour
 	"""
-	points = []
-
-	for segment in contour.segments:
-		if isinstance(segment, Line):
-			seg_len = segment.length
-			if seg_len < _EPS:
-				continue
-			n_samples = max(1, int(seg_len / step))
-			for i in range(n_samples):
-				t = i / float(n_samples)
-				pt = segment.solve_point(t)
-				points.append((pt.x, pt.y))
-
-		elif isinstance(segment, CubicBezier):
-			seg_len = segment.get_arc_length()
-			if seg_len < _EPS:
-				continue
-			n_samples = max(1, int(seg_len / step))
-			# Adaptive time step: coarser sampling allows less precise arc-length solve
-			_ts = min(0.01, 1.0 / max(n_samples * 5, 50))
-			for i in range(n_samples):
-				dist = i * step
-				if dist > seg_len:
-					dist = seg_len
-				t = segment.solve_distance_start(dist, timeStep=_ts)
-				pt = segment.solve_point(t)
-				points.append((pt.x, pt.y))
-
-		elif isinstance(segment, QuadraticBezier):
-			seg_len = segment.get_arc_length()
-			if seg_len < _EPS:
-				continue
-			n_samples = max(1, int(seg_len / step))
-			for i in range(n_samples):
-				t = i / float(n_samples)
-				pt = segment.solve_point(t)
-				points.append((pt.x, pt.y))
-
-	return points
+	return contour.equidistant_samples(step)
 
 
 # - Step 2: Bowyer-Watson Delaunay + Voronoi Dualization ----------
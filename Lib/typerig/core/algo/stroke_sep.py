@@ -119,7 +119,7 @@ from typerig.core.algo.stroke_sep_solver import (
 
 
 # - Init --------------------------------
-__version__ = '0.7.0'
+__version__ = '0.7.1'
 
 
 # ============================================================
@@ -363,6 +363,7 @@ def _reverse_contour_nodes(contour):
 	"""Reverse the node order in a contour (for inner contour winding fix)."""
 	cloned = _fast_clone_contour(contour)
 	cloned.data.reverse()
+	cloned.touch()
 	return cloned
 
 
@@ -468,6 +468,7 @@ def _fast_clone_node(node):
 	"""Clone a Node without copy.deepcopy. ~100x faster for contour splitting."""
 	from typerig.core.objects.transform import Transform
 	n = Node.__new__(Node)
+	n.parent = None
 	n.x = node.x
 	n.y = node.y
 	n.type = node.type
@@ -480,7 +481,6 @@ def _fast_clone_node(node):
 	n.identifier = getattr(node, 'identifier', False)
 	n.complex_math = getattr(node, 'complex_math', True)
 	n.weight = Point(0., 0.)
-	n.parent = None
 	n.lib = getattr(node, 'lib', None)
 	return n
 
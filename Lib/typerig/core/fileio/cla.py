@@ -12,7 +12,7 @@ from datetime import datetime
 from typerig.core.base import message
 
 # - Init -----------------------------
-__version__ = '0.1.0'
+__version__ = '0.1.1'
 
 # - Classes --------------------------
 class CLAparser(object):
@@ -37,7 +37,7 @@ class CLAparser(object):
 	def __enter__(self):
 		self.__file_object = open(self.__path, self.__mode)
 		if self.__mode not in ('a', 'w'):
-			self.__file_data = iter(self.__file_object.readlines())
+			self.__file_data = self.__file_object
 		return self
 
 	def __exit__(self, type, val, tb):
@@ -47,18 +47,19 @@ class CLAparser(object):
 		return self
 
 	def __next__(self):
-		new_line = next(self.__file_data)
-		
-		if self.__file_data is None or new_line == None:
+		if self.__file_data is None:
 			raise StopIteration
-		else:
-			if self.__class_line in new_line:
-				class_name, class_members = new_line.strip().split('=')
+
+		for new_line in self.__file_data:
+			new_line = new_line.strip()
+
+			if new_line.startswith(self.__class_line) and '=' in new_line:
+				class_name, class_members = new_line.split('=', 1)
 				class_name = class_name.strip().replace(self.__class_line, '')
-				class_members = class_members.strip().replace('[', '').replace(']', '').replace(self.__end_line,'').split(' ')
+				class_members = class_members.replace('[', ' ').replace(']', ' ').replace(self.__end_line, ' ').split()
 				return (class_name, class_members)
-			else:
-				return self.__next__()
+
+		raise StopIteration
 
 	def next(self):
 		# Python 2 fixup
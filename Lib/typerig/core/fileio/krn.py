@@ -12,7 +12,7 @@ from datetime import datetime
 from typerig.core.base import message
 
 # - Init -----------------------------
-__version__ = '0.1.0'
+__version__ = '0.1.1'
 
 # - Classes --------------------------
 class KRNparser(object):
@@ -47,15 +47,18 @@ class KRNparser(object):
 		return self
 
 	def __next__(self):
-		new_line = self.__file_object.readline().strip()
-
-		if self.__file_object is None or new_line == b'':
+		# - Streamed line by line; a loop, not recursion, so files with long
+		# - comment/header runs cannot exhaust the stack
+		if self.__file_object is None:
 			raise StopIteration
-		else:
-			if self.__kern_line in new_line:
-				return tuple(new_line.strip(self.__kern_line).strip().split())
-			else:
-				return self.__next__()
+
+		for new_line in self.__file_object:
+			tokens = new_line.split()
+
+			if tokens and tokens[0] == self.__kern_line:
+				return tuple(tokens[1:])
+
+		raise StopIteration
 
 	def next(self):
 		# Python 2 fixup
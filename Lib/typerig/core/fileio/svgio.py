@@ -22,15 +22,21 @@ Usage:
     
     # Bulk export from font
     font.to_SVG(output_dir='./SVG', mode='color', structure='flat')
+
+    # Proof sheets: build on 4 processes, skip glyphs unchanged since the last run
+    font.to_SVG(output_dir='./SVG', workers=4, changed_only=True)
 '''
 
 # - Dependencies ------------------------
+import io
 import os
+import json
+import hashlib
 import colorsys
 from xml.etree import ElementTree as ET
 
 # - Init --------------------------------
-__version__ = '0.1.0'
+__version__ = '0.2.1'
 
 # - Constants ---------------------------
 DEFAULT_PATH_PATTERN = '{glyph}_{layer}.svg'
@@ -72,6 +78,15 @@ def _format_float(v):
     return '{:.4f}'.format(v).rstrip('0').rstrip('.')
 
 
+def _trim_numbers(text):
+    '''_format_float for every '%.4f' number of a space separated string:
+    four passes drop one trailing decimal zero each, the fifth a bare point.'''
+    text += ' '
+    for _ in range(4):
+        text = text.replace('0 ', ' ')
+    return text.replace('. ', ' ')[:-1]
+
+
 def _get_contour_style(contour_index, mode):
     '''Get fill and stroke style for a contour based on mode and index.
 
@@ -308,6 +323,10 @@ def _contour_to_d(contour, scale=1.0):
 
     Writes raw font coordinates (no Y-flip); the caller's <g transform> handles it.
     Returns a 'd' string, or None if the contour is empty.
+
+    Commands and coordinates are collected in one pass and formatted with a
+    single %-operation; _trim_numbers then strips trailing zeros exactly
+    like _format_float does per number.
     '''
     if len(contour.nodes) == 0:
         return None
@@ -320,58 +339,44 @@ def _contour_to_d(contour, scale=1.0):
     if not segments:
         return None
 
-    d_parts = []
-
     # Move to start of first segment (the first on-curve node)
     first = segments[0][0]
-    d_parts.append('M {} {}'.format(
-        _format_float(first.x * scale),
-        _format_float(first.y * scale)
-    ))
+    commands = ['M %.4f %.4f']
+    values = [first.x, first.y]
 
     for seg in segments:
         n = len(seg)
         end = seg[-1]
-        ex = _format_float(end.x * scale)
-        ey = _format_float(end.y * scale)
 
-        if n == 2:
-            # Line segment: [on, on]
-            d_parts.append('L {} {}'.format(ex, ey))
-
-        elif n == 4 and seg[1].type == 'curve':
+        if n == 4 and seg[1].type == 'curve':
             # Cubic bezier (PostScript/CFF): [on, curve, curve, on]
             cp1 = seg[1]
             cp2 = seg[2]
-            d_parts.append('C {} {} {} {} {} {}'.format(
-                _format_float(cp1.x * scale), _format_float(cp1.y * scale),
-                _format_float(cp2.x * scale), _format_float(cp2.y * scale),
-                ex, ey
-            ))
+            commands.append('C %.4f %.4f %.4f %.4f %.4f %.4f')
+            values += (cp1.x, cp1.y, cp2.x, cp2.y, end.x, end.y)
 
         elif n >= 3 and seg[1].type == 'off':
             # TT quadratic: [on, off, ..., on] — expand complex runs with implicit on-curves
             off_nodes = seg[1:-1]
             for i, off in enumerate(off_nodes):
-                qx = _format_float(off.x * scale)
-                qy = _format_float(off.y * scale)
+                commands.append('Q %.4f %.4f %.4f %.4f')
                 if i < len(off_nodes) - 1:
                     # Implicit on-curve at midpoint between this and next off-curve
                     nxt = off_nodes[i + 1]
-                    px = _format_float((off.x + nxt.x) * 0.5 * scale)
-                    py = _format_float((off.y + nxt.y) * 0.5 * scale)
+                    values += (off.x, off.y, (off.x + nxt.x) * 0.5, (off.y + nxt.y) * 0.5)
                 else:
-                    px, py = ex, ey
-                d_parts.append('Q {} {} {} {}'.format(qx, qy, px, py))
+                    values += (off.x, off.y, end.x, end.y)
 
         else:
-            # Fallback: straight line
-            d_parts.append('L {} {}'.format(ex, ey))
+            # Line segment [on, on]; fallback for anything else: straight line
+            commands.append('L %.4f %.4f')
+            values += (end.x, end.y)
 
     if contour.closed:
-        d_parts.append('Z')
+        commands.append('Z')
 
-    return ' '.join(d_parts)
+    # + 0.: negative zero prints as '0', as in _format_float
+    return _trim_numbers(' '.join(commands) % tuple([v * scale + 0. for v in values]))
 
 
 def contour_to_SVG(contour, mode='color', scale=1.0, index=0, **kwargs):
@@ -544,7 +549,35 @@ def _make_elem(tag, text):
 
 
 # - Font SVG Export ---------------------
-def font_to_SVG(font, output_dir='./SVG', mode='color', scale=1.0, structure=EXPORT_FLAT, path_pattern=None):
+SVG_EXPORT_RECORD = '.svg-export.json'  # Glyph digests of the last export, per output folder
+
+def _svg_export_chunk(tasks):
+    '''Pool job: export glyphs sent as detached pickles (see trfont._detach).'''
+    from typerig.core.fileio.trfont import _DetachedUnpickler
+    return [_write_glyph_SVG_files(_DetachedUnpickler(io.BytesIO(data)).load(), *options, fontname=fontname)
+            for data, options, fontname in tasks]
+
+def _svg_glyph_digest(glyph):
+    '''Digest of everything a glyph's SVG files are built from: its geometry
+    at the 4 decimals _format_float keeps, first unicode and layer order.
+    None for glyph objects without digest() (always exported).'''
+    if not hasattr(glyph, 'digest'):
+        return None
+
+    key = (glyph.digest(4), glyph.unicodes[:1] if glyph.unicodes else [], [str(layer.name) for layer in glyph.layers])
+    return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+def _read_svg_record(output_dir):
+    try:
+        with open(os.path.join(output_dir, SVG_EXPORT_RECORD), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    except (OSError, ValueError):
+        return None
+
+
+def font_to_SVG(font, output_dir='./SVG', mode='color', scale=1.0, structure=EXPORT_FLAT, path_pattern=None,
+                workers=None, changed_only=False):
     '''Export all glyphs in font to SVG files
     
     Args:
@@ -554,7 +587,15 @@ def font_to_SVG(font, output_dir='./SVG', mode='color', scale=1.0, structure=EXP
         scale: Coordinate scaling
         structure: 'flat' or 'nested'
         path_pattern: Custom naming pattern (default: '{glyph}_{layer}.svg')
+        workers: Processes building SVG files (None or 1: serial, 0: all cores);
+            the files do not depend on it
+        changed_only: Record glyph digests in SVG_EXPORT_RECORD and skip
+            glyphs whose digest and export options match the record left by
+            the previous changed_only export into the same folder, as long
+            as their files still exist
     '''
+    from typerig.core.fileio.trfont import _pool_size
+
     os.makedirs(output_dir, exist_ok=True)
     
     font_name = getattr(font, 'info', None)
@@ -568,10 +609,47 @@ def font_to_SVG(font, output_dir='./SVG', mode='color', scale=1.0, structure=EXP
         os.makedirs(font_output_dir, exist_ok=True)
     else:
         font_output_dir = output_dir
-    
-    # Export each glyph
-    for glyph in font.glyphs:
-        glyph_to_SVG_file(glyph, font_output_dir, mode=mode, scale=scale, structure=structure, path_pattern=path_pattern)
+
+    glyphs = font.glyphs
+    options = (font_output_dir, mode, scale, structure, path_pattern)
+
+    files = [None] * len(glyphs)
+
+    # - Glyph digests against what the last export into this folder left behind
+    if changed_only:
+        signature = hashlib.sha1(repr((mode, scale, structure, path_pattern, str(font))).encode('utf-8')).hexdigest()
+        digests = [_svg_glyph_digest(glyph) for glyph in glyphs]
+        record = _read_svg_record(font_output_dir)
+        previous = record.get('glyphs', {}) if record is not None and record.get('options') == signature else {}
+
+        for idx, (glyph, digest) in enumerate(zip(glyphs, digests)):
+            entry = previous.get(str(glyph.name))
+
+            if digest is not None and entry is not None and entry[0] == digest \
+                    and all(os.path.isfile(os.path.join(font_output_dir, name)) for name in entry[1]):
+                files[idx] = entry[1]
+
+    # - Export each glyph
+    todo = [idx for idx, names in enumerate(files) if names is None]
+    workers = min(_pool_size(workers), len(todo))
+
+    if workers > 1:
+        # Workers get each glyph pickled without its font, not the whole font
+        from typerig.core.fileio.trfont import _detach, _map_chunks
+
+        fontname = str(font)
+        written = _map_chunks(_svg_export_chunk, [(_detach(glyphs[idx]), options, fontname) for idx in todo], workers)
+    else:
+        written = [_write_glyph_SVG_files(glyphs[idx], *options) for idx in todo]
+
+    for idx, names in zip(todo, written):
+        files[idx] = names
+
+    if changed_only:
+        record = {'options': signature, 'glyphs': {str(glyph.name): [digest, names] for glyph, digest, names in zip(glyphs, digests, files)}}
+
+        with open(os.path.join(font_output_dir, SVG_EXPORT_RECORD), 'w', encoding='utf-8') as f:
+            json.dump(record, f)
     
     return font_output_dir
 
@@ -582,6 +660,17 @@ def glyph_to_SVG_file(glyph, output_dir, mode='color', scale=1.0, structure=EXPO
     All files for one glyph share the same bounding box (union of all layers) so
     layers are directly comparable when viewed side-by-side.
     '''
+    _write_glyph_SVG_files(glyph, output_dir, mode=mode, scale=scale, structure=structure, path_pattern=path_pattern)
+
+    if structure == EXPORT_NESTED:
+        return os.path.join(output_dir, glyph.name.replace(' ', '_').replace('/', '_'))
+
+    return output_dir
+
+
+def _write_glyph_SVG_files(glyph, output_dir, mode='color', scale=1.0, structure=EXPORT_FLAT, path_pattern=None, fontname=None):
+    '''glyph_to_SVG_file body; returns the written file paths relative to output_dir.
+    fontname stands in for the glyph's font in metadata (detached glyphs).'''
     os.makedirs(output_dir, exist_ok=True)
 
     glyph_name = glyph.name.replace(' ', '_').replace('/', '_')
@@ -609,6 +698,8 @@ def glyph_to_SVG_file(glyph, output_dir, mode='color', scale=1.0, structure=EXPO
     width = max(x_max - x_min, 1)
     height = max(y_max - y_min, 1)
 
+    written = []
+
     for layer_idx, layer in enumerate(glyph.layers):
         layer_name = layer.name.replace(' ', '_').replace('/', '_')
 
@@ -632,7 +723,7 @@ def glyph_to_SVG_file(glyph, output_dir, mode='color', scale=1.0, structure=EXPO
 
         # Metadata
         metadata = ET.SubElement(svg_elem, 'metadata')
-        ET.SubElement(metadata, 'fontname').text = str(getattr(glyph, 'parent', None) or 'Unknown')
+        ET.SubElement(metadata, 'fontname').text = fontname or str(getattr(glyph, 'parent', None) or 'Unknown')
         ET.SubElement(metadata, 'glyphname').text = str(glyph.name)
         if hasattr(glyph, 'unicodes') and glyph.unicodes:
             ET.SubElement(metadata, 'unicode').text = hex(glyph.unicodes[0])[2:].upper().zfill(4)
@@ -655,7 +746,9 @@ def glyph_to_SVG_file(glyph, output_dir, mode='color', scale=1.0, structure=EXPO
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(svg_string)
 
-    return glyph_output_dir
+        written.append(os.path.relpath(filepath, output_dir))
+
+    return written
 
 
 # - Add to_SVG methods to core classes --
@@ -710,9 +803,10 @@ def add_svg_methods():
 
     # Font.to_SVG()
     def font_to_SVG_method(self, output_dir='./SVG', mode='color', scale=1.0,
-                            structure=EXPORT_FLAT, path_pattern=None):
+                            structure=EXPORT_FLAT, path_pattern=None, workers=None, changed_only=False):
         return font_to_SVG(self, output_dir=output_dir, mode=mode, scale=scale,
-                            structure=structure, path_pattern=path_pattern)
+                            structure=structure, path_pattern=path_pattern,
+                            workers=workers, changed_only=changed_only)
 
     if Font is not None:
         Font.to_SVG = font_to_SVG_method
@@ -14,7 +14,7 @@ import ast
 import os
 
 # - Init -----------------------------
-__version__ = '0.1.0'
+__version__ = '0.1.1'
 
 # - Helpers --------------------------
 def _literal_or_str(value):
@@ -59,7 +59,7 @@ class TEXTPROTOparser(object):
 	def __enter__(self):
 		self.__file_object = open(self.__path, self.__mode)
 		if self.__mode not in ('a', 'w'):
-			self.__file_data = iter(self.__file_object.readlines())
+			self.__file_data = self.__file_object
 		return self
 
 	def __exit__(self, type, val, tb):
@@ -69,14 +69,12 @@ class TEXTPROTOparser(object):
 		return self
 
 	def __next__(self):
-		new_line = next(self.__file_data)
-		
-		if self.__file_data is None or new_line == None:
+		if self.__file_data is None:
 			raise StopIteration
-		else:
+
+		for new_line in self.__file_data:
 			if self.__key in new_line and len(self.__accumulator) == 0:
 				self.__accumulator.append(line_extractor(new_line, self.__mark_sep))
-				return self.__next__()
 
 			elif self.__value in new_line and len(self.__accumulator) == 1:
 				extract_key = self.__accumulator[0]
@@ -84,9 +82,8 @@ class TEXTPROTOparser(object):
 				self.__accumulator = []
 
 				return (_literal_or_str(extract_key), _literal_or_str(extract_value))
-				
-			else:
-				return self.__next__()
+
+		raise StopIteration
 
 	def next(self):
 		# Python 2 fixup
@@ -26,9 +26,10 @@
 #   MyFont.trfont/
 #   ├── font.xml        thin container: font descriptor + file pointers
 #   ├── glyphs.xml      glyph manifest: name/alias → file path + search paths
-#   └── glyphs/         embedded glyph files (optional)
-#       ├── A.trglyph
-#       └── ...
+#   ├── glyphs/         embedded glyph files (optional)
+#   │   ├── A.trglyph
+#   │   └── ...
+#   └── .cache/         opt-in binary copies of parsed glyphs (disposable)
 #
 # font.xml embeds: <info>, <metrics>, <axes>, <masters>, <instances>,
 #                  <encoding>, <kerning> — all serialized by the objects.
@@ -37,11 +38,17 @@
 
 # - Dependencies ------------------------
 
+import io
 import os
+import sys
+import shutil
+import pickle
+import struct
+import hashlib
+import tempfile
 from xml.etree import ElementTree as ET
-from xml.dom import minidom
 
-from typerig.core.objects.font import Font, FontInfo, FontMetrics
+from typerig.core.objects.font import Font, FontInfo, FontMetrics, GlyphSource
 from typerig.core.objects.axis import Axis
 from typerig.core.objects.master import Masters, Master
 from typerig.core.objects.instance import Instances, Instance
@@ -49,11 +56,14 @@ from typerig.core.objects.encoding import Encoding
 from typerig.core.objects.kern import Kerning
 from typerig.core.objects.groups import Groups
 from typerig.core.objects.glyph import Glyph
+from typerig.core.objects.node import Node, _node_from_values, _node_values
+from typerig.core.objects.packedcontour import pack_contours
+from typerig.core.fileio.trpack import GlyphPack, _replace_file
 
 from fontTools.ufoLib.filenames import userNameToFileName
 
 # - Init --------------------------------
-__version__ = '0.1.0'
+__version__ = '0.9.3'
 
 TRFONT_EXT 	= '.trfont'
 TRGLYPH_EXT = '.trglyph'
@@ -69,25 +79,472 @@ TRFONT_FORMAT_VERSION_MAJOR = 1
 TRFONT_FORMAT_VERSION_MINOR = 0
 TRFONT_CREATOR              = 'com.typerig'
 
+# Opt-in sidecar cache of parsed glyphs; never referenced by the XML files
+CACHE_DIR 	= '.cache'
+CACHE_EXT 	= '.bin'
+CACHE_LIMIT = 1 << 30	# default size cap in bytes
+
 # - Helpers -----------------------------
 def _pretty_xml(element):
-	'''Return indented XML string from an Element.'''
-	raw = ET.tostring(element, encoding='unicode')
-	parsed = minidom.parseString(raw)
-	# Strip the minidom declaration — we write our own
-	lines = parsed.toprettyxml(indent='\t').split('\n')
-	return '\n'.join(lines[1:])
+	'''Return indented XML string from an Element.
+
+	Streams the tree in the layout .trfont files have always had - that of
+	minidom.toprettyxml(indent='\t') over ET.tostring(), without building
+	and reparsing the intermediate string: one element per line, tab
+	indented; an element holding only text keeps it inline.
+	'''
+	out = []
+	_pretty_element(element, '', out)
+	return ''.join(out)
+
+def _pretty_escape(data):
+	return data.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+
+def _pretty_text(data):
+	# - Line ends inside text were normalized by the XML parser on reparse
+	if '\r' in data:
+		data = data.replace('\r\n', '\n').replace('\r', '\n')
+	return data
+
+def _pretty_element(element, indent, out):
+	tag = element.tag
+
+	if tag is ET.Comment:
+		out.append('{}<!--{}-->\n'.format(indent, element.text or ''))
+		return
+
+	if tag is ET.ProcessingInstruction:
+		out.append('{}<?{}?>\n'.format(indent, element.text or ''))
+		return
+
+	out.append(indent + '<' + tag)
+
+	for name, value in element.items():
+		out.append(' {}="{}"'.format(name, _pretty_escape(value)))
+
+	text = _pretty_text(element.text) if element.text else ''
+
+	if not len(element):
+		if text:
+			out.append('>{}</{}>\n'.format(_pretty_escape(text), tag))
+		else:
+			out.append('/>\n')
+		return
+
+	out.append('>\n')
+	inner = indent + '\t'
+
+	if text:
+		out.append(_pretty_escape(inner + text) + '\n')
+
+	for child in element:
+		_pretty_element(child, inner, out)
+
+		if child.tail:
+			out.append(_pretty_escape(inner + _pretty_text(child.tail)) + '\n')
+
+	out.append('{}</{}>\n'.format(indent, tag))
 
 def _write_xml(path, element):
 	content = '<?xml version="1.0" encoding="UTF-8"?>\n' + _pretty_xml(element)
-	with open(path, 'w', encoding='utf-8') as fh:
-		fh.write(content)
+	_write_text(path, content)
+
+def _write_text(path, content, newline=None):
+	'''Replace the file at path with content atomically: write a temp file
+	next to it, then rename it over the target. A crash mid-save leaves
+	either the old or the new file, never a truncated one. Files that
+	already hold content are not touched.
+	'''
+	if os.path.isfile(path):
+		with open(path, 'r', encoding='utf-8', newline=newline) as fh:
+			if fh.read() == content:
+				return
+
+	handle, temp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path) or os.curdir)
+
+	try:
+		with os.fdopen(handle, 'w', encoding='utf-8', newline=newline) as fh:
+			fh.write(content)
+
+		_replace_file(temp_path, path)
+
+	except BaseException:
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+		raise
+
+def _digest(text):
+	'''Content hash of a glyph file, as stored in the manifest.'''
+	return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def _read_text(path):
+	with open(path, 'r', encoding='utf-8') as fh:
+		return fh.read()
 
 def _read_xml(path):
 	if not os.path.isfile(path):
 		return None
 	return ET.parse(path).getroot()
 
+def _load_glyph(glyph_path, entry, enc_unicodes=None, packed=False, cache=None):
+	'''Parse one .trglyph file and apply the manifest/font overrides.'''
+	if cache is not None:
+		glyph = cache.parse(glyph_path)
+	else:
+		with open(glyph_path, 'r', encoding='utf-8') as fh:
+			xml_str = fh.read()
+
+		glyph = Glyph.from_XML(xml_str)
+
+	if packed:
+		pack_contours(glyph)
+
+	# Apply alias as glyph name if set
+	if entry.alias:
+		glyph.name = entry.alias
+
+	# Encoding override: font-level encoding wins over glyph-baked value
+	if enc_unicodes:
+		glyph.unicodes = list(enc_unicodes)
+
+	return glyph
+
+def _write_glyph(glyph, abs_path, digest=None):
+	'''Serialize glyph to abs_path unless the file there already has the
+	given content digest. Returns the digest of the glyph's XML.'''
+	xml_str = glyph.to_XML()
+	new_digest = _digest(xml_str)
+
+	if new_digest != digest or not os.path.isfile(abs_path):
+		_write_text(abs_path, xml_str)
+
+	return new_digest
+
+# - Parallel helpers --------------------
+# Per-glyph parse/serialize steps are independent and CPU bound. They are
+# spread over a process pool in contiguous chunks; results come back in
+# submission order, so glyph and manifest order never depend on timing.
+# Workers run the same functions as the serial path, so output is identical.
+# Glyphs go to write workers as detached pickles (see _detach): a live
+# glyph would drag its parent font, and so every other glyph, along.
+
+def _load_chunk(tasks):
+	return [_load_glyph(*task) for task in tasks]
+
+def _write_chunk(tasks):
+	return [_write_glyph(*task) for task in tasks]
+
+def _write_detached_chunk(tasks):
+	return [_write_glyph(_DetachedUnpickler(io.BytesIO(data)).load(), abs_path, digest) for data, abs_path, digest in tasks]
+
+def _pool_size(workers):
+	'''Worker process count: None or 1 runs serially, 0 uses all cores.'''
+	if workers == 0:
+		return os.cpu_count() or 1
+
+	return workers or 1
+
+def _map_chunks(func, tasks, workers):
+	'''Run func over chunks of tasks in a process pool; flat, ordered results.'''
+	from concurrent.futures import ProcessPoolExecutor
+
+	size = max(1, -(-len(tasks) // (workers * 4)))
+	chunks = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		return [item for result in pool.map(func, chunks) for item in result]
+
+# - Sidecar cache -----------------------
+# Binary copies of parsed glyph files in <font>.trfont/.cache, used by
+# TrFontIO.read(cache=...) to skip XML parsing of unchanged glyphs.
+# The .trglyph files stay authoritative: an entry is only used while its
+# glyph file has the size and mtime (or failing that, the content hash)
+# it had when the entry was made, and nothing is ever written back.
+
+_CACHE_MAGIC 	= b'TRGC'
+_CACHE_HEADER 	= struct.Struct('<4sQq20s20s')	# magic, size, mtime_ns, sha1, tag
+_CACHE_GLOBALS 	= {('uuid', 'UUID'), ('builtins', 'set'), ('builtins', 'frozenset'), ('builtins', 'complex'), ('collections', 'OrderedDict')}
+_cache_tags 	= []
+
+def _cache_tag():
+	'''Changes whenever a module whose objects are pickled changes version.'''
+	if not _cache_tags:
+		from typerig.core.objects import node, contour, shape, layer, glyph, anchor, guideline, transform, atom
+		versions = [module.__version__ for module in (node, contour, shape, layer, glyph, anchor, guideline, transform, atom)]
+		versions.append('{}.{}'.format(*sys.version_info[:2]))
+		_cache_tags.append(hashlib.sha1('|'.join(versions).encode('utf-8')).digest())
+
+	return _cache_tags[0]
+
+class _GlyphPickler(pickle.Pickler):
+	'''Stores plain nodes as (x, y, type, smooth, parent) instead of their
+	slots: about half the size, and quicker to load.'''
+	def reducer_override(self, obj):
+		if type(obj) is Node:
+			values = _node_values(obj)
+
+			if values is not None:
+				return _node_from_values, values
+
+		return NotImplemented
+
+class _GlyphUnpickler(pickle.Unpickler):
+	'''Resolves core object classes only - a cache entry can rebuild
+	glyphs, but never call anything else.'''
+	def find_class(self, module, name):
+		if (module.startswith('typerig.core.objects.') and '.' not in name) or (module, name) in _CACHE_GLOBALS:
+			return super(_GlyphUnpickler, self).find_class(module, name)
+
+		raise pickle.UnpicklingError('Unexpected global in glyph cache: {}.{}'.format(module, name))
+
+class _DetachedPickler(_GlyphPickler):
+	'''Pickles a glyph without its font: the font is stored as a
+	reference that loads as None (see _detach).'''
+	def persistent_id(self, obj):
+		return 'font' if isinstance(obj, Font) else None
+
+class _DetachedUnpickler(pickle.Unpickler):
+	def persistent_load(self, pid):
+		return None
+
+def _detach(glyph):
+	'''Pickle of glyph alone, for parallel TrFontIO.write workers.'''
+	buffer = io.BytesIO()
+	_DetachedPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(glyph)
+	return buffer.getvalue()
+
+class GlyphCache(object):
+	'''Binary sidecar cache of parsed .trglyph files, one entry per file.
+
+	Entries hold glyphs as parsed from their files - manifest alias and
+	font encoding overrides are applied after loading, as for the XML.
+	When the cache grows past limit, the oldest entries are removed.
+
+	Usage:
+		cache = GlyphCache('/path/to/MyFont.trfont')
+		glyph = cache.parse('/path/to/MyFont.trfont/glyphs/A_.trglyph')
+		cache.verify(prune=True)
+		cache.clear()
+
+	Args:
+		font_dir (str) : .trfont folder; entries live in its .cache subfolder
+		limit (int)    : size cap in bytes
+	'''
+	__slots__ = ('font_dir', 'path', 'limit')
+
+	def __init__(self, font_dir, limit=CACHE_LIMIT):
+		self.font_dir 	= font_dir
+		self.path 		= os.path.join(font_dir, CACHE_DIR)
+		self.limit 		= limit
+
+	def __repr__(self):
+		return '<GlyphCache: {}>'.format(self.path)
+
+	def entry_path(self, glyph_path):
+		'''Cache file for a glyph file: named by its path within the font.'''
+		key = os.path.normcase(os.path.relpath(os.path.abspath(glyph_path), os.path.abspath(self.font_dir)))
+		return os.path.join(self.path, hashlib.sha1(key.encode('utf-8')).hexdigest() + CACHE_EXT)
+
+	def _entry(self, glyph_path):
+		'''(entry file, raw entry data) if the entry matches glyph_path, else None.'''
+		entry_path = self.entry_path(glyph_path)
+
+		try:
+			with open(entry_path, 'rb') as fh:
+				data = fh.read()
+
+			stat = os.stat(glyph_path)
+
+		except OSError:
+			return None
+
+		if len(data) < _CACHE_HEADER.size:
+			return None
+
+		magic, size, mtime, digest, tag = _CACHE_HEADER.unpack_from(data)
+
+		if magic != _CACHE_MAGIC or tag != _cache_tag() or size != stat.st_size:
+			return None
+
+		if mtime != stat.st_mtime_ns:
+			# - Touched but maybe unchanged (checkout, copy): compare contents
+			with open(glyph_path, 'rb') as fh:
+				if hashlib.sha1(fh.read()).digest() != digest:
+					return None
+
+			# - Same content: adopt the new mtime, so it is hashed only once
+			with open(entry_path, 'r+b') as fh:
+				fh.write(_CACHE_HEADER.pack(magic, size, stat.st_mtime_ns, digest, tag))
+
+		return entry_path, data
+
+	def load(self, glyph_path):
+		'''Cached Glyph for glyph_path, or None if missing or stale.'''
+		entry = self._entry(glyph_path)
+
+		if entry is None:
+			return None
+
+		try:
+			return _GlyphUnpickler(io.BytesIO(memoryview(entry[1])[_CACHE_HEADER.size:])).load()
+
+		except Exception:
+			return None
+
+	def store(self, glyph_path, glyph, data, stat):
+		'''Cache glyph, parsed from data - the bytes of glyph_path, read after
+		taking its os.stat result stat.'''
+		if not os.path.isdir(self.path):
+			os.makedirs(self.path, exist_ok=True)
+
+			# - Keep the cache out of version control
+			with open(os.path.join(self.path, '.gitignore'), 'w') as fh:
+				fh.write('*\n')
+
+		buffer = io.BytesIO()
+		buffer.write(_CACHE_HEADER.pack(_CACHE_MAGIC, stat.st_size, stat.st_mtime_ns, hashlib.sha1(data).digest(), _cache_tag()))
+		_GlyphPickler(buffer, protocol=4).dump(glyph)
+
+		handle, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.path)
+
+		try:
+			with os.fdopen(handle, 'wb') as fh:
+				fh.write(buffer.getvalue())
+
+			_replace_file(temp_path, self.entry_path(glyph_path))
+
+		except BaseException:
+			if os.path.exists(temp_path):
+				os.remove(temp_path)
+			raise
+
+	def parse(self, glyph_path):
+		'''Glyph of a .trglyph file: the cached copy if valid, otherwise
+		parsed from the XML and cached.'''
+		glyph = self.load(glyph_path)
+
+		if glyph is None:
+			stat = os.stat(glyph_path)
+
+			with open(glyph_path, 'rb') as fh:
+				data = fh.read()
+
+			glyph = Glyph.from_XML(data.decode('utf-8'))
+			self.store(glyph_path, glyph, data, stat)
+
+		return glyph
+
+	def entries(self):
+		'''[(entry file, size, mtime), ...] of all entries.'''
+		if not os.path.isdir(self.path):
+			return []
+
+		result = []
+
+		for item in os.scandir(self.path):
+			if item.name.endswith(CACHE_EXT):
+				stat = item.stat()
+				result.append((item.path, stat.st_size, stat.st_mtime))
+
+		return result
+
+	def size(self):
+		return sum(size for _, size, _ in self.entries())
+
+	def trim(self, limit=None):
+		'''Remove the oldest entries until the cache fits limit (default:
+		self.limit). Returns the number of entries removed.'''
+		limit = self.limit if limit is None else limit
+		entries = self.entries()
+		total = sum(size for _, size, _ in entries)
+		removed = 0
+
+		for entry_path, size, _ in sorted(entries, key=lambda item: item[2]):
+			if total <= limit:
+				break
+
+			os.remove(entry_path)
+			total -= size
+			removed += 1
+
+		return removed
+
+	def clear(self):
+		'''Delete the whole cache folder. Returns the number of entries removed.'''
+		count = len(self.entries())
+
+		if os.path.isdir(self.path):
+			shutil.rmtree(self.path)
+
+		return count
+
+	def verify(self, prune=False, deep=False):
+		'''Check every entry against the glyph files of the manifest.
+
+		Args:
+			prune (bool) : remove stale, broken and orphaned entries
+			deep (bool)  : also parse each glyph file and compare it with
+			               the cached glyph (slow; checks the cache itself)
+
+		Returns:
+			dict: counts of 'valid', 'missing' (glyph file not cached),
+			'stale' (glyph file changed), 'broken' (unreadable or, when
+			deep, different from the XML) and 'orphaned' (no glyph file) entries
+		'''
+		manifest = GlyphManifest.read(os.path.join(self.font_dir, FILE_GLYPHS))
+		report = dict.fromkeys(('valid', 'missing', 'stale', 'broken', 'orphaned'), 0)
+		known, bad = set(), []
+
+		for entry in manifest.entries:
+			glyph_path = manifest.resolve_path(entry, self.font_dir)
+
+			if glyph_path is None:
+				continue
+
+			entry_path = self.entry_path(glyph_path)
+			known.add(entry_path)
+
+			if not os.path.isfile(entry_path):
+				report['missing'] += 1
+				continue
+
+			if self._entry(glyph_path) is None:
+				report['stale'] += 1
+				bad.append(entry_path)
+				continue
+
+			glyph = self.load(glyph_path)
+
+			if glyph is None or (deep and glyph.to_XML() != Glyph.from_XML(_read_text(glyph_path)).to_XML()):
+				report['broken'] += 1
+				bad.append(entry_path)
+				continue
+
+			report['valid'] += 1
+
+		for entry_path, _, _ in self.entries():
+			if entry_path not in known:
+				report['orphaned'] += 1
+				bad.append(entry_path)
+
+		if prune:
+			for entry_path in bad:
+				os.remove(entry_path)
+
+		return report
+
+def _glyph_cache(font_dir, cache):
+	'''GlyphCache for the cache argument of TrFontIO.read: False/None for
+	none, True for the default size cap, a number for a cap in bytes.'''
+	if cache is None or cache is False:
+		return None
+
+	if cache is True:
+		return GlyphCache(font_dir)
+
+	return GlyphCache(font_dir, limit=int(cache))
+
+
 # - Manifest ----------------------------
 class GlyphEntry(object):
 	'''Single glyph entry in the manifest.
@@ -95,13 +552,16 @@ class GlyphEntry(object):
 	name (str)  : canonical glyph name
 	path (str)  : path to .trglyph (relative to .trfont or absolute)
 	alias (str) : optional project-local alias (name as seen in this font)
+	digest (str): optional content hash of the file as last written by
+	              TrFontIO.write; lets later saves skip unchanged glyphs
 	'''
-	__slots__ = ('name', 'path', 'alias')
+	__slots__ = ('name', 'path', 'alias', 'digest')
 
-	def __init__(self, name, path, alias=None):
+	def __init__(self, name, path, alias=None, digest=None):
 		self.name  = name
 		self.path  = path
 		self.alias = alias
+		self.digest = digest
 
 	def __repr__(self):
 		alias_part = ' alias="{}"'.format(self.alias) if self.alias else ''
@@ -118,6 +578,8 @@ class GlyphEntry(object):
 		elem.set('src',  self.path)
 		if self.alias:
 			elem.set('alias', self.alias)
+		if self.digest:
+			elem.set('digest', self.digest)
 		return elem
 
 	@classmethod
@@ -126,6 +588,7 @@ class GlyphEntry(object):
 			name  = elem.get('name', ''),
 			path  = elem.get('src',  ''),
 			alias = elem.get('alias', None),
+			digest = elem.get('digest', None),
 		)
 
 
@@ -164,8 +627,8 @@ class GlyphManifest(object):
 				return entry
 		return None
 
-	def add(self, name, path, alias=None):
-		self.entries.append(GlyphEntry(name, path, alias))
+	def add(self, name, path, alias=None, digest=None):
+		self.entries.append(GlyphEntry(name, path, alias, digest))
 
 	def remove(self, name):
 		self.entries = [e for e in self.entries
@@ -226,6 +689,34 @@ class GlyphManifest(object):
 		return cls(entries=entries, search_paths=search_paths)
 
 
+# - Lazy glyphs -------------------------
+class TrGlyphSource(GlyphSource):
+	'''Manifest entry of a not yet parsed .trglyph (lazy TrFontIO.read).
+
+	load() applies the same steps as the eager reader: alias as glyph
+	name, font encoding over glyph-baked unicodes, optional packing.
+	A missing file loads as an empty placeholder glyph.
+	'''
+	__slots__ = ('entry', 'manifest', 'font_dir', 'packed', 'cache')
+
+	def __init__(self, entry, manifest, font_dir, packed=False, cache=None):
+		super(TrGlyphSource, self).__init__(entry.project_name)
+		self.entry 		= entry
+		self.manifest 	= manifest
+		self.font_dir 	= font_dir
+		self.packed 	= packed
+		self.cache 		= cache
+
+	def load(self):
+		glyph_path = self.manifest.resolve_path(self.entry, self.font_dir)
+
+		if glyph_path is None:
+			return Glyph(name=self.entry.project_name)
+
+		enc_unicodes = self.parent.encoding.unicodes(self.entry.project_name) if self.parent is not None else None
+		return _load_glyph(glyph_path, self.entry, enc_unicodes, self.packed, self.cache)
+
+
 # - Font IO -----------------------------
 class TrFontIO(object):
 	'''Read and write Font objects as .trfont folder packages.
@@ -241,12 +732,26 @@ class TrFontIO(object):
 		# Read
 		font = TrFontIO.read('/path/to/MyFont.trfont')
 
+		# Lazy read: glyphs parsed on first access, at most 500 kept loaded
+		font = TrFontIO.read('/path/to/MyFont.trfont', lazy=True, cache_size=500)
+
+		# Reuse binary copies of unchanged glyphs from .trfont/.cache
+		font = TrFontIO.read('/path/to/MyFont.trfont', cache=True)
+
 		# Shared-pool glyphs (external references)
 		TrFontIO.write(font, path, glyph_paths={'A': '/shared/A.trglyph'})
+
+		# Parse / serialize glyphs on 4 processes (0: all cores)
+		font = TrFontIO.read('/path/to/MyFont.trfont', workers=4)
+		TrFontIO.write(font, '/path/to/MyFont.trfont', workers=4)
+
+		# Memory mapped binary snapshot for read-heavy batch work
+		TrFontIO.write_packed(font, '/path/to/MyFont.trpack')
+		font = TrFontIO.open_packed('/path/to/MyFont.trpack')
 	'''
 
 	@staticmethod
-	def write(font, path, glyph_paths=None, embed_glyphs=True):
+	def write(font, path, glyph_paths=None, embed_glyphs=True, workers=None):
 		'''Write a Font object to a .trfont folder.
 
 		Args:
@@ -258,6 +763,16 @@ class TrFontIO(object):
 			embed_glyphs (bool)  : write .trglyph files locally when True.
 			                       Set False to write manifest-only (paths must
 			                       already exist externally).
+			workers (int)        : processes serializing glyph files;
+			                       None or 1 runs serially, 0 uses all cores
+
+		Saves are incremental: the manifest records a content digest per
+		glyph file, and files whose digest is unchanged are not rewritten.
+		Glyphs unchanged since they were read or last written (see
+		Font._track), and unloaded glyphs of a lazy font, reuse their file
+		without being serialized, so a save costs about the glyphs edited.
+		Every file is replaced atomically through a temp file, and glyph
+		files no longer in the manifest are removed from glyphs/.
 		'''
 		os.makedirs(path, exist_ok=True)
 
@@ -285,8 +800,7 @@ class TrFontIO(object):
 			# translation on Windows that would produce \r\r\n on disk.
 			# newline='' disables translation, so what we write lands verbatim.
 			normalized = features.replace('\r\n', '\n').replace('\r', '\n')
-			with open(features_path, 'w', encoding='utf-8', newline='') as fh:
-				fh.write(normalized)
+			_write_text(features_path, normalized, newline='')
 		elif os.path.isfile(features_path):
 			# Strip stale features.fea so the folder reflects the in-memory state
 			os.remove(features_path)
@@ -304,36 +818,105 @@ class TrFontIO(object):
 		if embed_glyphs:
 			os.makedirs(glyph_dir, exist_ok=True)
 
-		for glyph in font.glyphs:
-			name = glyph.name
+		# Digests of the glyph files already in the folder, from the last save
+		stored = {}
+		for entry in GlyphManifest.read(os.path.join(path, FILE_GLYPHS)).entries:
+			if entry.digest:
+				stored[entry.path] = entry.digest
+
+		pending = []	# (glyph, absolute .trglyph path, stored digest) to serialize
+		written = []	# manifest entries of pending, in the same order
+		kept    = []	# (source, entry) unloaded glyphs whose file is already in place
+		copies  = []	# (source, entry) unloaded glyphs whose file moves here
+
+		for idx, item in enumerate(font.data):
+			name = item.name
 
 			if name in glyph_paths:
 				# External shared-pool reference — just record path, no copy
 				manifest.add(name, glyph_paths[name])
+				continue
+
+			# Embed locally. Mangle the user-supplied glyph name into a
+			# filename that is safe on case-insensitive filesystems
+			# (NTFS, APFS default) and Windows-reserved-name aware.
+			# Without this, 'A' and 'a' both map to the same path and
+			# the second write silently clobbers the first.
+			filename = userNameToFileName(
+				name, existing=seen_lower, suffix=TRGLYPH_EXT,
+			)
+			seen_lower.add(filename.lower())
+			rel_path = os.path.join(GLYPHS_DIR, filename)
+			manifest.add(name, rel_path)
+
+			if not embed_glyphs:
+				continue
+
+			abs_path = os.path.join(path, rel_path)
+			source = item if isinstance(item, GlyphSource) else font._clean_source(item)
+			source_path = None
+
+			# Unloaded glyph of a lazy font, or glyph unchanged since read
+			# or written: its file is reused as is - kept in place or copied,
+			# but never parsed or serialized. Aliased glyphs are renamed on
+			# load, so those are serialized.
+			if isinstance(source, TrGlyphSource) and not source.entry.alias:
+				source_path = source.manifest.resolve_path(source.entry, source.font_dir)
+
+			if source_path is None:
+				glyph = font._glyph_at(idx) if isinstance(item, GlyphSource) else item
+				pending.append((glyph, abs_path, stored.get(rel_path)))
+				written.append(manifest.entries[-1])
+
+			elif os.path.abspath(source_path) == os.path.abspath(abs_path):
+				kept.append((source, manifest.entries[-1]))
+
 			else:
-				# Embed locally. Mangle the user-supplied glyph name into a
-				# filename that is safe on case-insensitive filesystems
-				# (NTFS, APFS default) and Windows-reserved-name aware.
-				# Without this, 'A' and 'a' both map to the same path and
-				# the second write silently clobbers the first.
-				filename = userNameToFileName(
-					name, existing=seen_lower, suffix=TRGLYPH_EXT,
-				)
-				seen_lower.add(filename.lower())
-				rel_path = os.path.join(GLYPHS_DIR, filename)
-
-				if embed_glyphs:
-					abs_path = os.path.join(path, rel_path)
-					xml_str  = glyph.to_XML()
-					with open(abs_path, 'w', encoding='utf-8') as fh:
-						fh.write(xml_str)
-
-				manifest.add(name, rel_path)
+				copies.append((source, manifest.entries[-1]))
+
+		# Unloaded glyphs in place only need a digest (older manifests lack it)
+		for source, entry in kept:
+			entry.digest = stored.get(entry.path) or _digest(_read_text(os.path.join(path, entry.path)))
+
+		# Every moved file is read before anything is written: within the same
+		# folder a glyph file may take the name of another glyph's old file
+		moved = [_read_text(source.manifest.resolve_path(source.entry, source.font_dir)) for source, entry in copies]
+
+		workers = _pool_size(workers)
+
+		if workers > 1 and len(pending) > 1:
+			digests = _map_chunks(_write_detached_chunk, [(_detach(glyph), abs_path, digest) for glyph, abs_path, digest in pending], workers)
+		else:
+			digests = _write_chunk(pending)
+
+		for entry, digest in zip(written, digests):
+			entry.digest = digest
+
+		for (source, entry), xml_str in zip(copies, moved):
+			_write_text(os.path.join(path, entry.path), xml_str)
+			entry.digest = _digest(xml_str)
+
+		if embed_glyphs:
+			# Reused glyphs now read from this folder, written ones are clean
+			for source, entry in kept + copies:
+				source.entry, source.manifest, source.font_dir = entry, manifest, path
+
+			for (glyph, abs_path, digest), entry in zip(pending, written):
+				record = font._sources.get(id(glyph))
+				packed = record is not None and isinstance(record[1], TrGlyphSource) and record[1].packed
+				font._track(glyph, TrGlyphSource(entry, manifest, path, packed))
+
+			# Remove glyph files no longer referenced by the manifest
+			referenced = set(os.path.normcase(os.path.basename(entry.path)) for entry in manifest.entries if os.path.dirname(entry.path) == GLYPHS_DIR)
+
+			for filename in os.listdir(glyph_dir):
+				if filename.endswith(TRGLYPH_EXT) and os.path.normcase(filename) not in referenced:
+					os.remove(os.path.join(glyph_dir, filename))
 
 		manifest.write(os.path.join(path, FILE_GLYPHS))
 
 	@staticmethod
-	def read(path):
+	def read(path, packed=False, lazy=False, cache_size=None, workers=None, cache=False):
 		'''Read a .trfont folder and return a populated Font object.
 
 		Reads font.xml first (info, metrics, axes, masters, instances,
@@ -341,7 +924,20 @@ class TrFontIO(object):
 		Encoding values in font.xml override unicodes in individual glyphs.
 
 		Args:
-			path (str) : path to .trfont folder
+			path (str)       : path to .trfont folder
+			packed (bool)    : store bezier contours as array-backed
+			                   PackedContour objects (compact, read-heavy use)
+			lazy (bool)      : only read the manifest; each glyph file is
+			                   parsed the first time the glyph is accessed
+			cache_size (int) : lazy mode - keep at most this many loaded
+			                   glyphs; unmodified ones are unloaded first
+			                   (None: keep everything loaded)
+			workers (int)    : processes parsing glyph files (eager mode);
+			                   None or 1 runs serially, 0 uses all cores
+			cache (bool/int) : keep parsed glyphs in the binary sidecar
+			                   cache (.trfont/.cache, see GlyphCache) and
+			                   load unchanged ones from it; a number caps
+			                   the cache size in bytes
 
 		Returns:
 			Font
@@ -389,33 +985,72 @@ class TrFontIO(object):
 		# Load manifest
 		manifest = GlyphManifest.read(os.path.join(path, FILE_GLYPHS))
 
-		# Load each glyph in manifest order
+		glyph_cache = _glyph_cache(path, cache)
+
+		if glyph_cache is not None:
+			glyph_cache.trim()
+
+		# Lazy: manifest entries stand in for glyphs until first access
+		if lazy:
+			font.cache_size = cache_size
+			font.extend([TrGlyphSource(entry, manifest, path, packed, glyph_cache) for entry in manifest.entries])
+			return font
+
+		# Load each glyph in manifest order, then add them in one bulk step
+		glyphs, tasks = [], []
+
 		for entry in manifest.entries:
 			glyph_path = manifest.resolve_path(entry, path)
 
-			if glyph_path is None or not os.path.isfile(glyph_path):
+			if glyph_path is None:
 				# Missing file — placeholder glyph keeps the order intact
-				font.append(Glyph(name=entry.project_name))
+				glyphs.append(Glyph(name=entry.project_name))
 				continue
 
-			with open(glyph_path, 'r', encoding='utf-8') as fh:
-				xml_str = fh.read()
+			glyphs.append(len(tasks))
+			tasks.append((glyph_path, entry, font.encoding.unicodes(entry.project_name), packed, glyph_cache))
 
-			glyph = Glyph.from_XML(xml_str)
+		workers = _pool_size(workers)
 
-			# Apply alias as glyph name if set
-			if entry.alias:
-				glyph.name = entry.alias
+		if workers > 1 and len(tasks) > 1:
+			loaded = _map_chunks(_load_chunk, tasks, workers)
+		else:
+			loaded = _load_chunk(tasks)
 
-			# Encoding override: font-level encoding wins over glyph-baked value
-			enc_unicodes = font.encoding.unicodes(entry.project_name)
-			if enc_unicodes:
-				glyph.unicodes = enc_unicodes
+		font.extend([loaded[item] if isinstance(item, int) else item for item in glyphs])
 
-			font.append(glyph)
+		# Glyphs read from a file are clean until edited (see TrFontIO.write)
+		for glyph, entry in zip(font.data, manifest.entries):
+			font._track(glyph, TrGlyphSource(entry, manifest, path, packed, glyph_cache))
 
 		return font
 
+	@staticmethod
+	def write_packed(font, path):
+		'''Write a Font object to a single .trpack file (see GlyphPack).
+
+		The file is a read-only snapshot: glyph directory, per-layer
+		coordinate / type arrays and metrics, plus the font descriptor.
+		'''
+		GlyphPack.write(font, path)
+
+	@staticmethod
+	def open_packed(path, lazy=True, cache_size=None, packed=True):
+		'''Open a .trpack file with mmap and return a Font object.
+
+		Args:
+			path (str)       : path to .trpack file
+			lazy (bool)      : read each glyph on first access (default);
+			                   False reads them all now
+			cache_size (int) : lazy mode - keep at most this many loaded glyphs
+			packed (bool)    : bezier contours as PackedContour objects,
+			                   filled straight from the mapping
+
+		Returns:
+			Font
+		'''
+		return GlyphPack(path).font(lazy, cache_size, packed)
+
 	@staticmethod
 	def new(path, family_name='Untitled', style_name='Regular'):
 		'''Create a new empty .trfont folder with a minimal Font skeleton.
@@ -0,0 +1,446 @@
+# MODULE: TypeRig / IO / TrPack (Format)
+# NOTE: Memory mapped binary glyph store for read-heavy batch work
+# -----------------------------------------------------------
+# (C) Vassil Kateliev, 2026 		(http://www.kateliev.com)
+# (C) Karandash Type Foundry 		(http://www.karandash.eu)
+#------------------------------------------------------------
+# www.typerig.com
+
+# No warranties. By using this you agree
+# that you use it at your own risk!
+
+# - Overview ----------------------------
+# A .trpack is one read-only file built from a core Font. It is not a
+# work format - the .trfont folder stays the source - but a compiled
+# snapshot that opens instantly and reads glyphs without XML parsing
+# of their outlines.
+#
+# File layout (little-endian, every block 8-byte aligned):
+#   header      magic 'TRPK', format version, directory offset / size
+#   glyph block per glyph:
+#     counts    layers, packed contours, nodes, name / skeleton sizes
+#     layers    width, height, first node, node count per layer
+#     contours  (ordinal, node count) per packed contour
+#     names     layer names, NUL separated
+#     skeleton  the glyph XML with the nodes of packed contours removed
+#               (attributes, anchors, components, libs, hobby contours)
+#     arrays    x (double), y (double), type code (byte), smooth (byte)
+#               of all packed nodes, layer after layer
+#   directory   JSON: type code table, font.xml / groups / features,
+#               [glyph name, block offset, block size] per glyph
+#
+# Bezier contours whose nodes carry nothing besides x, y, type and
+# smooth go to the arrays; anything else stays in the skeleton, so a
+# glyph read back serializes to exactly the XML it was written from.
+
+# - Dependencies ------------------------
+import os
+import sys
+import json
+import mmap
+import struct
+import tempfile
+from array import array
+from xml.etree import ElementTree as ET
+
+from typerig.core.objects.font import Font, GlyphSource
+from typerig.core.objects.groups import Groups
+from typerig.core.objects.glyph import Glyph
+from typerig.core.objects.packedcontour import PackedContour, NodeStore, unpack_contours, _type_code, _type_names, _has_metadata
+
+# - Init --------------------------------
+__version__ = '0.1.1'
+
+TRPACK_EXT = '.trpack'
+
+TRPACK_FORMAT_VERSION_MAJOR = 1
+TRPACK_FORMAT_VERSION_MINOR = 0
+
+_MAGIC 	= b'TRPK'
+_HEADER = struct.Struct('<4sHHQQ')		# magic, major, minor, directory offset, directory size
+_BLOCK 	= struct.Struct('<IIIIII')		# layers, contours, nodes, names size, skeleton size, reserved
+_LAYER 	= struct.Struct('<ddII')		# width, height, first node, node count
+
+# Arrays are stored little-endian; big-endian hosts swap on the way in and out
+_SWAP = sys.byteorder != 'little'
+
+# - Helpers -----------------------------
+def _replace_file(temp_path, path):
+	'''Move temp_path over path (os.replace) with the mode of the file it
+	replaces, or the umask default for a new one - mkstemp files are
+	owner-only (0600), which would lock other users out of saved files.
+	'''
+	try:
+		mode = os.stat(path).st_mode & 0o7777
+
+	except OSError:
+		umask = os.umask(0)
+		os.umask(umask)
+		mode = 0o666 & ~umask
+
+	os.chmod(temp_path, mode)
+	os.replace(temp_path, path)
+
+def _align(size):
+	return (size + 7) & ~7
+
+def _pad(size):
+	return b'\0' * (_align(size) - size)
+
+def _metric(value):
+	try:
+		return float(value)
+
+	except (TypeError, ValueError):
+		return float('nan')
+
+def _pack_nodes(contour, xs, ys, types, smooth):
+	'''Append the nodes of contour to the arrays if all of them are plain
+	(no metadata). Returns False, leaving the arrays as they were, if not.
+	'''
+	if not contour.is_bezier or not len(contour):
+		return False
+
+	if isinstance(contour, PackedContour):
+		store = contour.store
+
+		for view in store.views:
+			if view is not None and _has_metadata(view):
+				return False
+
+		xs.extend(store.x)
+		ys.extend(store.y)
+		types.extend(store.types)
+		smooth.extend(store.smooth)
+		return True
+
+	nodes = contour.nodes
+
+	for node in nodes:
+		if _has_metadata(node):
+			return False
+
+	xs.extend([node.x for node in nodes])
+	ys.extend([node.y for node in nodes])
+	types.extend([_type_code(node.type) for node in nodes])
+	smooth.extend([1 if node.smooth else 0 for node in nodes])
+	return True
+
+def _pack_glyph(glyph):
+	'''Glyph block bytes of glyph (see Overview).'''
+	elem = glyph._to_xml_element()
+	xs, ys, types, smooth = array('d'), array('d'), array('b'), array('b')
+	layer_rows, contour_rows, names = [], [], []
+	ordinal = 0
+
+	# - Objects and their elements are walked together, in document order
+	for layer, layer_elem in zip(glyph.layers, elem.iterfind('layer')):
+		first = len(xs)
+
+		for shape, shape_elem in zip(layer.shapes, layer_elem.iterfind('shape')):
+			for contour, contour_elem in zip(shape.contours, shape_elem.iterfind('contour')):
+				count = len(xs)
+
+				if _pack_nodes(contour, xs, ys, types, smooth):
+					contour_elem[:] = [child for child in contour_elem if child.tag != 'node']
+					contour_rows += (ordinal, len(xs) - count)
+
+				ordinal += 1
+
+		layer_rows.append(_LAYER.pack(_metric(layer.width), _metric(layer.height), first, len(xs) - first))
+		names.append(layer.name or '')
+
+	names = '\0'.join(names).encode('utf-8')
+	skeleton = ET.tostring(elem, encoding='unicode').encode('utf-8')
+
+	if _SWAP:
+		xs.byteswap()
+		ys.byteswap()
+
+	head = b''.join([
+		_BLOCK.pack(len(layer_rows), len(contour_rows) // 2, len(xs), len(names), len(skeleton), 0),
+		b''.join(layer_rows),
+		struct.pack('<{}I'.format(len(contour_rows)), *contour_rows),
+		names,
+		skeleton,
+		])
+
+	arrays = b''.join([xs.tobytes(), ys.tobytes(), types.tobytes(), smooth.tobytes()])
+	return b''.join([head, _pad(len(head)), arrays, _pad(len(arrays))])
+
+# - Lazy glyphs -------------------------
+class PackGlyphSource(GlyphSource):
+	'''Glyph of an open GlyphPack, read from the mapping on first access.'''
+	__slots__ = ('pack', 'index', 'packed')
+
+	def __init__(self, pack, index, packed=True):
+		super(PackGlyphSource, self).__init__(pack.names[index])
+		self.pack 	= pack
+		self.index 	= index
+		self.packed = packed
+
+	def load(self):
+		return self.pack.glyph(self.index, self.packed)
+
+# - Store -------------------------------
+class GlyphPack(object):
+	'''Read-only view of a .trpack file, opened with mmap.
+
+	Nothing but the directory is read at open. glyph() rebuilds one glyph:
+	its skeleton is parsed and each packed contour gets a NodeStore filled
+	from the mapping with one buffer copy per array. arrays() hands out
+	the coordinates of a glyph without any copy, as memoryviews into the
+	mapping - these must be released before close().
+
+	Usage:
+		GlyphPack.write(font, '/path/to/MyFont.trpack')
+
+		with GlyphPack('/path/to/MyFont.trpack') as pack:
+			glyph = pack.glyph('A')
+			for layer_name, x, y, types, smooth in pack.arrays('A'):
+				...
+
+		font = GlyphPack('/path/to/MyFont.trpack').font()
+
+	Attributes:
+		path (str)     : file path
+		names (list)   : glyph names in font order
+		types (list)   : node type name of each type code in the arrays
+		font_xml (str) : font descriptor (font.xml, without glyphs)
+		groups_xml (str or None), features (str)
+	'''
+	__slots__ = ('path', 'names', 'types', 'font_xml', 'groups_xml', 'features', '_blocks', '_index', '_table', '_file', '_map', '_view')
+
+	def __init__(self, path):
+		self.path = path
+		self._file = open(path, 'rb')
+
+		try:
+			self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+		except BaseException:
+			self._file.close()
+			raise
+
+		self._view = memoryview(self._map)
+
+		try:
+			magic, major, minor, offset, size = _HEADER.unpack_from(self._view, 0)
+
+			if magic != _MAGIC:
+				raise ValueError('Not a .trpack file: {}'.format(path))
+
+			if major > TRPACK_FORMAT_VERSION_MAJOR:
+				raise ValueError('.trpack format version {} is newer than this reader ({})'.format(major, TRPACK_FORMAT_VERSION_MAJOR))
+
+			directory = json.loads(bytes(self._view[offset:offset + size]).decode('utf-8'))
+
+		except BaseException:
+			self.close()
+			raise
+
+		self.types 		= directory['types']
+		self.font_xml 	= directory['font']
+		self.groups_xml = directory.get('groups')
+		self.features 	= directory.get('features', '')
+		self.names 		= [name for name, offset, size in directory['glyphs']]
+		self._blocks 	= [offset for name, offset, size in directory['glyphs']]
+		self._index 	= {}
+
+		for idx, name in enumerate(self.names):
+			self._index.setdefault(name, idx)
+
+		# - File type codes that differ from this process' codes are translated
+		codes = [_type_code(name) for name in self.types]
+
+		if codes == list(range(len(codes))):
+			self._table = None
+		else:
+			self._table = bytes(codes[code] if code < len(codes) else code for code in range(256))
+
+	def __repr__(self):
+		return '<{}: "{}", Glyphs: {}>'.format(self.__class__.__name__, self.path, len(self.names))
+
+	def __len__(self):
+		return len(self.names)
+
+	def __iter__(self):
+		return iter(self.names)
+
+	def __contains__(self, name):
+		return name in self._index
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def close(self):
+		'''Release the mapping; raises BufferError while arrays() views are alive.'''
+		if self._view is not None:
+			self._view.release()
+			self._view = None
+			self._map.close()
+			self._file.close()
+
+	# - Glyph blocks ---------------------
+	def _position(self, key):
+		return key if isinstance(key, int) else self._index[key]
+
+	def _read_block(self, key):
+		'''(layer rows, contour rows, layer names, skeleton, array offset, node count)'''
+		view = self._view
+		offset = self._blocks[self._position(key)]
+		layer_count, contour_count, node_count, names_size, skeleton_size, _ = _BLOCK.unpack_from(view, offset)
+		offset += _BLOCK.size
+
+		layers = [_LAYER.unpack_from(view, offset + i * _LAYER.size) for i in range(layer_count)]
+		offset += layer_count * _LAYER.size
+
+		contours = struct.unpack_from('<{}I'.format(2 * contour_count), view, offset)
+		offset += 8 * contour_count
+
+		names = bytes(view[offset:offset + names_size]).decode('utf-8').split('\0') if layer_count else []
+		offset += names_size
+
+		skeleton = bytes(view[offset:offset + skeleton_size])
+		offset = _align(offset + skeleton_size)
+
+		return layers, contours, names, skeleton, offset, node_count
+
+	def _buffers(self, base, node_count, first, count):
+		'''Slices of the mapping holding nodes first..first + count.'''
+		view = self._view
+		x = base + 8 * first
+		y = base + 8 * (node_count + first)
+		types = base + 16 * node_count + first
+		smooth = base + 17 * node_count + first
+		return view[x:x + 8 * count], view[y:y + 8 * count], view[types:types + count], view[smooth:smooth + count]
+
+	def metrics(self, key):
+		'''[(layer name, width, height)] of a glyph, by name or index.'''
+		layers, contours, names, skeleton, base, node_count = self._read_block(key)
+		return [(name, row[0], row[1]) for name, row in zip(names, layers)]
+
+	def arrays(self, key):
+		'''[(layer name, x, y, types, smooth)] of a glyph, by name or index:
+		zero-copy memoryviews (doubles, signed bytes) of the packed nodes of
+		each layer. Type codes index .types. Contours kept in the skeleton
+		are not included.
+		'''
+		layers, contours, names, skeleton, base, node_count = self._read_block(key)
+		result = []
+
+		for name, (width, height, first, count) in zip(names, layers):
+			x, y, types, smooth = self._buffers(base, node_count, first, count)
+
+			if _SWAP:
+				x, y = array('d', x.cast('d')), array('d', y.cast('d'))
+				x.byteswap()
+				y.byteswap()
+				result.append((name, x, y, types.cast('b'), smooth.cast('b')))
+			else:
+				result.append((name, x.cast('d'), y.cast('d'), types.cast('b'), smooth.cast('b')))
+
+		return result
+
+	def glyph(self, key, packed=True):
+		'''Glyph by name or index. Packed contours come back as
+		PackedContour objects, or as plain Contours with packed=False.
+		'''
+		layers, contours, names, skeleton, base, node_count = self._read_block(key)
+		glyph = Glyph.from_XML(skeleton.decode('utf-8'))
+
+		if contours:
+			slots = [(shape, i) for layer in glyph.layers for shape in layer.shapes for i in range(len(shape.data))]
+			first = 0
+
+			for k in range(0, len(contours), 2):
+				shape, i = slots[contours[k]]
+				count = contours[k + 1]
+				x, y, types, smooth = self._buffers(base, node_count, first, count)
+
+				if self._table is not None:
+					types = bytes(types).translate(self._table)
+
+				store = NodeStore.from_buffers(x, y, types, smooth)
+
+				if _SWAP:
+					store.x.byteswap()
+					store.y.byteswap()
+
+				# - The node-less contour parsed from the skeleton is dropped, so its
+				# - attributes are handed over as they are
+				contour = shape.data[i]
+				packed_contour = PackedContour(store, name=contour.name, closed=contour.closed, clockwise=contour.clockwise,
+												lib=contour._lib, transform=contour.transform)
+				PackedContour._copy_identifier(contour, packed_contour)
+				packed_contour.parent = shape
+				shape.data[i] = packed_contour
+				shape._index_cache = None
+				first += count
+
+		if not packed:
+			unpack_contours(glyph)
+
+		return glyph
+
+	def font(self, lazy=True, cache_size=None, packed=True):
+		'''Font of the pack. Lazy: glyphs are read on first access; the
+		font keeps this pack (and its mapping) alive while it needs it.
+		'''
+		font = Font.from_XML(ET.fromstring(self.font_xml), include_glyphs=False)
+		font.features = self.features
+
+		if self.groups_xml is not None:
+			font.groups = Groups.from_XML(ET.fromstring(self.groups_xml))
+
+		if lazy:
+			font.cache_size = cache_size
+			font.extend([PackGlyphSource(self, idx, packed) for idx in range(len(self.names))])
+		else:
+			font.extend([self.glyph(idx, packed) for idx in range(len(self.names))])
+
+		return font
+
+	# - Writer ---------------------------
+	@staticmethod
+	def write(font, path):
+		'''Write a Font object to a .trpack file (replaced atomically).
+		Glyphs of a lazily read font are loaded as they are packed.
+		'''
+		handle, temp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path) or os.curdir)
+
+		try:
+			with os.fdopen(handle, 'wb') as fh:
+				fh.write(b'\0' * _align(_HEADER.size))
+				offset = _align(_HEADER.size)
+				glyphs = []
+
+				for idx, item in enumerate(font.data):
+					glyph = font._glyph_at(idx) if isinstance(item, GlyphSource) else item
+					block = _pack_glyph(glyph)
+					fh.write(block)
+					glyphs.append([glyph.name, offset, len(block)])
+					offset += len(block)
+
+				groups = getattr(font, 'groups', None)
+				directory = json.dumps({
+					'types': list(_type_names),
+					'font': ET.tostring(font._to_xml_element(), encoding='unicode'),
+					'groups': ET.tostring(groups._to_xml_element(), encoding='unicode') if groups is not None and len(groups.data) else None,
+					'features': getattr(font, 'features', '') or '',
+					'glyphs': glyphs,
+					}, ensure_ascii=False).encode('utf-8')
+
+				fh.write(directory)
+				fh.seek(0)
+				fh.write(_HEADER.pack(_MAGIC, TRPACK_FORMAT_VERSION_MAJOR, TRPACK_FORMAT_VERSION_MINOR, offset, len(directory)))
+
+			_replace_file(temp_path, path)
+
+		except BaseException:
+			if os.path.exists(temp_path):
+				os.remove(temp_path)
+			raise
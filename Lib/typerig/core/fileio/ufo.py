@@ -23,8 +23,11 @@
 # - Dependencies ------------------------
 
 import os
+import json
 import shutil
 import sys
+import time
+import hashlib
 from types import SimpleNamespace
 
 from fontTools.ufoLib import UFOReader, UFOWriter, UFOFormatVersion
@@ -50,9 +53,10 @@ from typerig.core.objects.instance import Instances, Instance
 from typerig.core.objects.encoding import Encoding
 from typerig.core.objects.kern import Kerning, KernPair
 from typerig.core.objects.groups import Groups
+from typerig.core.fileio.trfont import _pool_size, _map_chunks
 
 # - Init --------------------------------
-__version__ = '0.1.0'
+__version__ = '0.3.2'
 
 # - Maps --------------------------------
 # TR FontInfo attr  →  UFO fontinfo.plist key. The kebab→UFO map is *not* a
@@ -121,6 +125,19 @@ def _warn(msg, verbose=True):
 		print('[ufo] WARN: {}'.format(msg), file=sys.stderr)
 
 
+class _StageTimer(object):
+	'''Wall time per named stage, in first-seen order (UfoConverter.timings).'''
+	def __init__(self):
+		self.stages = {}
+		self._last = time.perf_counter()
+
+	def lap(self, stage):
+		'''Charge the time since the previous lap to stage.'''
+		now = time.perf_counter()
+		self.stages[stage] = self.stages.get(stage, 0.) + now - self._last
+		self._last = now
+
+
 # - TR lib bindings ---------------------
 # All UFO-specific lib knowledge lives here. TR core objects are kept format-
 # agnostic: this module is the only place that knows which TR attributes map
@@ -138,6 +155,8 @@ TR_LIB_KEY_VERSION         = TR_LIB_PREFIX + 'lib-version'
 TR_LIB_KEY_FAMILY_STYLE    = TR_LIB_PREFIX + 'familyStyleName'
 TR_LIB_KEY_LAYER_STEMS     = TR_LIB_PREFIX + 'layer-stems'      # glyph lib: {layer_name: [stx, sty]}
 TR_LIB_KEY_CONTOUR_KINDS   = TR_LIB_PREFIX + 'contour-kinds'    # glyph lib: ['bezier'|'hobby', ...]
+# UFO data/ file: content digests of the last export of a master UFO
+TR_DATA_EXPORT_DIGEST      = TR_LIB_PREFIX + 'export-digest.json'
 
 class LibField(object):
 	'''One declarative binding for a TR attribute ↔ UFO lib key.
@@ -628,6 +647,29 @@ def _tr_to_ufo_segment_types(contour_nodes, is_closed):
 	return out
 
 
+def _component_transformation(shape):
+	t = shape.transform
+	try:
+		return (t[0], t[1], t[2], t[3], t[4], t[5])
+	except (TypeError, IndexError):
+		return (1, 0, 0, 1, 0, 0)
+
+
+def _outline_key(tr_layer):
+	'''Everything _draw_layer emits for tr_layer, as plain comparable data.'''
+	key = []
+	for shape in tr_layer.shapes:
+		if shape.is_component:
+			key.append((shape.component, _component_transformation(shape)))
+			continue
+
+		for contour in shape.contours:
+			key.append((getattr(contour, 'kind', 'bezier'), bool(contour.closed),
+			            [(node.x, node.y, node.type, bool(getattr(node, 'smooth', False)), getattr(node, 'name', None) or None)
+			             for node in contour.nodes]))
+	return key
+
+
 def _draw_layer(tr_layer, pen):
 	'''Draw a TR Layer's shapes into a UFO PointPen.
 
@@ -642,12 +684,7 @@ def _draw_layer(tr_layer, pen):
 	'''
 	for shape in tr_layer.shapes:
 		if shape.is_component:
-			t = shape.transform
-			try:
-				transformation = (t[0], t[1], t[2], t[3], t[4], t[5])
-			except (TypeError, IndexError):
-				transformation = (1, 0, 0, 1, 0, 0)
-			pen.addComponent(shape.component, transformation)
+			pen.addComponent(shape.component, _component_transformation(shape))
 			continue
 
 		for contour in shape.contours:
@@ -787,6 +824,121 @@ def _ufo_info_to_tr(ufo_info):
 	return info, metrics
 
 
+# - Glyph reading -----------------------
+# Every .glif is read independently, so the reads of a whole import are
+# collected as tasks and run serially or in contiguous chunks on a process
+# pool (see trfont._map_chunks). Results come back in task order and the
+# merge into glyphs happens in the calling process, thus glyph and layer
+# order never depend on the worker count.
+
+def _read_glyph_layer(gs, glyph_name, tr_layer_name, verbose=True):
+	'''Read one glyph of a UFO glyph set into a TR Layer.
+	Returns (layer, receiver); the receiver holds the glyph-level data
+	(unicodes, note, lib, image) as read by ufoLib.
+	'''
+	receiver = SimpleNamespace()
+	receiver.guidelines = []
+	receiver.anchors    = []
+	receiver.lib        = {}
+	receiver.unicodes   = []
+	receiver.note       = None
+	receiver.width      = 0
+	receiver.height     = 0
+
+	pen = _TrContourPen()
+	gs.readGlyph(glyph_name, glyphObject=receiver, pointPen=pen)
+
+	tr_layer = Layer(
+		name   = tr_layer_name,
+		width  = float(getattr(receiver, 'width', 0) or 0),
+		height = float(getattr(receiver, 'height', 0) or 0),
+	)
+	tr_layer.data = pen.shapes
+	for sh in pen.shapes:
+		sh.parent = tr_layer
+
+	tr_layer.anchors    = [_dict_to_anchor(a, verbose)
+	                       for a in (getattr(receiver, 'anchors', []) or [])]
+	tr_layer.guidelines = [_dict_to_guideline(g)
+	                       for g in (getattr(receiver, 'guidelines', []) or [])]
+
+	return tr_layer, receiver
+
+
+def _read_glyph_chunk(tasks):
+	'''Run read tasks (ufo_path, ufo_layer_name, tr_layer_name, glyph_name,
+	keep_receiver, verbose); one reader per UFO layer and chunk.
+	Returns [(layer, receiver or None)] in task order.
+	'''
+	glyph_sets = {}
+	readers = []
+	results = []
+
+	try:
+		for ufo_path, ufo_layer_name, tr_layer_name, glyph_name, keep_receiver, verbose in tasks:
+			gs = glyph_sets.get((ufo_path, ufo_layer_name))
+
+			if gs is None:
+				reader = UFOReader(ufo_path, validate=False)
+				readers.append(reader)
+				gs = glyph_sets[(ufo_path, ufo_layer_name)] = reader.getGlyphSet(layerName=ufo_layer_name)
+
+			tr_layer, receiver = _read_glyph_layer(gs, glyph_name, tr_layer_name, verbose)
+			results.append((tr_layer, receiver if keep_receiver else None))
+
+	finally:
+		for reader in readers:
+			reader.close()
+
+	return results
+
+
+def _read_glyphs(tasks, workers):
+	workers = _pool_size(workers)
+
+	if workers > 1 and len(tasks) > 1:
+		return _map_chunks(_read_glyph_chunk, tasks, workers)
+
+	return _read_glyph_chunk(tasks)
+
+
+# - Master export -----------------------
+# Masters of a designspace export are independent UFOs, so they are written
+# on a process pool. The font is sent once per worker process (pool
+# initializer); jobs only carry the master's position.
+# With changed_only, each master UFO records the digest of its font-level
+# data and of every glyph it holds (data/com.typerig.export-digest.json),
+# and a master whose digests match the record of the UFO on disk is left
+# alone. Plain exports neither compute nor write the record.
+
+_export_state = {}
+
+def _export_init(font, masters, verbose):
+	_export_state.update(font=font, masters=masters, verbose=verbose)
+
+def _export_master_job(job):
+	index, ufo_path, changed_only = job
+	converter = UfoConverter(verbose=_export_state['verbose'])
+	return converter._write_master_ufo(_export_state['font'], _export_state['masters'][index], ufo_path, changed_only)
+
+def _digest_of(*parts):
+	return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+def _glyph_export_digest(name, tr_layer, data):
+	'''Digest of everything a master .glif is written from.'''
+	return _digest_of(name, _outline_key(tr_layer), data.width, data.height, data.anchors, data.guidelines,
+	                  getattr(data, 'unicodes', None), getattr(data, 'note', None), sorted(data.lib.items()))
+
+def _read_export_record(ufo_path):
+	'''Digest record of a previously exported master UFO, or None.'''
+	try:
+		with open(os.path.join(ufo_path, 'data', TR_DATA_EXPORT_DIGEST), 'r', encoding='utf-8') as fh:
+			return json.load(fh)
+
+	except (OSError, ValueError):
+		return None
+
+
 # - Designspace -------------------------
 def _designspace_path_for(ufo_path):
 	'''Sibling .designspace next to a .ufo path.'''
@@ -848,10 +1000,18 @@ class UfoConverter(object):
 
 	to_ufo(font, path) / to_tr(path) dispatch on the path's extension —
 	.designspace → layout (1), .ufo → layout (2).
+
+	Imports take workers= to read .glif files on a process pool (None or
+	1 runs serially, 0 uses all cores); the result does not depend on it.
+	After every import, timings holds the wall time in seconds per stage.
+	tr_to_designspace takes workers= to write master UFOs concurrently;
+	after it, unchanged lists the masters left as they were on disk.
 	'''
 
 	def __init__(self, verbose=True):
 		self.verbose = verbose
+		self.timings = {}
+		self.unchanged = []
 
 	# -- Dispatch -----------------------
 	def to_ufo(self, font, path):
@@ -861,15 +1021,15 @@ class UfoConverter(object):
 			return self.tr_to_designspace(font, path)
 		return self.tr_to_ufo(font, path)
 
-	def to_tr(self, path):
+	def to_tr(self, path, workers=None):
 		'''Read a TR Font from a .designspace or .ufo path.'''
 		ext = os.path.splitext(path.rstrip(os.sep))[1].lower()
 		if ext == '.designspace' or (os.path.isfile(path) and path.endswith('.designspace')):
-			return self.designspace_to_tr(path)
-		return self.ufo_to_tr(path)
+			return self.designspace_to_tr(path, workers)
+		return self.ufo_to_tr(path, workers)
 
 	# -- TR → designspace (preferred) ---
-	def tr_to_designspace(self, font, ds_path):
+	def tr_to_designspace(self, font, ds_path, workers=None, changed_only=False):
 		'''Write `font` as a .designspace + one UFO per master.
 
 		UFOs are named "<stem>-<MasterName>.ufo" next to the .designspace
@@ -877,7 +1037,16 @@ class UfoConverter(object):
 		mytypeface-Black.ufo). Each UFO holds a single default layer
 		containing that master's glyphs. Font-level groups, kerning and
 		features are written to every UFO so each remains a complete UFO.
+
+		workers: processes writing master UFOs (None or 1: serial, 0: all
+		cores); files and the .designspace do not depend on it.
+		changed_only: record content digests in every master UFO and keep
+		those whose digests match the ones recorded by the previous
+		changed_only export (see self.unchanged). Stages timed: masters,
+		designspace.
 		'''
+		timer = _StageTimer()
+		self.timings = timer.stages
 		ds_path = os.path.abspath(ds_path)
 		ds_dir  = os.path.dirname(ds_path)
 		stem    = os.path.splitext(os.path.basename(ds_path))[0]
@@ -919,12 +1088,23 @@ class UfoConverter(object):
 			ad.maximum = float(axis.maximum)
 			doc.addAxis(ad)
 
-		written_ufos = []
-		for master in masters:
-			ufo_filename = '{}-{}.ufo'.format(stem, _safe_filename(master.name))
-			ufo_path     = os.path.join(ds_dir, ufo_filename)
-			self._write_master_ufo(font, master, ufo_path)
-			written_ufos.append(ufo_filename)
+		ufo_filenames = ['{}-{}.ufo'.format(stem, _safe_filename(master.name)) for master in masters]
+		jobs = [(index, os.path.join(ds_dir, ufo_filename), changed_only) for index, ufo_filename in enumerate(ufo_filenames)]
+		workers = _pool_size(workers)
+
+		if workers > 1 and len(jobs) > 1:
+			from concurrent.futures import ProcessPoolExecutor
+
+			with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=_export_init, initargs=(font, masters, self.verbose)) as pool:
+				written = list(pool.map(_export_master_job, jobs))
+		else:
+			written = [self._write_master_ufo(font, masters[index], ufo_path, changed) for index, ufo_path, changed in jobs]
+
+		self.unchanged = [master.name for master, was_written in zip(masters, written) if not was_written]
+		timer.lap('masters')
+
+		for master, ufo_filename in zip(masters, ufo_filenames):
+			ufo_path = os.path.join(ds_dir, ufo_filename)
 
 			sd = SourceDescriptor()
 			sd.filename   = ufo_filename
@@ -945,46 +1125,35 @@ class UfoConverter(object):
 			doc.addInstance(id_)
 
 		doc.write(ds_path)
+		timer.lap('designspace')
 		return ds_path
 
-	def _write_master_ufo(self, font, master, ufo_path):
-		'''Write one UFO containing a single master's glyph layer.'''
-		# UFOWriter treats an existing folder as edit-in-place and requires
-		# a valid layercontents.plist. Wipe any pre-existing target so we
-		# always start clean.
-		if os.path.isdir(ufo_path):
-			shutil.rmtree(ufo_path)
-		writer = UFOWriter(ufo_path, formatVersion=UFOFormatVersion.FORMAT_3_0)
-
+	def _write_master_ufo(self, font, master, ufo_path, changed_only=False):
+		'''Write one UFO containing a single master's glyph layer.
+		Returns False if changed_only kept an up to date UFO, else True.
+		'''
 		# fontinfo: clone the font-level info, then specialize styleName per
 		# master. The family-level style_name ("Variable" / "MM" / etc.) is
 		# preserved in lib.plist so designspace_to_tr can restore it.
 		ufo_info = _tr_info_to_ufo(font.info, font.metrics)
 		original_style = getattr(ufo_info, 'styleName', None)
 		ufo_info.styleName = master.name
-		writer.writeInfo(ufo_info)
 
 		# Font lib: schema version stamp + family-level styleName (only on
 		# default master, where round-trips read it from).
 		font_lib = collect_font_lib(font)
 		if master.is_default and original_style and original_style != master.name:
 			font_lib[TR_LIB_KEY_FAMILY_STYLE] = original_style
-		if font_lib:
-			writer.writeLib(font_lib)
 
+		groups = kerning = None
 		if font.groups and len(font.groups.data):
-			writer.writeGroups({g.name: list(g.members) for g in font.groups.data})
+			groups = {g.name: list(g.members) for g in font.groups.data}
 
 		if font.kerning and len(font.kerning.data):
-			writer.writeKerning({(p.first, p.second): int(p.value)
-			                     for p in font.kerning.pairs})
-
-		if font.features:
-			writer.writeFeatures(font.features)
+			kerning = {(p.first, p.second): int(p.value) for p in font.kerning.pairs}
 
 		# Single default-layer glyph set; pull each glyph's `master.layer_name`
-		gs = writer.getGlyphSet(defaultLayer=True)
-
+		glyph_data = []
 		for glyph in font.glyphs:
 			tr_layer = glyph.layer(master.layer_name)
 			if tr_layer is None:
@@ -999,16 +1168,59 @@ class UfoConverter(object):
 			                       is_default_layer=True,
 			                       is_default_master=bool(master.is_default),
 			                       verbose=self.verbose)
+			glyph_data.append((name, tr_layer, data))
+
+		record = None
+
+		if changed_only:
+			record = {
+				'version': __version__,
+				'font':    _digest_of(sorted(vars(ufo_info).items()), sorted(font_lib.items()),
+				                      sorted((groups or {}).items()), sorted((kerning or {}).items()), font.features or ''),
+				'glyphs':  [[name, _glyph_export_digest(name, tr_layer, data)] for name, tr_layer, data in glyph_data],
+			}
+
+			if os.path.isdir(ufo_path) and _read_export_record(ufo_path) == record:
+				return False
+
+		# UFOWriter treats an existing folder as edit-in-place and requires
+		# a valid layercontents.plist. Wipe any pre-existing target so we
+		# always start clean.
+		if os.path.isdir(ufo_path):
+			shutil.rmtree(ufo_path)
+		writer = UFOWriter(ufo_path, formatVersion=UFOFormatVersion.FORMAT_3_0)
+		writer.writeInfo(ufo_info)
+
+		if font_lib:
+			writer.writeLib(font_lib)
+
+		if groups:
+			writer.writeGroups(groups)
+
+		if kerning:
+			writer.writeKerning(kerning)
+
+		if font.features:
+			writer.writeFeatures(font.features)
+
+		gs = writer.getGlyphSet(defaultLayer=True)
+
+		for name, tr_layer, data in glyph_data:
 			gs.writeGlyph(name, data, data.drawPoints)
 
 		gs.writeContents()
 		# The default UFO layer is the one we just wrote. ufoLib registers
 		# it under the standard "public.default" name when defaultLayer=True.
 		writer.writeLayerContents(['public.default'])
+
+		if record is not None:
+			writer.writeData(TR_DATA_EXPORT_DIGEST, json.dumps(record).encode('utf-8'))
+
 		writer.close()
+		return True
 
 	# -- designspace → TR ---------------
-	def designspace_to_tr(self, ds_path):
+	def designspace_to_tr(self, ds_path, workers=None):
 		'''Read a .designspace and assemble a TR Font.
 
 		Each source UFO contributes one TR layer per glyph — the layer
@@ -1017,7 +1229,13 @@ class UfoConverter(object):
 
 		Font-level data (info, metrics, groups, kerning, features) is
 		taken from the default master's UFO.
+
+		workers: processes reading .glif files across all sources
+		(None or 1: serial, 0: all cores). Stages timed: designspace,
+		sources, glyphs, assemble, font.
 		'''
+		timer = _StageTimer()
+		self.timings = timer.stages
 		ds_path = os.path.abspath(ds_path)
 		if not os.path.isfile(ds_path):
 			raise FileNotFoundError('No such designspace file: {}'.format(ds_path))
@@ -1069,6 +1287,10 @@ class UfoConverter(object):
 		default_reader_holder = {'reader': None, 'info': None,
 		                         'groups': {}, 'kerning': {}, 'features': ''}
 
+		tasks = []	# .glif reads, see _read_glyph_chunk
+		reads = []	# (glyph_name, tr_layer_name, is_default) per task
+		timer.lap('designspace')
+
 		for sd in sources:
 			ufo_path = _resolve(sd)
 			reader = UFOReader(ufo_path, validate=False)
@@ -1110,39 +1332,21 @@ class UfoConverter(object):
 					glyph_layers[glyph_name] = {}
 					glyph_order.append(glyph_name)
 
-				receiver = SimpleNamespace()
-				receiver.guidelines = []
-				receiver.anchors    = []
-				receiver.lib        = {}
-				receiver.unicodes   = []
-				receiver.note       = None
-				receiver.width      = 0
-				receiver.height     = 0
-
-				pen = _TrContourPen()
-				gs.readGlyph(glyph_name, glyphObject=receiver, pointPen=pen)
-
-				tr_layer = Layer(
-					name   = tr_layer_name,
-					width  = float(getattr(receiver, 'width', 0) or 0),
-					height = float(getattr(receiver, 'height', 0) or 0),
-				)
-				tr_layer.data = pen.shapes
-				for sh in pen.shapes:
-					sh.parent = tr_layer
-
-				tr_layer.anchors    = [_dict_to_anchor(a, self.verbose)
-				                       for a in (receiver.anchors or [])]
-				tr_layer.guidelines = [_dict_to_guideline(g)
-				                       for g in (receiver.guidelines or [])]
-
-				glyph_layers[glyph_name][tr_layer_name] = tr_layer
-
-				if is_default:
-					glyph_extras[glyph_name] = receiver
+				tasks.append((ufo_path, ufo_layer_name, tr_layer_name, glyph_name, is_default, self.verbose))
+				reads.append((glyph_name, tr_layer_name, is_default))
 
 			reader.close()
 
+		timer.lap('sources')
+		loaded = _read_glyphs(tasks, workers)
+		timer.lap('glyphs')
+
+		for (glyph_name, tr_layer_name, is_default), (tr_layer, receiver) in zip(reads, loaded):
+			glyph_layers[glyph_name][tr_layer_name] = tr_layer
+
+			if is_default:
+				glyph_extras[glyph_name] = receiver
+
 		# Glyph order: prefer `public.glyphOrder` from the default UFO's lib
 		# (the UFO 3 canonical place); fall back to glyphset iteration order
 		# (which is alphabetical / contents.plist order and lossy on roundtrip).
@@ -1199,6 +1403,8 @@ class UfoConverter(object):
 
 			glyphs.append(glyph)
 
+		timer.lap('assemble')
+
 		# Font-level data from the default master
 		info_ns = default_reader_holder['info'] or SimpleNamespace()
 		tr_info, tr_metrics = _ufo_info_to_tr(info_ns)
@@ -1209,12 +1415,10 @@ class UfoConverter(object):
 			tr_info.style_name = family_style
 
 		groups = Groups()
-		for name, members in (default_reader_holder['groups'] or {}).items():
-			groups.set(name, list(members))
+		groups.update_from((default_reader_holder['groups'] or {}).items())
 
 		kerning = Kerning()
-		for (first, second), value in (default_reader_holder['kerning'] or {}).items():
-			kerning.add_pair(first, second, int(value))
+		kerning.update_from((default_reader_holder['kerning'] or {}).items())
 
 		font = Font(
 			glyphs,
@@ -1229,6 +1433,7 @@ class UfoConverter(object):
 			encoding  = Encoding(),
 		)
 
+		timer.lap('font')
 		return font
 
 	# -- TR → single UFO (single-master shortcut) -----
@@ -1362,7 +1567,15 @@ class UfoConverter(object):
 		return ds_path
 
 	# -- single UFO → TR ---------------
-	def ufo_to_tr(self, ufo_path):
+	def ufo_to_tr(self, ufo_path, workers=None):
+		'''Read a single (multi-layer) UFO and its sibling .designspace.
+
+		workers: processes reading .glif files across all layers
+		(None or 1: serial, 0: all cores). Stages timed: info, layers,
+		glyphs, assemble, designspace.
+		'''
+		timer = _StageTimer()
+		self.timings = timer.stages
 		ufo_path = os.path.abspath(ufo_path)
 
 		if not os.path.isdir(ufo_path):
@@ -1387,12 +1600,10 @@ class UfoConverter(object):
 		font_lib     = reader.readLib()      or {}
 
 		groups = Groups()
-		for name, members in groups_dict.items():
-			groups.set(name, list(members))
+		groups.update_from(groups_dict.items())
 
 		kerning = Kerning()
-		for (first, second), value in kerning_dict.items():
-			kerning.add_pair(first, second, int(value))
+		kerning.update_from(kerning_dict.items())
 
 		# Layers
 		layer_names    = list(reader.getLayerNames())
@@ -1411,6 +1622,9 @@ class UfoConverter(object):
 		glyph_data = {}
 		glyph_order = list(explicit_glyph_order)
 		seen_in_order = set(glyph_order)
+		tasks = []	# .glif reads, see _read_glyph_chunk
+		reads = []	# (glyph_name, layer_name, is_default) per task
+		timer.lap('info')
 
 		for layer_name in ordered_layers:
 			gs = reader.getGlyphSet(layerName=layer_name)
@@ -1423,37 +1637,20 @@ class UfoConverter(object):
 						glyph_order.append(glyph_name)
 						seen_in_order.add(glyph_name)
 
-				receiver = SimpleNamespace()
-				receiver.guidelines = []
-				receiver.anchors    = []
-				receiver.lib        = {}
-				receiver.unicodes   = []
-				receiver.note       = None
-				receiver.width      = 0
-				receiver.height     = 0
-
-				pen = _TrContourPen()
-				gs.readGlyph(glyph_name, glyphObject=receiver, pointPen=pen)
-
-				tr_layer = Layer(
-					name   = layer_name,
-					width  = float(getattr(receiver, 'width', 0) or 0),
-					height = float(getattr(receiver, 'height', 0) or 0),
-				)
-				tr_layer.data       = pen.shapes
-				for sh in pen.shapes:
-					sh.parent = tr_layer
-
-				tr_layer.anchors    = [_dict_to_anchor(a, self.verbose)
-				                       for a in (getattr(receiver, 'anchors', []) or [])]
-				tr_layer.guidelines = [_dict_to_guideline(g)
-				                       for g in (getattr(receiver, 'guidelines', []) or [])]
-
-				glyph_data[glyph_name][layer_name] = {
-					'layer':    tr_layer,
-					'receiver': receiver,
-					'default':  is_default,
-				}
+				# Only the default layer's glyph-level data is used
+				tasks.append((ufo_path, layer_name, layer_name, glyph_name, is_default, self.verbose))
+				reads.append((glyph_name, layer_name, is_default))
+
+		timer.lap('layers')
+		loaded = _read_glyphs(tasks, workers)
+		timer.lap('glyphs')
+
+		for (glyph_name, layer_name, is_default), (tr_layer, receiver) in zip(reads, loaded):
+			glyph_data[glyph_name][layer_name] = {
+				'layer':    tr_layer,
+				'receiver': receiver,
+				'default':  is_default,
+			}
 
 		# Also collect default-layer glyphs from other layers if not yet seen
 		# (some UFOs are sparse — non-default layers may have glyphs missing
@@ -1508,6 +1705,8 @@ class UfoConverter(object):
 
 			glyphs.append(glyph)
 
+		timer.lap('assemble')
+
 		# Read designspace sidecar (axes / masters / instances)
 		ds_path = _designspace_path_for(ufo_path)
 		axes      = []
@@ -1559,4 +1758,5 @@ class UfoConverter(object):
 		)
 
 		reader.close()
+		timer.lap('designspace')
 		return font
@@ -21,9 +21,10 @@ Each class defines its XML schema using class attributes:
 from xml.etree import ElementTree as ET
 
 # - Init --------------------------------
-__version__ = '0.6.0'
+__version__ = '0.8.0'
 
 _SENTINEL = object()  # Unique sentinel for XML_ATTR_DEFAULTS miss
+_XML_STATE_ATOMS = (str, int, float)  # Immutable values kept as-is by _xml_state
 
 # - Helpers -----------------------------
 def _format_float(v):
@@ -105,9 +106,11 @@ class XMLSerializable:
 			if value is not None:
 				lib_data[attr_name] = value
 		
-		# Include custom lib data if object has it
-		if hasattr(self, 'lib') and self.lib:
-			for key, value in self.lib.items():
+		# Include custom lib data if object has it (lazy libs are not materialized)
+		custom_lib = getattr(self, '_lib', None) if hasattr(self, '_lib') else getattr(self, 'lib', None)
+
+		if custom_lib:
+			for key, value in custom_lib.items():
 				if key not in lib_data:  # Don't override extracted attrs
 					lib_data[key] = value
 		
@@ -116,7 +119,50 @@ class XMLSerializable:
 			elem.append(lib_elem)
 		
 		return elem
-	
+
+	def _xml_state(self):
+		'''Snapshot of what to_XML would write, as a hashable tuple
+		(internal use). Equal snapshots mean an unchanged object, so it
+		can stand in for hashing the XML itself; the children part is
+		taken from _xml_children_state.
+		'''
+		state = [self.XML_TAG]
+
+		for attr_name in self.XML_ATTRS + self.XML_LIB_ATTRS + list(self.XML_TEXT_CHILDREN.values()):
+			value = getattr(self, attr_name, None)
+
+			# - Keep plain values, copy sequences (lists, matrices), freeze
+			# - everything else by its XML text
+			if value is None or isinstance(value, _XML_STATE_ATOMS):
+				state.append(value)
+			elif hasattr(value, '__getitem__') and hasattr(value, '__len__') and not isinstance(value, dict):
+				state.append(tuple(value))
+			else:
+				state.append(_format_xml_attr(value))
+
+		custom_lib = getattr(self, '_lib', None) if hasattr(self, '_lib') else getattr(self, 'lib', None)
+		state.append(repr(custom_lib) if custom_lib else None)
+		state.append(self._xml_children_state())
+		return tuple(state)
+
+	def _xml_children_state(self):
+		'''Children part of _xml_state. Subclasses that track their own
+		modifications can return a cheaper token here.'''
+		state = []
+
+		for attr_name in self.XML_CHILDREN.values():
+			children = getattr(self, attr_name, None)
+
+			if children:
+				if not isinstance(children, (list, tuple)):
+					children = [children]
+
+				state.append(tuple([child._xml_state() for child in children if hasattr(child, '_xml_state')]))
+			else:
+				state.append(None)
+
+		return tuple(state)
+
 	@classmethod
 	def from_XML(cls, element):
 		'''Parse object from XML element or string'''
@@ -131,15 +177,16 @@ class XMLSerializable:
 				# Type conversion - _convert_xml_attr handles Transform matrix() strings
 				attrs[attr_name] = _convert_xml_attr(value)
 		
-		# Parse child elements
+		# Parse child elements - one pass over the element, bucketed by tag
+		children, lib_elem = _xml_children(element, cls.XML_CHILDREN)
+
 		for child_tag, attr_name in cls.XML_CHILDREN.items():
-			child_elements = element.findall(child_tag)
+			child_elements = children[child_tag]
 			if child_elements:
 				# Find the class that handles this tag
 				child_class = _find_class_for_tag(child_tag)
 				if child_class:
-					children = [child_class.from_XML(elem) for elem in child_elements]
-					attrs[attr_name] = children
+					attrs[attr_name] = [child_class.from_XML(elem) for elem in child_elements]
 
 		# Parse text-content child elements
 		for child_tag, attr_name in cls.XML_TEXT_CHILDREN.items():
@@ -148,7 +195,6 @@ class XMLSerializable:
 				attrs[attr_name] = text_elem.text
 		
 		# Parse lib section
-		lib_elem = element.find('lib')
 		if lib_elem is not None:
 			dict_elem = lib_elem.find('dict')
 			if dict_elem is not None:
@@ -222,6 +268,49 @@ def _convert_xml_attr(value):
 	# Return as string
 	return value
 
+# Fast-path conversion helpers: same results as _convert_xml_attr, cheaper
+# for the attributes that dominate glyph files (coordinates, node types).
+_TOKEN_CACHE = {}
+
+def _convert_xml_number(value):
+	'''_convert_xml_attr for attributes that are nearly always numbers.
+	Plain int/float literals are parsed directly; anything else takes
+	the generic conversion.'''
+	try:
+		return float(value) if '.' in value else int(value)
+	except ValueError:
+		return _convert_xml_attr(value)
+
+def _convert_xml_token(value):
+	'''_convert_xml_attr memoized, for attributes drawn from a small set
+	of values (type, smooth, closed, kind). Mutable results are not cached.'''
+	try:
+		return _TOKEN_CACHE[value]
+	except KeyError:
+		result = _convert_xml_attr(value)
+
+		if isinstance(result, (bool, int, float, str)) and len(_TOKEN_CACHE) < 1024:
+			_TOKEN_CACHE[value] = result
+
+		return result
+
+def _xml_children(element, tags):
+	'''Split the children of element in one pass.
+	Returns ({tag: [child, ...]} for each of tags, first <lib> child or None).'''
+	children = dict((tag, []) for tag in tags)
+	lib_elem = None
+
+	for child in element:
+		bucket = children.get(child.tag)
+
+		if bucket is not None:
+			bucket.append(child)
+
+		elif child.tag == 'lib' and lib_elem is None:
+			lib_elem = child
+
+	return children, lib_elem
+
 def _format_xml_attr(value):
 	'''Format Python value as XML attribute string. Returns None to skip.'''
 	# Guard against str/bytes — both have __len__ and __getitem__
@@ -10,9 +10,10 @@
 
 # - Dependencies ------------------------
 import math
+from bisect import bisect_right
 
 # - Init --------------------------------
-__version__ = '0.27.0'
+__version__ = '0.29.0'
 
 # - Functions ---------------------------
 # -- Point ------------------------------
@@ -71,6 +72,73 @@ def point_in_polygon(point, polygon):
 
 	return point_inside
 
+def polygon_edge_table(polygons, bands=None):
+	'''Edge table of closed polygons for repeated point in polygon tests.
+	Non horizontal edges are bucketed into horizontal bands, so a query
+	only visits the edges of its own band.
+	Args:
+		polygons -> list(list(tuple(x, y))): closing edges are implied;
+		bands -> int: number of bands, default ~2*sqrt(edges)
+
+	Returns:
+		tuple(y_min, band_height, buckets), buckets -> list(list(edge))
+	'''
+	edges = []
+
+	for polygon in polygons:
+		if not polygon:
+			continue
+
+		p1x, p1y = polygon[-1]
+
+		for p2x, p2y in polygon:
+			if p1y != p2y:
+				edges.append((min(p1y, p2y), max(p1y, p2y), p1x, p1y, p2x - p1x, p2y - p1y))
+
+			p1x, p1y = p2x, p2y
+
+	if not edges:
+		return (0., 0., [])
+
+	y_min = min(edge[0] for edge in edges)
+	y_max = max(edge[1] for edge in edges)
+	bands = bands or max(1, int(2 * math.sqrt(len(edges))))
+	height = (y_max - y_min) / bands or 1.
+	buckets = [[] for _ in range(bands)]
+
+	for edge in edges:
+		first = min(int((edge[0] - y_min) / height), bands - 1)
+		last = min(int((edge[1] - y_min) / height), bands - 1)
+
+		for band in range(first, last + 1):
+			buckets[band].append(edge)
+
+	return (y_min, height, buckets)
+
+def point_in_edge_table(point, table):
+	'''Even-odd point in polygon test against a polygon_edge_table.
+	Same half-open crossing rule as point_in_polygon.
+	Args: 
+		point -> tuple(x, y); 
+		table -> polygon_edge_table result
+	
+	Returns:
+		Bool
+	'''
+	x, y = point
+	y_min, height, buckets = table
+
+	if not buckets or y <= y_min:
+		return False
+
+	point_inside = False
+
+	for e_min, e_max, p1x, p1y, dx, dy in buckets[min(int((y - y_min) // height), len(buckets) - 1)]:
+		if e_min < y <= e_max and x <= (y - p1y) * dx / dy + p1x:
+			point_inside = not point_inside
+
+	return point_inside
+
 def point_rotate(center, point, angle, inDegrees=True):
 	'''Rotate point around center point with angle (in degrees)
 	Args: 
@@ -249,6 +317,112 @@ def poly_area(vertices):
 	'''
 	return abs(poly_area_signed(vertices))
 
+# - Arc length --------------------------------------
+# 5-point Gauss-Legendre nodes and weights on [-1, 1]
+_GL5_T = (0., -.5384693101056831, .5384693101056831, -.9061798459386640, .9061798459386640)
+_GL5_C = (.5688888888888889, .4786286704993665, .4786286704993665, .2369268850561891, .2369268850561891)
+
+def arc_length_quad(speed, t0, t1):
+	'''Arc length between t0 and t1 of a curve with the given speed
+	function |C'(t)|, by 5-point Gauss-Legendre quadrature.
+	'''
+	c = (t1 - t0) * 0.5
+	m = (t1 + t0) * 0.5
+	return c * sum(w * speed(c * x + m) for x, w in zip(_GL5_T, _GL5_C))
+
+def arc_length_table(speed, tolerance=1e-6, max_depth=12, start_parts=4):
+	'''Cumulative arc length table of a curve over t in [0, 1].
+	Intervals are halved while the quadrature of an interval and the sum
+	over its halves differ by more than tolerance, so the breakpoints
+	crowd where the speed changes fast (tight turns, cusps).
+
+	Args:
+		speed (callable): t -> |C'(t)|
+		tolerance (float): allowed length error per interval
+		max_depth (int): subdivision limit below the starting intervals
+		start_parts (int): number of starting intervals
+
+	Returns:
+		tuple(list, list): parameters ts and lengths, both ascending,
+		ts[0] = lengths[0] = 0., ts[-1] = 1., lengths[-1] = total length
+	'''
+	ts, lengths = [0.], [0.]
+	total = 0.
+	step = 1. / start_parts
+	stack = [(1. - i * step - step, 1. - i * step, None, 0) for i in range(start_parts)]
+
+	while stack:
+		t0, t1, whole, depth = stack.pop()
+
+		if whole is None:
+			whole = arc_length_quad(speed, t0, t1)
+
+		tm = (t0 + t1) * 0.5
+		left = arc_length_quad(speed, t0, tm)
+		right = arc_length_quad(speed, tm, t1)
+
+		if depth < max_depth and abs(left + right - whole) > tolerance:
+			stack.append((tm, t1, right, depth + 1))
+			stack.append((t0, tm, left, depth + 1))
+		else:
+			total += left
+			ts.append(tm)
+			lengths.append(total)
+			total += right
+			ts.append(t1)
+			lengths.append(total)
+
+	ts[-1] = 1.
+	return ts, lengths
+
+def arc_length_solve(table, speed, length, lo=1, tolerance=1e-9, max_iterations=8):
+	'''Parameter t at which the arc length from t = 0 equals length.
+	Binary search of the table brackets the answer, linear interpolation
+	inside the bracket gives the start and Newton steps polish it.
+
+	Args:
+		table (tuple): (ts, lengths) as built by arc_length_table
+		speed (callable): t -> |C'(t)| used to build the table
+		length (float): target arc length, clamped to the curve
+		lo (int): lowest table index to search from; pass the previous
+			result index when solving ascending lengths
+		tolerance (float): length error to stop at
+		max_iterations (int): Newton steps limit
+
+	Returns:
+		tuple(float, int): t and the table index of its bracket
+	'''
+	ts, lengths = table
+
+	if length <= 0.:
+		return 0., 1
+
+	if length >= lengths[-1]:
+		return 1., len(ts) - 1
+
+	i = bisect_right(lengths, length, max(lo, 1), len(lengths) - 1)
+	t_lo, t_hi = ts[i - 1], ts[i]
+	base, span = lengths[i - 1], lengths[i] - lengths[i - 1]
+	t = t_lo + (t_hi - t_lo) * (length - base) / span if span > 0. else t_lo
+
+	for _ in range(max_iterations):
+		err = base + arc_length_quad(speed, ts[i - 1], t) - length
+
+		if abs(err) <= tolerance:
+			break
+
+		if err > 0.:
+			t_hi = t
+		else:
+			t_lo = t
+
+		deriv = speed(t)
+		t_new = t - err / deriv if deriv > 1e-12 else t_lo - 1.
+
+		t = t_new if t_lo < t_new < t_hi else (t_lo + t_hi) * 0.5
+
+	return t, i
+
 if __name__ == '__main__':
 	A = (0,0); B = (0,200); C = (200,200); D = (200,0)
 	print(get_angle(10, 35, degrees=True))
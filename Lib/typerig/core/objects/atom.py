@@ -10,12 +10,19 @@
 # that you use it at your own risk!
 
 # - Dependencies ------------------------
-import copy, uuid
+import copy, uuid, itertools
+from collections.abc import MutableSequence
 
 from typerig.core.objects.collection import CustomList
 
 # - Init -------------------------------
-__version__ = '0.6.0'
+__version__ = '0.10.0'
+
+# Modification stamps: one process wide counter, so a stamp is never
+# handed out twice - not to another object, nor after another edit.
+# Geometry containers (Contour) take a new stamp on every edit; parents
+# aggregate the stamps of their children (see Contour.version).
+_next_stamp = itertools.count(1).__next__
 
 # - Objects ----------------------------
 class Atom(object):
@@ -57,35 +64,79 @@ class Navigable(object):
 	
 	@property
 	def next(self):
+		idx = self.idx
+
 		try:
-			return self.parent[self.idx + 1]
+			return self.parent[idx + 1]
 		
 		except (IndexError, AttributeError):
-			if self.idx == len(self.parent) - 1:
+			if idx == len(self.parent) - 1:
 				return self.parent[0]
 
 			return None
 	
 	@property
 	def prev(self):
+		idx = self.idx
+
 		try:
-			return self.parent[self.idx - 1]
+			return self.parent[idx - 1]
 		
 		except (IndexError, AttributeError):
-			if self.idx == 0:
+			if idx == 0:
 				return self.parent[-1]
 
 			return None
 
-class Member(Navigable, Atom):
+class Identified(object):
+	'''Mixin: uid and lib allocated on first access - most members never use them.
+	Requires _uid and _lib slots set to None (or a value) by the inheriting class.'''
+	__slots__ = ()
+
+	@property
+	def uid(self):
+		if self._uid is None:
+			self._uid = uuid.uuid4()
+
+		return self._uid
+
+	@uid.setter
+	def uid(self, other):
+		self._uid = other
+
+	@property
+	def lib(self):
+		if self._lib is None:
+			self._lib = {}
+
+		return self._lib
+
+	@lib.setter
+	def lib(self, other):
+		self._lib = other
+
+	def __setstate__(self, state):
+		# - Default (dict, slots) state of copy / pickle. A copy is a new
+		# - member: it draws a uid of its own on first access, whether or
+		# - not the original had read its uid before.
+		state, slots = state if isinstance(state, tuple) else (state, None)
+
+		for values in (state, slots):
+			if values:
+				for name, value in values.items():
+					setattr(self, name, value)
+
+		self._uid = None
+
+class Member(Identified, Navigable, Atom):
 	''' A primitive that is a member of a sequence. '''
-	__slots__ = ('uid', 'identifier', 'parent', 'lib')
+	__slots__ = ('_uid', 'identifier', 'parent', '_lib')
 
 	def __init__(self, *args, **kwargs):
-		self.uid = uuid.uuid4()
+		self._uid = None
 		self.parent = kwargs.pop('parent', None)
 		self.identifier = kwargs.get('identifier', None)
-		self.lib = kwargs.get('lib', {})
+		self._lib = kwargs.get('lib', None)
 
 	# - Internals -----------------------
 	def __hash__(self):
@@ -95,24 +146,25 @@ class Member(Navigable, Atom):
 	def clone(self):
 		return copy.deepcopy(self)
 
-class Container(CustomList, Navigable, Atom):
+class Container(CustomList, Identified, Navigable, Atom):
 	''' A primitive that is a member of a sequence and sequence of its own. '''
-	__slots__ = ('data', 'uid', 'identifier', 'parent', 'lib', '_lock', '_subclass')
+	__slots__ = ('data', '_uid', 'identifier', 'parent', '_lib', '_lock', '_subclass', '_index_cache')
 
 	def __init__(self, data=None, **kwargs):
 		super(Container, self).__init__(data, **kwargs)
 
 		# - Init
-		self.uid = uuid.uuid4()
+		self._index_cache = None
+		self._uid = None
 		self.parent = kwargs.pop('parent', None)
-		self.lib = kwargs.get('lib', {})
+		self._lib = kwargs.get('lib', None)
 		self._lock = kwargs.pop('locked', False)
 		self._subclass = kwargs.pop('default_factory', self.__class__)
 
 		# - Process data
 		if len(self.data):
-			for idx in range(len(self.data)):
-				self.data[idx] = self._coerce(self.data[idx])
+			coerce = self._coerce
+			self.data[:] = [coerce(item) for item in self.data]
 				
 	# - Internals ----------------------
 	def __hash__(self):
@@ -130,6 +182,11 @@ class Container(CustomList, Navigable, Atom):
 			item = self._subclass(item, parent=self)
 
 		self.data[i] = item
+		self._index_cache = None
+
+	def __delitem__(self, i):
+		del self.data[i]
+		self._index_cache = None
 
 	def __repr__(self):
 		return '<{}: {}>'.format(self.__class__.__name__, repr(self.data))
@@ -155,13 +212,43 @@ class Container(CustomList, Navigable, Atom):
 			value = getattr(child, attr, None)
 
 			if value is not None:
-				if isinstance(value, (list, tuple)):
+				if isinstance(value, (list, tuple)) or (isinstance(value, MutableSequence) and not isinstance(value, Container)):
 					result += list(value)
 				else:
 					result.append(value)
 
 		return result
 
+	def index(self, item, *args):
+		'''Position of item in the container. Identity lookups are served
+		from a lazily built position map, so Navigable.idx/next/prev are O(1)
+		on unchanged containers. Every hit is verified against the data list,
+		thus direct edits of .data can only cost a rebuild, never a wrong index.
+		'''
+		data = self.data
+
+		if not args:
+			cache = self._index_cache
+
+			if cache is not None and cache[0] is data:
+				idx = cache[1].get(id(item))
+
+				if idx is not None and idx < len(data) and data[idx] is item:
+					return idx
+
+			positions = {}
+
+			for idx, member in enumerate(data):
+				positions.setdefault(id(member), idx)
+
+			self._index_cache = (data, positions)
+			idx = positions.get(id(item))
+
+			if idx is not None:
+				return idx
+
+		return data.index(item, *args)
+
 	@classmethod
 	def as_proxy(cls, data=None, **kwargs):
 		'''Create a lightweight proxy instance (skips metadata init).'''
@@ -171,6 +258,7 @@ class Container(CustomList, Navigable, Atom):
 	def insert(self, i, item):
 		if not self._lock:
 			self.data.insert(i, self._coerce(item))
+			self._index_cache = None
 
 	def pop(self, i=-1): 
 		if not self._lock:
@@ -179,13 +267,33 @@ class Container(CustomList, Navigable, Atom):
 			if isinstance(item, self._subclass):
 				item.parent = None
 
+			self._index_cache = None
 			return self.data.pop(i)
 
 		return None
 
 	def append(self, item):
 		if not self._lock:
-			self.data.append(self._coerce(item))
+			item = self._coerce(item)
+			self.data.append(item)
+
+			# - Appending never moves existing members: patch the position map
+			cache = self._index_cache
+
+			if cache is not None and cache[0] is self.data:
+				cache[1].setdefault(id(item), len(self.data) - 1)
+
+	def remove(self, item):
+		self.data.remove(item)
+		self._index_cache = None
+
+	def reverse(self):
+		self.data.reverse()
+		self._index_cache = None
+
+	def sort(self, *args, **kwargs):
+		self.data.sort(*args, **kwargs)
+		self._index_cache = None
 
 	# - Functions ----------------------
 	def clone(self):
@@ -0,0 +1,341 @@
+# MODULE: TypeRig / Core / Objects — micro benchmarks
+# -----------------------------------------------------------
+# (C) Vassil Kateliev, 2026 		(http://www.kateliev.com)
+# (C) Karandash Type Foundry 		(http://www.karandash.eu)
+#------------------------------------------------------------
+# www.typerig.com
+
+# Flat, dependency-free timing suite for core objects.
+# Run with: python bench_objects.py [section ...] [path/to/font.trfont]
+# Prints one timing table per section; nothing is asserted.
+# Scaling is what matters: per-item cost should stay flat as N grows.
+# Sections that load fonts use the given .trfont, else a synthetic one.
+
+# - Dependencies ------------------------
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+# - Init -------------------------------
+__version__ = '0.3.0'
+
+# - Path bootstrap (repo checkout without install) ---
+# objects/array.py shadows the stdlib array module when run from this folder
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [path for path in sys.path if os.path.abspath(path or os.curdir) != _HERE]
+
+try:
+	import typerig.core
+except ImportError:
+	_LIB_DIR = os.path.abspath(os.path.join(_HERE, '..', '..', '..'))
+	sys.path.insert(0, _LIB_DIR)
+
+from typerig.core.objects.node import Node
+from typerig.core.objects.contour import Contour
+from typerig.core.objects.shape import Shape
+from typerig.core.objects.layer import Layer
+from typerig.core.objects.glyph import Glyph
+from typerig.core.objects.packedcontour import pack_contours
+
+# - Harness ----------------------------
+sections = []
+font_path = None
+
+def section(func):
+	sections.append(func)
+	return func
+
+def timed(func, repeat=3):
+	'''Best wall time of func() over repeat runs, seconds.'''
+	best = None
+
+	for _ in range(repeat):
+		start = time.perf_counter()
+		func()
+		elapsed = time.perf_counter() - start
+		best = elapsed if best is None else min(best, elapsed)
+
+	return best
+
+def report(title, rows, unit='item'):
+	print()
+	print('- {} '.format(title).ljust(60, '-'))
+	print('{:>10} {:>14} {:>16}'.format('N', 'total ms', 'us/' + unit))
+
+	for n, seconds in rows:
+		print('{:>10} {:>14.2f} {:>16.3f}'.format(n, seconds * 1e3, seconds * 1e6 / max(n, 1)))
+
+def make_contour(num_on):
+	'''Closed contour of num_on cubic segments (3 nodes per segment).'''
+	nodes = []
+
+	for i in range(num_on):
+		x = float(i * 30)
+		nodes.append(Node(x, 0., type='on'))
+		nodes.append(Node(x + 10., 20., type='curve'))
+		nodes.append(Node(x + 20., 20., type='curve'))
+
+	return Contour(nodes, closed=True)
+
+def make_glyph_xml(index, masters=2, contours=4, num_on=24):
+	'''Synthetic CJK-like glyph: several closed cubic contours per master.'''
+	layers = []
+
+	for m in range(masters):
+		shapes = [Shape([make_contour(num_on)]) for _ in range(contours)]
+		layers.append(Layer(shapes, name='Master {}'.format(m), width=1000.))
+
+	return Glyph(layers, name='uni{:04X}'.format(0x4E00 + index)).to_XML()
+
+def glyph_sources(count=200):
+	'''XML strings of the benchmark font: the .trfont given on the
+	command line, else count synthetic glyphs.
+	'''
+	if font_path is None:
+		return [make_glyph_xml(i) for i in range(count)]
+
+	from typerig.core.fileio.trfont import GlyphManifest, FILE_GLYPHS
+	manifest = GlyphManifest.read(os.path.join(font_path, FILE_GLYPHS))
+	sources = []
+
+	for entry in manifest.entries:
+		glyph_file = manifest.resolve_path(entry, font_path)
+
+		if glyph_file is not None:
+			with open(glyph_file, 'r', encoding='utf-8') as fh:
+				sources.append(fh.read())
+
+	return sources
+
+def measured(func):
+	'''(result, seconds, bytes still held) of func(). Time and memory
+	come from separate runs - tracing allocations distorts timings.
+	'''
+	seconds = timed(func, 1)
+	gc.collect()
+	tracemalloc.start()
+	result = func()
+	gc.collect()
+	held = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	return result, seconds, held
+
+def report_variants(title, rows):
+	print()
+	print('- {} '.format(title).ljust(60, '-'))
+	print('{:<28} {:>12} {:>12}'.format('', 'ms', 'MiB'))
+
+	for label, seconds, held in rows:
+		print('{:<28} {:>12.1f} {:>12}'.format(label, seconds * 1e3, '' if held is None else '{:.2f}'.format(held / 2.**20)))
+
+# - Sections ---------------------------
+@section
+def navigation():
+	rows = []
+
+	for num_on in (100, 200, 400, 800, 1600):
+		contour = make_contour(num_on)
+
+		def walk():
+			for node in contour.nodes:
+				node.triad
+				if node.is_on:
+					node.triad_on
+
+		rows.append((len(contour), timed(walk)))
+
+	report('Node navigation (idx / next / prev / triad_on)', rows, 'node')
+
+@section
+def construction():
+	# - 'eager' touches uid, lib, transform and weight right after building,
+	# - which is what every Node and Member paid upfront before they went lazy
+	def materialize(nodes):
+		for node in nodes:
+			node.uid, node.lib, node.transform, node.weight
+
+		return nodes
+
+	def build_nodes(count):
+		return [Node(float(i), 0., type='on') for i in range(count)]
+
+	def build_contours(count):
+		return [make_contour(24) for _ in range(count)]
+
+	def contour_nodes(contours):
+		return [node for contour in contours for node in contour.nodes]
+
+	def glyph_nodes(glyphs):
+		return [node for glyph in glyphs for layer in glyph.layers for node in layer.nodes]
+
+	sources = glyph_sources()
+	rows = []
+
+	for label, build, nodes_of in (
+		('Node x 100k', lambda: build_nodes(100000), lambda result: result),
+		('Contour x 2k', lambda: build_contours(2000), contour_nodes),
+		('Glyph.from_XML x {}'.format(len(sources)), lambda: [Glyph.from_XML(xml) for xml in sources], glyph_nodes),
+		):
+		for mode, func in (('lazy', build), ('eager', lambda: materialize(nodes_of(build())))):
+			result, seconds, held = measured(func)
+			del result
+			rows.append(('{} {}'.format(mode, label), seconds, held))
+
+	report_variants('Construction: lazy vs eager uid/lib/transform/weight', rows)
+
+@section
+def encoding():
+	from typerig.core.objects.encoding import Encoding
+
+	rows = []
+
+	for count in (1024, 4096, 16384, 65536):
+		names = ['uni{:04X}'.format(cp) for cp in range(count)]
+
+		def build():
+			enc = Encoding()
+
+			for cp, name in enumerate(names):
+				enc.set(name, cp)
+
+			return enc
+
+		enc = build()
+
+		def lookup():
+			# - Per-glyph queries as in TrFontIO.read, then a cmap pass
+			for name in names:
+				enc.unicodes(name)
+
+			for cp in range(count):
+				enc.glyph(cp)
+
+		rows.append((count, timed(build, 1), timed(lookup, 1)))
+
+	print()
+	print('- {} '.format('Encoding: set / unicodes + glyph').ljust(60, '-'))
+	print('{:>10} {:>14} {:>16}'.format('N', 'set us/entry', 'lookup us/entry'))
+
+	for count, t_build, t_lookup in rows:
+		print('{:>10} {:>14.3f} {:>16.3f}'.format(count, t_build * 1e6 / count, t_lookup * 1e6 / count))
+
+@section
+def packed():
+	sources = glyph_sources()
+	plain, t_plain, m_plain = measured(lambda: [Glyph.from_XML(xml) for xml in sources])
+	del plain
+
+	def load_packed():
+		glyphs = [Glyph.from_XML(xml) for xml in sources]
+
+		for glyph in glyphs:
+			pack_contours(glyph)
+
+		return glyphs
+
+	glyphs_packed, t_packed, m_packed = measured(load_packed)
+	glyphs_plain = [Glyph.from_XML(xml) for xml in sources]
+
+	def read_geometry(glyphs):
+		for glyph in glyphs:
+			for layer in glyph.layers:
+				for contour in layer.contours:
+					contour.bounds
+					contour.segments
+
+	def write_xml(glyphs):
+		for glyph in glyphs:
+			glyph.to_XML()
+
+	report_variants('Packed contours ({} glyphs)'.format(len(sources)), [
+		('load  Contour', t_plain, m_plain),
+		('load  PackedContour', t_packed, m_packed),
+		('bounds+segments plain', timed(lambda: read_geometry(glyphs_plain), 1), None),
+		('bounds+segments packed', timed(lambda: read_geometry(glyphs_packed), 1), None),
+		('to_XML plain', timed(lambda: write_xml(glyphs_plain), 1), None),
+		('to_XML packed', timed(lambda: write_xml(glyphs_packed), 1), None),
+		])
+
+@section
+def node_access():
+	# - Node x / y are properties: writes mark the parent contour changed
+	# - (Contour.version). 'slot' is a plain slotted object for reference.
+	class Slotted(object):
+		__slots__ = ('x', 'y')
+
+		def __init__(self, x, y):
+			self.x, self.y = x, y
+
+	attached = make_contour(67).nodes[:200]
+	detached = [Node(node.x, node.y) for node in attached]
+	plain = [Slotted(node.x, node.y) for node in attached]
+	rounds = 4000
+
+	def write(nodes):
+		def run():
+			for _ in range(rounds):
+				for node in nodes:
+					node.x = 1.
+
+		return run
+
+	def read(nodes):
+		def run():
+			for _ in range(rounds):
+				for node in nodes:
+					node.x
+
+		return run
+
+	count = rounds * len(attached)
+	rows = []
+
+	for label, nodes in (('slot', plain), ('Node detached', detached), ('Node in contour', attached)):
+		rows.append(('write ' + label, timed(write(nodes)), None))
+		rows.append(('read  ' + label, timed(read(nodes)), None))
+
+	report_variants('Node x access, {} sets / gets'.format(count), rows)
+
+@section
+def trfont_write():
+	# - Full save into an empty folder, serial vs process pool. Workers get
+	# - detached glyph pickles; MiB is the payload sent to them.
+	import shutil
+	import tempfile
+	from typerig.core.objects.font import Font
+	from typerig.core.fileio.trfont import TrFontIO, _detach
+
+	font = Font([Glyph.from_XML(xml) for xml in glyph_sources()])
+	temp_dir = tempfile.mkdtemp()
+	payload = sum(len(_detach(glyph)) for glyph in font)
+
+	def write(workers):
+		def run():
+			path = os.path.join(temp_dir, 'bench.trfont')
+			shutil.rmtree(path, ignore_errors=True)
+			TrFontIO.write(font, path, workers=workers)
+
+		return run
+
+	try:
+		rows = [('write serial', timed(write(None), 1), None)]
+
+		for workers in sorted(set([2, os.cpu_count() or 1]) - set([1])):
+			rows.append(('write workers={}'.format(workers), timed(write(workers), 1), payload))
+
+	finally:
+		shutil.rmtree(temp_dir, ignore_errors=True)
+
+	report_variants('TrFontIO.write ({} glyphs, {} cores)'.format(len(font), os.cpu_count()), rows)
+
+# - Run --------------------------------
+if __name__ == '__main__':
+	wanted = set(arg for arg in sys.argv[1:] if not arg.endswith('.trfont'))
+	fonts = [arg for arg in sys.argv[1:] if arg.endswith('.trfont')]
+	font_path = fonts[0] if fonts else None
+
+	for func in sections:
+		if not wanted or func.__name__ in wanted:
+			func()
@@ -10,6 +10,8 @@
 
 # - Dependencies ------------------------
 from collections import namedtuple
+from operator import attrgetter
+import copy
 import math
 
 from typerig.core.objects.point import Point
@@ -25,19 +27,46 @@ from typerig.core.fileio.xmlio import XMLSerializable, register_xml_class
 
 from typerig.core.func.utils import isMultiInstance
 from typerig.core.func.transform import adaptive_scale, lerp
-from typerig.core.objects.atom import Container
-from typerig.core.objects.node import Node, DirectionalNode, node_types
+from typerig.core.objects.atom import Container, _next_stamp
+from typerig.core.objects.node import Node, DirectionalNode, node_types, _node_from_element
 
 # - Init -------------------------------
-__version__ = '0.9.0'
+__version__ = '0.15.3'
+
+_node_lib = attrgetter('_lib')	# Raw node lib, None until used
 
 # - Classes -----------------------------
 CONTOUR_KIND_BEZIER = 'bezier'
 CONTOUR_KIND_HOBBY = 'hobby'
 
+class _GeometryMemo(dict):
+	'''Derived geometry of one contour state: valid while the contour
+	keeps the stamp (version), node list and node count it was built for.
+	Never copied or pickled - clones start with an empty memo.
+	'''
+	__slots__ = ('version', 'data', 'size')
+
+	def __init__(self, version=None, data=None):
+		self.version = version
+		self.data = data
+		self.size = len(data) if data is not None else -1
+
+	def __copy__(self):
+		return None
+
+	def __deepcopy__(self, memo):
+		return None
+
+	def __reduce__(self):
+		return (_GeometryMemo, ())
+
 @register_xml_class
 class Contour(Container, XMLSerializable):
-	__slots__ = ('name', 'closed', 'clockwise', 'transform', 'kind', '_offset_clean_converged')
+	__slots__ = ('name', '_closed', 'clockwise', 'transform', 'kind', '_offset_clean_converged', '_version', '_geometry')
+
+	# Memoize derived geometry (segments, bounds, areas, samples) between
+	# edits. Host proxies, whose nodes change outside TypeRig, turn it off.
+	CACHE_GEOMETRY = True
 
 	XML_TAG = 'contour'
 	XML_ATTRS = ['name', 'identifier', 'kind', 'closed', 'clockwise']
@@ -46,6 +75,9 @@ class Contour(Container, XMLSerializable):
 	XML_ATTR_DEFAULTS = {'closed': False}
 
 	def __init__(self, nodes=None, **kwargs):
+		self._version = _next_stamp()
+		self._geometry = None
+
 		# - Kind dispatch (bezier vs hobby)
 		kind = kwargs.pop('kind', None)
 
@@ -81,7 +113,95 @@ class Contour(Container, XMLSerializable):
 		if not kwargs.pop('proxy', False): # Initialize in proxy mode
 			self.name = kwargs.pop('name', '')
 			self.closed = kwargs.pop('closed', False)
-			self.clockwise = kwargs.pop('clockwise', self.get_winding())
+			self.clockwise = kwargs.pop('clockwise') if 'clockwise' in kwargs else self.get_winding()
+
+	# -- Modification tracking -----------------
+	# Every edit gives the contour a new stamp: node x / y / type / smooth
+	# setters and lib assignment, the container API (insert, append, pop,
+	# item assignment...), closing and the structural methods below.
+	# Node setters only clear the stamp;
+	# the next read of version draws the new one. Derived geometry is
+	# memoized per stamp. NOTE: edits of the raw list (contour.data / contour.nodes)
+	# that keep its length are not seen - call touch() after them.
+	# Hobby knots are plain attributes that report no edits, so hobby
+	# contours get a new stamp on every read and are never memoized.
+
+	@property
+	def version(self):
+		'''Modification stamp: changes on every edit of the contour.
+		Stamps are unique within the process, so containers can aggregate
+		them (see Shape.version, Layer.version).
+		'''
+		version = self._version
+
+		if version is None or self.is_hobby:
+			version = self._version = _next_stamp()
+
+		return version
+
+	def touch(self):
+		'''Mark the contour as changed.'''
+		self._version = _next_stamp()
+
+	def _xml_children_state(self):
+		# - Nodes are summed up by the stamp instead of walked (see XMLSerializable._xml_state);
+		# - node libs are edited in place, so those present are snapshot (C level scan)
+		data = self.data
+		libs = None
+
+		if any(map(_node_lib, data)):
+			libs = tuple([(i, repr(node._lib)) for i, node in enumerate(data) if node._lib])
+
+		return (self.version, id(data), len(data), libs)
+
+	def _memo(self):
+		'''Geometry memo of the current contour state.'''
+		data = self.data
+		memo = self._geometry
+		version = self.version
+
+		if memo is None or memo.version != version or memo.data is not data or memo.size != len(data):
+			memo = _GeometryMemo(version, data)
+
+			if self.CACHE_GEOMETRY and not self.is_hobby:
+				self._geometry = memo
+
+		return memo
+
+	def __setstate__(self, state):
+		# - Copies get a stamp of their own: stamps from other processes
+		# - could repeat here.
+		super(Contour, self).__setstate__(state)
+		self._version = _next_stamp()
+		self._geometry = None
+
+	def insert(self, i, item):
+		super(Contour, self).insert(i, item)
+		self._version = _next_stamp()
+
+	def append(self, item):
+		super(Contour, self).append(item)
+		self._version = _next_stamp()
+
+	def pop(self, i=-1):
+		self._version = _next_stamp()
+		return super(Contour, self).pop(i)
+
+	def remove(self, item):
+		super(Contour, self).remove(item)
+		self._version = _next_stamp()
+
+	def sort(self, *args, **kwargs):
+		super(Contour, self).sort(*args, **kwargs)
+		self._version = _next_stamp()
+
+	def __setitem__(self, i, item):
+		super(Contour, self).__setitem__(i, item)
+		self._version = _next_stamp()
+
+	def __delitem__(self, i):
+		super(Contour, self).__delitem__(i)
+		self._version = _next_stamp()
 
 	# -- XML serialization (kind dispatch) ------
 	@classmethod
@@ -111,13 +231,23 @@ class Contour(Container, XMLSerializable):
 			knot_elems = element.findall('knot')
 			if knot_elems:
 				attrs['knots'] = [HobbyKnot.from_XML(e) for e in knot_elems]
+
+			lib_elem = element.find('lib')
 		else:
-			node_elems = element.findall('node')
-			if node_elems:
-				attrs['nodes'] = [Node.from_XML(e) for e in node_elems]
+			# - One pass over the children; plain nodes skip Node.from_XML
+			nodes, lib_elem = [], None
+
+			for child in element:
+				if child.tag == 'node':
+					nodes.append(Node.from_XML(child) if len(child) else _node_from_element(child))
+
+				elif child.tag == 'lib' and lib_elem is None:
+					lib_elem = child
+
+			if nodes:
+				attrs['nodes'] = nodes
 
 		# - lib section (preserve existing behaviour)
-		lib_elem = element.find('lib')
 		if lib_elem is not None:
 			dict_elem = lib_elem.find('dict')
 			if dict_elem is not None:
@@ -139,6 +269,15 @@ class Contour(Container, XMLSerializable):
 	def is_bezier(self):
 		return getattr(self, 'kind', CONTOUR_KIND_BEZIER) == CONTOUR_KIND_BEZIER
 
+	@property
+	def closed(self):
+		return self._closed
+
+	@closed.setter
+	def closed(self, value):
+		self._closed = value
+		self._version = _next_stamp()
+
 	@property
 	def nodes(self):
 		return self.data
@@ -150,6 +289,8 @@ class Contour(Container, XMLSerializable):
 		elif isinstance(other, (tuple, list)):
 			self.data = [self._coerce(item) for item in other]
 
+		self.touch()
+
 	@property
 	def knots(self):
 		'''Hobby knots (alias of self.data when kind == "hobby").'''
@@ -162,6 +303,8 @@ class Contour(Container, XMLSerializable):
 		elif isinstance(other, (tuple, list)):
 			self.data = [self._coerce(item) for item in other]
 
+		self.touch()
+
 	@property
 	def selected_nodes(self):
 		return [node for node in self.nodes if node.selected]
@@ -173,7 +316,16 @@ class Contour(Container, XMLSerializable):
 	@property
 	def bounds(self):
 		assert len(self.data) > 0, 'Cannot return bounds for <{}> with length {}'.format(self.__class__.__name__, len(self.data))
-		return Bounds([node.point.tuple for node in self.data])
+		memo = self._memo()
+		bounds = memo.get('bounds')
+
+		if bounds is None:
+			bounds = memo['bounds'] = self._bounds()
+
+		return copy.copy(bounds)
+
+	def _bounds(self):
+		return Bounds([(float(node.x), float(node.y)) for node in self.data])
 
 	@property
 	def tight_bounds(self):
@@ -185,13 +337,21 @@ class Contour(Container, XMLSerializable):
 		control-box semantics — panels and delta code depend on it.
 		'''
 		assert len(self.data) > 0, 'Cannot return bounds for <{}> with length {}'.format(self.__class__.__name__, len(self.data))
+		memo = self._memo()
+		bounds = memo.get('tight_bounds')
+
+		if bounds is None:
+			bounds = memo['tight_bounds'] = self._tight_bounds()
 
+		return copy.copy(bounds)
+
+	def _tight_bounds(self):
 		if len(self.data) < 2:
 			return self.bounds
 
 		corners = []
 
-		for segment in self.segments:
+		for segment in self._memo_segments():
 			if isinstance(segment, Line):
 				corners.append((segment.p0.x, segment.p0.y))
 				corners.append((segment.p1.x, segment.p1.y))
@@ -215,40 +375,63 @@ class Contour(Container, XMLSerializable):
 
 	@property
 	def segments(self):
+		'''Segment objects (Line, CubicBezier, QuadraticBezier) in contour
+		order. Built fresh on every call from the geometry memo, so callers
+		may edit them freely.
+		'''
+		return [segment.__class__(segment) for segment in self._memo_segments()]
+
+	def _memo_segments(self):
+		'''Memoized segment list shared by the geometry helpers - read-only.'''
+		memo = self._memo()
+		segments = memo.get('segments')
+
+		if segments is None:
+			segments = memo['segments'] = self._segments()
+
+		return segments
+
+	def _segments(self):
 		obj_segments = []
 
 		for node_seg in self.node_segments:
-			points = [n.point for n in node_seg]
-			num = len(node_seg)
+			self._append_segment(obj_segments, [n.point for n in node_seg], node_seg[1].type)
 
-			if num == 2:
-				obj_segments.append(Line(*points))
+		return obj_segments
 
-			elif num == 4 and node_seg[1].type == node_types['curve']:
-				# Cubic bezier: on, curve, curve, on
-				obj_segments.append(CubicBezier(*points))
+	@staticmethod
+	def _append_segment(obj_segments, points, second_type):
+		'''Append the segment object(s) for one node run to obj_segments.
+		points: Points of the run (on, [offs...], on); second_type: type of run[1].
+		'''
+		num = len(points)
 
-			elif num >= 3:
-				# TT quadratic (simple or complex)
-				# Expand complex TT runs via implicit on-curves at midpoints
-				off_points = points[1:-1]
-				p_start = points[0]
+		if num == 2:
+			obj_segments.append(Line(*points))
 
-				for i in range(len(off_points)):
-					q = off_points[i]
+		elif num == 4 and second_type == node_types['curve']:
+			# Cubic bezier: on, curve, curve, on
+			obj_segments.append(CubicBezier(*points))
 
-					if i < len(off_points) - 1:
-						# Implicit on-curve at midpoint to next off-curve
-						q_next = off_points[i + 1]
-						p_end = Point((q.x + q_next.x) * 0.5, (q.y + q_next.y) * 0.5)
-					else:
-						# Last off-curve connects to final on-curve
-						p_end = points[-1]
+		elif num >= 3:
+			# TT quadratic (simple or complex)
+			# Expand complex TT runs via implicit on-curves at midpoints
+			off_points = points[1:-1]
+			p_start = points[0]
 
-					obj_segments.append(QuadraticBezier(p_start, q, p_end))
-					p_start = p_end
+			for i in range(len(off_points)):
+				q = off_points[i]
 
-		return obj_segments
+				if i < len(off_points) - 1:
+					# Implicit on-curve at midpoint to next off-curve
+					q_next = off_points[i + 1]
+					p_end = Point((q.x + q_next.x) * 0.5, (q.y + q_next.y) * 0.5)
+				else:
+					# Last off-curve connects to final on-curve
+					p_end = points[-1]
+
+				obj_segments.append(QuadraticBezier(p_start, q, p_end))
+				p_start = p_end
 
 	@property
 	def point_array(self):
@@ -265,7 +448,13 @@ class Contour(Container, XMLSerializable):
 	@property 
 	def on_curve_points(self):
 		'''Return list of on-curve points (segment start points).'''
-		return [seg.p0 for seg in self.segments]
+		memo = self._memo()
+		points = memo.get('on_curve_points')
+
+		if points is None:
+			points = memo['on_curve_points'] = [segment.p0.tuple for segment in self._memo_segments()]
+
+		return [Point(x, y) for x, y in points]
 
 	@property
 	def all_points_flat(self):
@@ -313,9 +502,17 @@ class Contour(Container, XMLSerializable):
 			)
 
 	# -- Functions ------------------------------
+	def pack(self):
+		'''Return a compact copy of this contour backed by coordinate arrays.
+		See typerig.core.objects.packedcontour.PackedContour.
+		'''
+		from typerig.core.objects.packedcontour import PackedContour
+		return PackedContour.from_contour(self)
+
 	def set_start(self, index):
 		index = self.nodes[index].prev_on.idx if not self.nodes[index].is_on else index
 		self.data = self.data[index:] + self.data[:index] 
+		self.touch()
 
 	def get_winding(self):
 		'''Check if contour has clockwise winding direction'''
@@ -329,8 +526,18 @@ class Contour(Container, XMLSerializable):
 		'knots' (hobby knot positions).
 		Single shoelace core — only the point list varies with mode.
 		'''
+		memo = self._memo()
+		key = ('signed_area', mode)
+		area = memo.get(key)
+
+		if area is None:
+			area = memo[key] = self._signed_area(mode)
+
+		return area
+
+	def _signed_area(self, mode):
 		if mode == 'sampled':
-			pts = self.sample(steps_per_segment=100)
+			pts = self._sample(100)	# Not memoized: only the area is kept
 		elif mode == 'knots':
 			pts = [(item.x, item.y) for item in self.data]
 		elif mode == 'on':
@@ -365,24 +572,66 @@ class Contour(Container, XMLSerializable):
 		return -self.get_signed_area('knots')
 
 	def get_segments(self, get_point=False):
+		'''Node runs of each segment: [on, (off...), on], as node lists or,
+		with get_point, as lists of Points. Runs are new on every call.
+		'''
+		runs = self._runs(self._memo())
+
+		if get_point:
+			return [[node.point for node in run] for run in runs]
+
+		return [run[:] for run in runs]
+
+	def _runs(self, memo):
+		runs = memo.get('node_segments')
+
+		if runs is None:
+			runs = memo['node_segments'] = self._node_runs()
+
+		return runs
+
+	def segment_index(self, node):
+		'''Index (into node_segments / segments) of the segment starting at
+		on-curve node, or None. Served from a node -> segment map memoized
+		with the geometry, so per node lookups are O(1) on unchanged contours.
+		'''
+		memo = self._memo()
+		runs = self._runs(memo)
+		index = memo.get('segment_index')
+
+		if index is None:
+			# - Keyed by id: the memoized runs keep every keyed node alive
+			index = memo['segment_index'] = {id(run[0]): i for i, run in enumerate(runs)}
+
+		i = index.get(id(node))
+		return i if i is not None and runs[i][0] is node else None
+
+	def _segment_run(self, node):
+		'''Memoized node run of the segment starting at node, or None. Read-only.'''
+		i = self.segment_index(node)
+		return self._runs(self._memo())[i] if i is not None else None
+
+	def _node_runs(self):
 		assert len(self.data) > 1, 'Cannot return segments for contour with length {}'.format(len(self.data))
 		contour_segments = []
 		contour_nodes = self.data[:]
 		if self.closed: contour_nodes.append(contour_nodes[0])
 
-		while len(contour_nodes):
-			node = contour_nodes[0]
-			contour_nodes= contour_nodes[1:]
-			segment = [node.point] if get_point else [node]
+		# - Runs from one node to the next on-curve one (inclusive); a run
+		# - ends where the next starts. Index walk: no list re-slicing per run.
+		count = len(contour_nodes)
+		start = 0
+
+		while start < count - 1:
+			end = start + 1
 
-			for node in contour_nodes:
-				segment.append(node.point if get_point else node)
-				if node.is_on: break
+			while end < count - 1 and not contour_nodes[end].is_on:
+				end += 1
 
-			contour_segments.append(segment)
-			contour_nodes = contour_nodes[len(segment)-2:]
+			contour_segments.append(contour_nodes[start:end + 1])
+			start = end
 
-		return contour_segments[:-1]
+		return contour_segments
 
 	def reverse(self):
 		reversed_data = list(reversed(self.data))
@@ -390,6 +639,7 @@ class Contour(Container, XMLSerializable):
 		# - An offcurve could never be first node
 		on_index = next(i for i, node in enumerate(reversed_data) if node.type == 'on')
 		self.data = reversed_data[on_index:] + reversed_data[:on_index]
+		self.touch()
 
 	def split(self, index, expanded=False):
 		'''Split contour at on-curve node `index`.
@@ -425,7 +675,7 @@ class Contour(Container, XMLSerializable):
 		if self.closed:
 			# Open the contour: rotate to start at index, duplicate cut node at end
 			rotated = self.data[index:] + self.data[:index]
-			end_copy = cut_node.clone()
+			end_copy = self._coerce(cut_node.clone())
 			self.data = rotated + [end_copy]
 			self.closed = False
 			if expanded:
@@ -439,6 +689,7 @@ class Contour(Container, XMLSerializable):
 		new_contour = self.__class__(second_data, closed=False,
 		                             default_factory=self._subclass)
 		self.data = first_data
+		self.touch()
 		if expanded:
 			self._expand_cut(self.data[-1], new_contour.data[0])
 		return new_contour
@@ -460,7 +711,7 @@ class Contour(Container, XMLSerializable):
 			self.closed = True
 			return self
 
-		self.data = list(self.data) + list(other.data)
+		self.data = list(self.data) + [self._coerce(node) for node in other.data]
 		self.closed = True
 		return self
 
@@ -550,6 +801,10 @@ class Contour(Container, XMLSerializable):
 			node.weight.x = wx
 			node.weight.y = wy
 
+	def _node_values(self):
+		'''Flat [x, y, type, x, y, type...] of all nodes (bulk reader for Layer.digest).'''
+		return [value for node in self.data for value in (node.x, node.y, node.type)]
+
 	# - Compatibility ---------------------------
 	def diff_compatibility(self, other):
 		'''Diagnose WHERE interpolation compatibility breaks against `other`.
@@ -573,39 +828,61 @@ class Contour(Container, XMLSerializable):
 		return result
 
 	# - Hit testing -----------------------------
-	def contains_point(self, point, steps_per_segment=32):
+	def contains_point(self, point, steps_per_segment=32, tolerance=None):
 		'''Winding-aware point-in-contour test.
 
 		The contour is polygonized with sample() and tested with a ray
-		caster (func.geometry.point_in_polygon). Points exactly ON the
-		outline are UNDEFINED — the underlying ray-caster is half-open;
-		do not rely on edge behavior.
+		caster over a cached edge table (func.geometry.point_in_edge_table).
+		Points exactly ON the outline are UNDEFINED — the underlying
+		ray-caster is half-open; do not rely on edge behavior.
 
 		Args:
 			point: Point, Node, or (x, y) tuple/list
 			steps_per_segment (int): polygonization density
+			tolerance (float): adaptive polygonization instead, see sample()
 
 		Returns:
 			bool
 		'''
-		from typerig.core.func.geometry import point_in_polygon
+		return self.contains_points([point], steps_per_segment, tolerance)[0]
 
-		# Duck-type .x/.y first (Point, Node, Anchor), fall back to indexing
-		try:
-			x, y = point.x, point.y
-		except AttributeError:
-			x, y = point[0], point[1]
+	def contains_points(self, points, steps_per_segment=32, tolerance=None):
+		'''Batch point-in-contour test, see contains_point.
+		The polygon and its edge table are built once per contour state,
+		so thousands of queries (anchors, SDF grid samples) stay cheap.
+
+		Args:
+			points: iterable of Point, Node, or (x, y) tuple/list
+			steps_per_segment (int): polygonization density
+			tolerance (float): adaptive polygonization instead, see sample()
+
+		Returns:
+			list of bool
+		'''
+		from typerig.core.func.geometry import polygon_edge_table, point_in_edge_table
+
+		memo = self._memo()
+		key = ('edges', steps_per_segment, tolerance)
+		table = memo.get(key)
 
-		# Quick-reject on the curve-accurate box
-		if not self.tight_bounds.contains(x, y):
-			return False
+		if table is None:
+			polygon = self._polygon(steps_per_segment, tolerance)
+			table = memo[key] = polygon_edge_table([polygon]) if len(polygon) >= 3 else None
 
-		polygon = self.sample(steps_per_segment)
+		# - Quick-reject on the curve-accurate box
+		box = self.tight_bounds
+		result = []
+
+		for point in points:
+			# Duck-type .x/.y first (Point, Node, Anchor), fall back to indexing
+			try:
+				x, y = point.x, point.y
+			except AttributeError:
+				x, y = point[0], point[1]
 
-		if len(polygon) < 3:
-			return False
+			result.append(table is not None and box.contains(x, y) and point_in_edge_table((x, y), table))
 
-		return point_in_polygon((x, y), polygon)
+		return result
 
 	# - Intersections ---------------------------
 	@staticmethod
@@ -623,8 +900,23 @@ class Contour(Container, XMLSerializable):
 
 		return segment.tuple
 
+	def _segment_cubics(self):
+		'''Segments as cubic tuples with their control boxes, memoized.'''
+		from typerig.core.algo.intersect import curve_bbox
+
+		memo = self._memo()
+		data = memo.get('cubics')
+
+		if data is None:
+			cubics = [self._segment_to_cubic_tuple(seg) for seg in self._memo_segments()]
+			data = memo['cubics'] = (cubics, [curve_bbox(c) for c in cubics])
+
+		return data
+
 	def intersections(self, other_contour, tolerance=0.1):
 		'''All segment-pair intersections with another contour.
+		Only segment pairs with overlapping boxes (sweep-and-prune) are
+		handed to the curve clipper.
 
 		Args:
 			other_contour (Contour): contour to intersect with
@@ -634,24 +926,16 @@ class Contour(Container, XMLSerializable):
 			list of (seg_i, seg_j, t_i, t_j, (x, y)) where seg_i indexes
 			self.segments and seg_j indexes other_contour.segments.
 		'''
-		from typerig.core.algo.intersect import curve_curve_intersections, curve_bbox
+		from typerig.core.algo.intersect import curve_curve_intersections, box_overlap_pairs
 
-		self_cubics = [self._segment_to_cubic_tuple(seg) for seg in self.segments]
-		other_cubics = [other_contour._segment_to_cubic_tuple(seg) for seg in other_contour.segments]
-
-		self_boxes = [curve_bbox(c) for c in self_cubics]
-		other_boxes = [curve_bbox(c) for c in other_cubics]
+		self_cubics, self_boxes = self._segment_cubics()
+		other_cubics, other_boxes = other_contour._segment_cubics()
 
 		result = []
 
-		for i, (ci, bi) in enumerate(zip(self_cubics, self_boxes)):
-			for j, (cj, bj) in enumerate(zip(other_cubics, other_boxes)):
-				# Cheap segment-bbox reject before recursing
-				if bi[0] > bj[2] or bj[0] > bi[2] or bi[1] > bj[3] or bj[1] > bi[3]:
-					continue
-
-				for t_i, t_j, pt in curve_curve_intersections(ci, cj, tolerance):
-					result.append((i, j, t_i, t_j, pt))
+		for i, j in box_overlap_pairs(self_boxes, other_boxes):
+			for t_i, t_j, pt in curve_curve_intersections(self_cubics[i], other_cubics[j], tolerance):
+				result.append((i, j, t_i, t_j, pt))
 
 		return result
 
@@ -668,32 +952,27 @@ class Contour(Container, XMLSerializable):
 		Returns:
 			list of (seg_i, seg_j, t_i, t_j, (x, y)) with seg_i < seg_j.
 		'''
-		from typerig.core.algo.intersect import curve_curve_intersections, curve_bbox
+		from typerig.core.algo.intersect import curve_curve_intersections, box_overlap_pairs
 
-		cubics = [self._segment_to_cubic_tuple(seg) for seg in self.segments]
-		boxes = [curve_bbox(c) for c in cubics]
+		cubics, boxes = self._segment_cubics()
 		num = len(cubics)
 		endpoint_t = 5e-3
 
 		result = []
 
-		for i in range(num):
-			for j in range(i + 1, num):
-				if boxes[i][0] > boxes[j][2] or boxes[j][0] > boxes[i][2] or boxes[i][1] > boxes[j][3] or boxes[j][1] > boxes[i][3]:
-					continue
-
-				# Which shared endpoints must be filtered out
-				consecutive = (j == i + 1)
-				wraparound = (self.closed and i == 0 and j == num - 1)
+		for i, j in box_overlap_pairs(boxes):
+			# Which shared endpoints must be filtered out
+			consecutive = (j == i + 1)
+			wraparound = (self.closed and i == 0 and j == num - 1)
 
-				for t_i, t_j, pt in curve_curve_intersections(cubics[i], cubics[j], tolerance):
-					if consecutive and t_i > 1. - endpoint_t and t_j < endpoint_t:
-						continue
+			for t_i, t_j, pt in curve_curve_intersections(cubics[i], cubics[j], tolerance):
+				if consecutive and t_i > 1. - endpoint_t and t_j < endpoint_t:
+					continue
 
-					if wraparound and t_j > 1. - endpoint_t and t_i < endpoint_t:
-						continue
+				if wraparound and t_j > 1. - endpoint_t and t_i < endpoint_t:
+					continue
 
-					result.append((i, j, t_i, t_j, pt))
+				result.append((i, j, t_i, t_j, pt))
 
 		return result
 
@@ -781,16 +1060,33 @@ class Contour(Container, XMLSerializable):
 		return func
 
 	# -- SDF / Offset related -------------------------
-	def sample(self, steps_per_segment=64):
+	def sample(self, steps_per_segment=64, tolerance=None):
 		'''Sample contour into a polyline of (x, y) tuples.
+		Memoized per steps_per_segment / tolerance until the contour changes.
 		Args:
 			steps_per_segment (int): samples per bezier segment
+			tolerance (float): if given, flatten adaptively instead: curves
+				are subdivided until within tolerance of their chords and
+				straight segments give only their start points
 		Returns:
 			list of tuple(x, y)
 		'''
+		return self._polygon(steps_per_segment, tolerance)[:]
+
+	def _polygon(self, steps_per_segment, tolerance):
+		memo = self._memo()
+		key = ('sample', steps_per_segment) if tolerance is None else ('flatten', tolerance)
+		points = memo.get(key)
+
+		if points is None:
+			points = memo[key] = self._sample(steps_per_segment) if tolerance is None else self._flatten(tolerance)
+
+		return points
+
+	def _sample(self, steps_per_segment):
 		points = []
 
-		for segment in self.segments:
+		for segment in self._memo_segments():
 			for j in range(steps_per_segment):
 				t = j / float(steps_per_segment)
 				pt = segment.solve_point(t)
@@ -798,6 +1094,53 @@ class Contour(Container, XMLSerializable):
 
 		return points
 
+	def _flatten(self, tolerance):
+		points = []
+
+		for segment in self._memo_segments():
+			if isinstance(segment, QuadraticBezier):
+				segment = segment.to_cubic()
+
+			if isinstance(segment, CubicBezier):
+				points.extend((line.p0.x, line.p0.y) for line in segment.flatten(tolerance))
+			else:
+				points.append((segment.p0.x, segment.p0.y))
+
+		return points
+
+	def equidistant_samples(self, step):
+		'''Sample contour into a polyline of (x, y) tuples evenly spaced by
+		arc length within every segment, about `step` apart. Segment start
+		points are always included, end points come from the next segment;
+		zero length segments are skipped.
+		Memoized per step until the contour changes.
+		Args:
+			step (float): sample spacing in font units
+		Returns:
+			list of tuple(x, y)
+		'''
+		memo = self._memo()
+		key = ('equidistant', step)
+		points = memo.get(key)
+
+		if points is None:
+			points = memo[key] = self._equidistant_samples(step)
+
+		return points[:]
+
+	def _equidistant_samples(self, step):
+		points = []
+
+		for segment in self.segments:
+			start = segment.p0
+
+			if all(point == start for point in segment.points):
+				continue
+
+			points.extend(segment.equidistant_samples(step))
+
+		return points
+
 	def sample_with_normals(self, steps_per_segment=64):
 		'''Sample contour points paired with outward unit normals.
 
@@ -1225,7 +1568,7 @@ class Contour(Container, XMLSerializable):
 		'''
 		self._assert_cubic_only('offset_outline')
 
-		if len(self.segments) == 0:
+		if len(self._memo_segments()) == 0:
 			return self.clone()
 
 		seg_info, on_disp = self._compute_miter_displacements(distance)
@@ -1421,7 +1764,7 @@ class Contour(Container, XMLSerializable):
 		if sdf is None or not sdf.is_computed:
 			return self.offset_outline(distance, curvature_correction)
 
-		if len(self.segments) == 0:
+		if len(self._memo_segments()) == 0:
 			return self.clone()
 
 		# --- Passes 1-2: identical to offset_outline ---
@@ -1432,7 +1775,7 @@ class Contour(Container, XMLSerializable):
 		node_segs = self.node_segments
 		nid_to_node = {}
 
-		for si in range(len(self.segments)):
+		for si in range(len(self._memo_segments())):
 			nodes = node_segs[si]
 
 			for node in [nodes[0], nodes[-1]]:
@@ -1608,7 +1951,7 @@ class Contour(Container, XMLSerializable):
 
 		self._assert_cubic_only('scale_compensated')
 
-		if len(self.segments) == 0:
+		if len(self._memo_segments()) == 0:
 			return self.clone()
 
 		segments = self.segments
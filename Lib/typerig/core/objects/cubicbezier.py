@@ -13,13 +13,14 @@ import math
 from typerig.core.func.math import linInterp as lerp
 from typerig.core.func.math import ratfrac
 from typerig.core.func.utils import isMultiInstance
+from typerig.core.func.geometry import arc_length_table, arc_length_solve
 from typerig.core.objects.atom import PointsArithmetic
 from typerig.core.objects.transform import Transform
 from typerig.core.objects.point import Point
 from typerig.core.objects.line import Line
 
 # - Init -------------------------------
-__version__ = '0.33.0'
+__version__ = '0.35.0'
 
 # - Classes -----------------------------
 class CubicBezier(PointsArithmetic):
@@ -146,13 +147,27 @@ class CubicBezier(PointsArithmetic):
 		return _flatten_recursive(self.p0, self.p1, self.p2, self.p3)
 
 	def _is_flat(self, p0, p1, p2, p3, tol):
-		'''Check if segment is flat enough to approximate as line using bounding box method.'''
-		cross_x = (p0.x - 3*p1.x + 3*p2.x - p3.x) / 6.0
-		cross_y = (p0.y - 3*p1.y + 3*p2.y - p3.y) / 6.0
-		
-		dist_to_chord = max(abs(cross_x), abs(cross_y))
-		
-		return dist_to_chord <= tol
+		'''Check if segment is flat enough to approximate as line.
+		The curve lies in the hull of its control points, so it is within tol
+		of the chord when both handles are within tol of it and project onto it.'''
+		dx, dy = p3.x - p0.x, p3.y - p0.y
+		chord_sq = dx*dx + dy*dy
+
+		for p in (p1, p2):
+			vx, vy = p.x - p0.x, p.y - p0.y
+
+			if chord_sq == 0.:
+				if vx*vx + vy*vy > tol*tol:
+					return False
+				continue
+
+			cross = vx*dy - vy*dx
+			dot = vx*dx + vy*dy
+
+			if cross*cross > tol*tol*chord_sq or dot < 0. or dot > chord_sq:
+				return False
+
+		return True
 
 	def interpolate(self, other, t):
 		'''Linear interpolation between two CubicBezier curves at each control point.
@@ -917,7 +932,7 @@ class CubicBezier(PointsArithmetic):
 		return length * c
 
 	def get_arc_length(self):
-		return self._arc_length_between(0., 1.)
+		return self._arc_table()[0][1][-1]
 
 	def get_arc_length_by_parts(self, parts=50):
 		step = 1.0 / parts
@@ -930,42 +945,74 @@ class CubicBezier(PointsArithmetic):
 
 		return lengths
 
-	def solve_t_at_length(self, length, tolerance=1e-6, max_iterations=32):
-		'''Find t such that arc length from p0 to B(t) equals `length`.
-		Newton on F(t) = arclen(0,t) - length; F'(t) = |B'(t)|.
-		Clamps to [0,1]; falls back to bisection when Newton steps outside
-		the bracket or |F'| < 1e-12.'''
-		total = self._arc_length_between(0., 1.)
+	def _speed(self):
+		'''Speed |B'(t)| as a plain float function of t.'''
+		x0, y0, x1, y1 = self.p0.x, self.p0.y, self.p1.x, self.p1.y
+		x2, y2, x3, y3 = self.p2.x, self.p2.y, self.p3.x, self.p3.y
+		cx, cy = 3. * (x1 - x0), 3. * (y1 - y0)
+		bx, by = 6. * (x2 - 2. * x1 + x0), 6. * (y2 - 2. * y1 + y0)
+		ax, ay = 3. * (x3 - 3. * x2 + 3. * x1 - x0), 3. * (y3 - 3. * y2 + 3. * y1 - y0)
+		hypot = math.hypot
 
-		if length <= 0.:
-			return 0.
+		def speed(t):
+			return hypot((ax * t + bx) * t + cx, (ay * t + by) * t + cy)
 
-		if length >= total:
-			return 1.
+		return speed
 
-		lo, hi = 0., 1.
-		t = length / total
+	def _arc_table(self, tolerance=1e-6):
+		'''Arc length table and speed function, kept on the curve until its
+		control points change.'''
+		key = (self.p0.x, self.p0.y, self.p1.x, self.p1.y, self.p2.x, self.p2.y, self.p3.x, self.p3.y, tolerance)
+		cache = getattr(self, '_arc_cache', None)
 
-		for _ in range(max_iterations):
-			err = self._arc_length_between(0., t) - length
+		if cache is None or cache[0] != key:
+			speed = self._speed()
+			cache = self._arc_cache = (key, arc_length_table(speed, tolerance), speed)
 
-			if abs(err) <= tolerance:
-				return t
+		return cache[1], cache[2]
 
-			if err > 0.:
-				hi = t
-			else:
-				lo = t
+	def get_arc_length_table(self, tolerance=1e-6):
+		'''Cumulative arc length table of the curve as (ts, lengths).
+		Built once by adaptive subdivision and reused until the curve changes.'''
+		ts, lengths = self._arc_table(tolerance)[0]
+		return ts[:], lengths[:]
 
-			deriv = self._arc_length_integrand(t)
+	def solve_t_at_length(self, length, tolerance=1e-6, max_iterations=32):
+		'''Find t such that arc length from p0 to B(t) equals `length`.
+		Binary search in the cached arc length table, then Newton on
+		F(t) = arclen(0,t) - length; F'(t) = |B'(t)|. Clamps to [0,1].'''
+		table, speed = self._arc_table()
+		return arc_length_solve(table, speed, length, tolerance=tolerance, max_iterations=max_iterations)[0]
 
-			if deriv < 1e-12:
-				t = (lo + hi) * 0.5
-			else:
-				t_new = t - err / deriv
-				t = t_new if lo < t_new < hi else (lo + hi) * 0.5
+	def equidistant_samples(self, step, include_end=False):
+		'''Points evenly spaced by arc length, about `step` apart.
+		The curve is divided into as many equal arc length parts as fit
+		without going below step (at least one). The end point is left
+		out unless include_end, so consecutive segments chain without doubles.
 
-		return t
+		Returns:
+			list of tuple(x, y)
+		'''
+		table, speed = self._arc_table()
+		total = table[1][-1]
+		parts = max(1, int(total / step)) if total > 0. else 1
+		count = parts + 1 if include_end else parts
+		x0, y0, x1, y1 = self.p0.x, self.p0.y, self.p1.x, self.p1.y
+		x2, y2, x3, y3 = self.p2.x, self.p2.y, self.p3.x, self.p3.y
+
+		def point(t):
+			r = 1. - t
+			a, b, c, d = r * r * r, 3. * r * r * t, 3. * r * t * t, t * t * t
+			return (a * x0 + b * x1 + c * x2 + d * x3, a * y0 + b * y1 + c * y2 + d * y3)
+
+		samples = []
+		i = 1
+
+		for k in range(count):
+			t, i = arc_length_solve(table, speed, total * k / parts, i)
+			samples.append(point(t))
+
+		return samples
 
 	def get_bbox(self):
 		extremes = self.solve_extremes()
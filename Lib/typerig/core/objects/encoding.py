@@ -16,7 +16,7 @@ from typerig.core.objects.atom import Member, Container
 from typerig.core.fileio.xmlio import XMLSerializable, register_xml_class
 
 # - Init --------------------------------
-__version__ = '0.2.0'
+__version__ = '0.3.1'
 
 # - Classes -----------------------------
 @register_xml_class
@@ -39,7 +39,7 @@ class EncodingEntry(Member, XMLSerializable):
 		name (str)      : glyph name or alias as used in this font project
 		unicodes (list) : list of unicode codepoints as ints
 	'''
-	__slots__ = ('name', 'unicodes', 'identifier', 'parent', 'lib')
+	__slots__ = ('name', 'unicodes')
 
 	XML_TAG = 'entry'
 	XML_ATTRS = ['name']		# unicodes handled separately (hex formatting)
@@ -97,7 +97,18 @@ class EncodingEntry(Member, XMLSerializable):
 		raw  = element.get('unicodes', '').strip()
 		unicodes = [int(tok, 16) for tok in raw.split()] if raw else []
 
-		return cls(name=name, unicodes=unicodes)
+		return cls._bind(name, unicodes)
+
+	@classmethod
+	def _bind(cls, name, unicodes):
+		'''Lightweight constructor for bulk loading: plain entry, no kwargs
+		processing. Encoding tables run to tens of thousands of entries.
+		'''
+		entry = cls.__new__(cls)
+		entry._uid = entry.parent = entry.identifier = entry._lib = None
+		entry.name = name
+		entry.unicodes = unicodes
+		return entry
 
 
 @register_xml_class
@@ -118,8 +129,12 @@ class Encoding(Container, XMLSerializable):
 		enc.set('fi', 0xFB01)
 		enc.unicodes('A')        # → [65]
 		enc.glyph(0x0041)        # → 'A'
+
+	NOTE: Name and codepoint lookups are served from indices kept in step
+	with set/remove and list edits. Change codepoints through Encoding.set
+	(or call touch() after editing an entry in place).
 	'''
-	__slots__ = ('identifier', 'parent', 'lib')
+	__slots__ = ('_name_index', '_codepoint_index')
 
 	XML_TAG = 'encoding'
 	XML_ATTRS = []
@@ -129,10 +144,91 @@ class Encoding(Container, XMLSerializable):
 	def __init__(self, data=None, **kwargs):
 		factory = kwargs.pop('default_factory', EncodingEntry)
 		super(Encoding, self).__init__(data, default_factory=factory, **kwargs)
+		self._name_index = None
+		self._codepoint_index = None
 
 	def __repr__(self):
 		return '<{}: {} entries>'.format(self.__class__.__name__, len(self.data))
 
+	# -- Index --------------------------
+	def touch(self):
+		'''Drop the lookup indices; they are rebuilt on next access.'''
+		self._name_index = None
+		self._codepoint_index = None
+
+	def _names(self):
+		'''name → EncodingEntry, first entry wins (as the former scan did).
+		Rebuilt if the backing list was replaced or resized directly.
+		'''
+		cache = self._name_index
+
+		if cache is None or cache[0] is not self.data or cache[1] != len(self.data):
+			index = {}
+
+			for entry in self.data:
+				index.setdefault(entry.name, entry)
+
+			cache = self._name_index = (self.data, len(self.data), index)
+			self._codepoint_index = None
+
+		return cache[2]
+
+	def _codepoints(self):
+		'''codepoint → glyph name, last entry wins.'''
+		self._names()
+
+		if self._codepoint_index is None:
+			rev = {}
+
+			for entry in self.data:
+				for cp in entry.unicodes:
+					rev[cp] = entry.name
+
+			self._codepoint_index = rev
+
+		return self._codepoint_index
+
+	def _indexed(self, entry):
+		'''Account for entry just appended at the end of the list.'''
+		cache = self._name_index
+
+		if cache is None or cache[0] is not self.data or cache[1] != len(self.data) - 1:
+			self.touch()
+			return
+
+		cache[2].setdefault(entry.name, entry)
+		self._name_index = (self.data, len(self.data), cache[2])
+
+		# - Appended entry is last, so its codepoints win
+		if self._codepoint_index is not None:
+			for cp in entry.unicodes:
+				self._codepoint_index[cp] = entry.name
+
+	# -- Container overrides ------------
+	def append(self, item):
+		size = len(self.data)
+		super(Encoding, self).append(item)
+
+		if len(self.data) > size:
+			self._indexed(self.data[-1])
+
+	def insert(self, i, item):
+		super(Encoding, self).insert(i, item)
+		self.touch()
+
+	def pop(self, i=-1):
+		result = super(Encoding, self).pop(i)
+		self.touch()
+		return result
+
+	def __setitem__(self, i, item):
+		super(Encoding, self).__setitem__(i, item)
+		self.touch()
+
+	def __delitem__(self, i):
+		super(Encoding, self).__delitem__(i)
+		self.touch()
+
 	# -- Properties ---------------------
 	@property
 	def entries(self):
@@ -141,10 +237,7 @@ class Encoding(Container, XMLSerializable):
 	# -- Dict-like access ---------------
 	def get_entry(self, name):
 		'''Find entry by glyph name. Returns None if not found.'''
-		for entry in self.data:
-			if entry.name == name:
-				return entry
-		return None
+		return self._names().get(name)
 
 	def unicodes(self, name):
 		'''Return list of unicode codepoints for glyph name, or [].'''
@@ -166,31 +259,35 @@ class Encoding(Container, XMLSerializable):
 
 		if entry is None:
 			entry = EncodingEntry(name=name)
+			entry.set(*codepoints)
 			self.data.append(entry)
+			self._indexed(entry)
+			return
 
 		entry.set(*codepoints)
+		self._codepoint_index = None
 
 	def remove(self, name):
 		'''Remove encoding entry for glyph name.'''
+		if name not in self._names():
+			return
+
 		self.data = [e for e in self.data if e.name != name]
+		self.touch()
 
 	def reverse(self):
 		'''Return {codepoint_int: glyph_name} reverse lookup dict.
 
 		Last entry wins on duplicate codepoints — put canonical glyphs last.
 		'''
-		rev = {}
-		for entry in self.data:
-			for cp in entry.unicodes:
-				rev[cp] = entry.name
-		return rev
+		return dict(self._codepoints())
 
 	def glyph(self, codepoint):
 		'''Return glyph name for a codepoint, or None.'''
-		return self.reverse().get(codepoint)
+		return self._codepoints().get(codepoint)
 
 	def __contains__(self, name):
-		return self.get_entry(name) is not None
+		return name in self._names()
 
 	# -- Serialization override ---------
 	def _to_xml_element(self, exclude_attrs=[]):
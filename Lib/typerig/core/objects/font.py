@@ -9,7 +9,10 @@
 # that you use it at your own risk!
 
 # - Dependencies ------------------------
+import hashlib
+from abc import ABC, abstractmethod
 
+from collections import OrderedDict
 from xml.etree import ElementTree as ET
 
 from typerig.core.objects.atom import Member, Container
@@ -25,7 +28,7 @@ from typerig.core.objects.groups import Groups
 from typerig.core.fileio.xmlio import XMLSerializable, register_xml_class
 
 # - Init --------------------------------
-__version__ = '0.4.0'
+__version__ = '0.7.0'
 
 # - Classes -----------------------------
 @register_xml_class
@@ -282,6 +285,32 @@ class FontMetrics(Member, XMLSerializable):
 		)
 
 
+class GlyphSource(ABC):
+	'''Abstract placeholder for a glyph that is not parsed yet (lazy fonts).
+
+	Sits in Font data in place of a Glyph; the Font swaps in the result
+	of load() the first time the glyph is accessed, and may swap a clean
+	glyph back for its source when the load cache is full.
+	Readers subclass it and must implement load().
+
+	Attributes:
+		name (str)    : glyph name as seen by the font (drives the name index)
+		parent (Font) : owning font
+	'''
+	__slots__ = ('name', 'parent')
+
+	def __init__(self, name, parent=None):
+		self.name = name
+		self.parent = parent
+
+	def __repr__(self):
+		return '<{}: "{}" (not loaded)>'.format(self.__class__.__name__, self.name)
+
+	@abstractmethod
+	def load(self):
+		'''Return the parsed Glyph.'''
+
+
 @register_xml_class
 class Font(Container, XMLSerializable):
 	'''Core font object — Container of Glyph with full font-level metadata.
@@ -310,7 +339,8 @@ class Font(Container, XMLSerializable):
 	'''
 	__slots__ = (
 		'info', 'metrics', 'axes', 'masters', 'instances',
-		'encoding', 'kerning', 'groups', 'features', '_name_index'
+		'encoding', 'kerning', 'groups', 'features', '_name_index', '_name_dupes',
+		'_lazy', '_loaded', '_cache_size', '_sources'
 	)
 
 	XML_TAG = 'font'
@@ -320,6 +350,10 @@ class Font(Container, XMLSerializable):
 
 	def __init__(self, data=None, **kwargs):
 		factory = kwargs.pop('default_factory', Glyph)
+		self._lazy = False
+		self._loaded = None
+		self._sources = {}
+		self._cache_size = kwargs.pop('cache_size', None)
 		super(Font, self).__init__(data, default_factory=factory, **kwargs)
 
 		if not kwargs.pop('proxy', False):
@@ -346,24 +380,272 @@ class Font(Container, XMLSerializable):
 
 	def _rebuild_cache(self):
 		'''Rebuild the name → index lookup cache.'''
-		self._name_index = {g.name: i for i, g in enumerate(self.data)}
+		self._name_index = {}
+		self._name_dupes = set()
+		self._index_names(0, True)
+
+	# -- Name index maintenance ---------
+	# The index maps each name to its last position (duplicates: last wins).
+	# _name_dupes holds names seen more than once; only those ever need a
+	# scan when their indexed glyph goes away. It may over-approximate.
+
+	def _index_names(self, start, new=False):
+		'''Index names of glyphs from position start on.
+		new: the glyphs were just added, so record duplicate names.
+		'''
+		name_index, data = self._name_index, self.data
+
+		for idx in range(start, len(data)):
+			name = data[idx].name
+
+			if new and name in name_index:
+				self._name_dupes.add(name)
+
+			name_index[name] = idx
+
+	def _unindex_name(self, name, idx):
+		'''Forget name at position idx, falling back to an earlier duplicate.'''
+		if self._name_index.get(name) != idx:
+			return
+
+		del self._name_index[name]
+
+		if name in self._name_dupes:
+			for i in range(idx - 1, -1, -1):
+				if self.data[i].name == name:
+					self._name_index[name] = i
+					break
+
+	def _glyph_renamed(self, glyph, old_name):
+		'''Called by Glyph.name when a member glyph is renamed.'''
+		try:
+			idx = self.index(glyph)
+
+		except ValueError:
+			return
+
+		self._unindex_name(old_name, idx)
+		name = glyph.name
+
+		if name in self._name_index:
+			self._name_dupes.add(name)
+
+		if self._name_index.get(name, -1) < idx:
+			self._name_index[name] = idx
+
+	# -- Lazy glyphs --------------------
+	# Font data may hold GlyphSource placeholders. They are loaded on first
+	# access by name, index or iteration. With a cache_size set, loaded
+	# glyphs are kept in an LRU; the least recently used ones are swapped
+	# back for their source when they are unchanged since loaded (clean).
+	# Modified glyphs are never evicted. Clean is decided by the state
+	# token recorded with the source (see _track), not by serializing.
+	# NOTE: A glyph reference held past its eviction is detached from the
+	# font; re-fetch glyphs from the font rather than caching them.
+
+	def _coerce(self, item):
+		if isinstance(item, GlyphSource):
+			item.parent = self
+			self._lazy = True
+			return item
+
+		return super(Font, self)._coerce(item)
+
+	def _place(self, idx, item):
+		'''Swap data[idx] for item, keeping the position map in step.'''
+		self.data[idx] = item
+		cache = self._index_cache
+
+		if cache is not None and cache[0] is self.data:
+			cache[1][id(item)] = idx
+
+	def _glyph_at(self, idx):
+		'''Glyph at position idx, loading it if needed.'''
+		item = self.data[idx]
+
+		if isinstance(item, GlyphSource):
+			return self._load(idx % len(self.data), item)
+
+		if self._loaded is not None and id(item) in self._loaded:
+			self._loaded.move_to_end(id(item))
+
+		return item
+
+	def _load(self, idx, source):
+		glyph = source.load()
+		glyph.parent = self
+		self._place(idx, glyph)
+
+		if glyph.name != source.name:
+			self._glyph_renamed(glyph, source.name)
+			source.name = glyph.name
+
+		self._track(glyph, source)
+
+		if self._cache_size is not None:
+			if self._loaded is None:
+				self._loaded = OrderedDict()
+
+			self._loaded[id(glyph)] = glyph
+			self._evict()
+
+		return glyph
+
+	def _track(self, glyph, source):
+		'''Record that glyph is in the state stored by source.'''
+		source.parent = self
+		self._sources[id(glyph)] = (glyph, source, hash(glyph._xml_state()))
+
+	def _untrack(self, glyph):
+		'''Forget the source and LRU slot of a glyph leaving the font.'''
+		key = id(glyph)
+		record = self._sources.get(key)
+
+		if record is not None and record[0] is glyph:
+			del self._sources[key]
+
+		if self._loaded is not None and self._loaded.get(key) is glyph:
+			del self._loaded[key]
+
+	def _clean_source(self, glyph):
+		'''Source glyph was loaded from (or last saved to), if the glyph
+		is unchanged since; None otherwise.'''
+		record = self._sources.get(id(glyph))
+
+		if record is None or record[0] is not glyph or hash(glyph._xml_state()) != record[2]:
+			return None
+
+		return record[1]
+
+	def _evict(self):
+		while len(self._loaded) > self._cache_size:
+			glyph = self._loaded.popitem(last=False)[1]
+
+			if glyph.parent is not self:
+				continue
+
+			try:
+				idx = self.index(glyph)
+
+			except ValueError:
+				continue
+
+			source = self._clean_source(glyph)
+
+			if source is not None:
+				del self._sources[id(glyph)]
+				self._place(idx, source)
+
+	@property
+	def cache_size(self):
+		'''Max loaded glyphs kept from lazy sources, None for unbounded.'''
+		return self._cache_size
+
+	@cache_size.setter
+	def cache_size(self, other):
+		self._cache_size = other
+
+		if other is None:
+			self._loaded = None
+
+		elif self._loaded is not None:
+			self._evict()
+
+	@property
+	def is_lazy(self):
+		'''True if some glyphs are still unparsed sources.'''
+		return self._lazy and any(isinstance(item, GlyphSource) for item in self.data)
+
+	def load_all(self):
+		'''Parse every pending glyph source and keep all glyphs loaded.'''
+		self.cache_size = None
+
+		for idx in range(len(self.data)):
+			self._glyph_at(idx)
 
 	# -- Glyph Container override -------
-	# Override append/insert/pop to keep the cache consistent.
+	# Override mutators to keep the cache consistent: append and extend
+	# index only the new glyphs, insert and pop re-index the shifted tail.
 
 	def append(self, item):
+		start = len(self.data)
 		super(Font, self).append(item)
-		self._rebuild_cache()
+		self._index_names(start, True)
+
+	def extend(self, other):
+		'''Bulk append glyphs, indexing only the new ones.'''
+		if self._lock:
+			return
+
+		start = len(self.data)
+		self.data.extend([self._coerce(item) for item in (other.data if isinstance(other, Container) else other)])
+		self._index_cache = None
+		self._index_names(start, True)
 
 	def insert(self, i, item):
+		start = len(self.data)
 		super(Font, self).insert(i, item)
-		self._rebuild_cache()
+
+		if len(self.data) == start:
+			return
+
+		i = min(max(i + start if i < 0 else i, 0), start)
+		name = self.data[i].name
+
+		if name in self._name_index:
+			self._name_dupes.add(name)
+
+		self._index_names(i)
 
 	def pop(self, i=-1):
+		size = len(self.data)
+
+		if self._lazy and not self._lock and -size <= i < size:
+			self._glyph_at(i)
+
+		if not self._lock:
+			i = i + size if i < 0 else i
+
+			if 0 <= i < size:
+				self._unindex_name(self.data[i].name, i)
+
 		result = super(Font, self).pop(i)
-		self._rebuild_cache()
+
+		if result is not None:
+			self._untrack(result)
+			self._index_names(i)
+
 		return result
 
+	def remove(self, item):
+		self.pop(self.index(item))
+
+	def __setitem__(self, i, item):
+		self._untrack(self.data[i])
+
+		if isinstance(item, GlyphSource):
+			self.data[i] = self._coerce(item)
+			self._index_cache = None
+		else:
+			super(Font, self).__setitem__(i, item)
+
+		self._rebuild_cache()
+
+	def __delitem__(self, i):
+		for item in (self.data[i] if isinstance(i, slice) else [self.data[i]]):
+			self._untrack(item)
+
+		super(Font, self).__delitem__(i)
+		self._rebuild_cache()
+
+	def reverse(self):
+		super(Font, self).reverse()
+		self._rebuild_cache()
+
+	def sort(self, *args, **kwargs):
+		super(Font, self).sort(*args, **kwargs)
+		self._rebuild_cache()
+
 	# -- Properties ---------------------
 	@property
 	def name(self):
@@ -371,6 +653,10 @@ class Font(Container, XMLSerializable):
 
 	@property
 	def glyphs(self):
+		'''Glyph list. Lazy fonts load every pending glyph and return a new list.'''
+		if self._lazy:
+			return [self._glyph_at(idx) for idx in range(len(self.data))]
+
 		return self.data
 
 	@property
@@ -379,13 +665,17 @@ class Font(Container, XMLSerializable):
 
 	@property
 	def selected_glyphs(self):
-		return [g for g in self.data if g.selected]
+		return [g for g in self.glyphs if g.selected]
 
 	# -- Glyph access -------------------
 	def glyph(self, name):
 		'''Find glyph by name. Returns None if not found.'''
 		idx = self._name_index.get(name)
-		return self.data[idx] if idx is not None else None
+
+		if idx is None:
+			return None
+
+		return self._glyph_at(idx) if self._lazy else self.data[idx]
 
 	def __contains__(self, name):
 		return name in self._name_index
@@ -393,6 +683,10 @@ class Font(Container, XMLSerializable):
 	def __getitem__(self, key):
 		if isinstance(key, str):
 			return self.glyph(key)
+
+		if self._lazy and isinstance(key, int):
+			return self._glyph_at(key)
+
 		return super(Font, self).__getitem__(key)
 
 	# -- Helpers ------------------------
@@ -407,7 +701,20 @@ class Font(Container, XMLSerializable):
 
 	def get_marks(self, *mark_values):
 		marks = set(mark_values)
-		return [g for g in self.data if g.mark in marks]
+		return [g for g in self.glyphs if g.mark in marks]
+
+	def digest(self, precision=3):
+		'''Hex SHA-1 root over the digests of all glyphs in font order (see
+		Glyph.digest): one comparison confirms two fonts carry the same
+		glyph geometry. The descriptor (info, metrics, kerning...) is not
+		part of it. Lazy fonts load every glyph.
+		'''
+		root = hashlib.sha1()
+
+		for glyph in self.glyphs:
+			root.update(glyph.digest(precision).encode('ascii'))
+
+		return root.hexdigest()
 
 	# -- Serialization ------------------
 	# Font.to_XML() produces the font descriptor (font.xml in a .trfont).
@@ -26,7 +26,7 @@ from typerig.core.objects.glyph import Glyph
 from typerig.core.fileio.trfont import TrFontIO, GLYPHS_DIR, TRGLYPH_EXT
 
 # - Init --------------------------------
-__version__ = '0.2.0'
+__version__ = '0.3.0'
 
 # - Class -------------------------------
 class FontFile(object):
@@ -74,7 +74,7 @@ class FontFile(object):
 
 	def __iter__(self):
 		'''Iterate glyphs in order.'''
-		return iter(self.font.data)
+		return iter(self.font.glyphs)
 
 	def __contains__(self, name):
 		return name in self.font
@@ -82,7 +82,7 @@ class FontFile(object):
 	def __getitem__(self, key):
 		'''Access glyph by name or index.'''
 		if isinstance(key, int):
-			return self.font.data[key]
+			return self.font[key]
 		return self.font.glyph(key)
 
 	# -- Delegated font parts -----------
@@ -140,8 +140,7 @@ class FontFile(object):
 		glyph = self.font.glyph(name)
 
 		if glyph is not None:
-			self.font.data.remove(glyph)
-			self.font._rebuild_cache()
+			self.font.remove(glyph)
 
 	def get_glyph(self, name, default=None):
 		'''Get glyph by name without raising KeyError.'''
@@ -170,24 +169,26 @@ class FontFile(object):
 		return [m.layer_name for m in self.font.masters]
 
 	# -- IO -----------------------------
-	def save(self, path, embed_glyphs=True):
+	def save(self, path, embed_glyphs=True, workers=None):
 		'''Write font to a .trfont folder at path (delegates to TrFontIO).
 
 		Args:
 			path (str)          : destination folder (will be created)
 			embed_glyphs (bool) : write .trglyph files into the font folder
+			workers (int)       : glyph serializing processes (0: all cores)
 		'''
-		TrFontIO.write(self.font, path, embed_glyphs=embed_glyphs)
+		TrFontIO.write(self.font, path, embed_glyphs=embed_glyphs, workers=workers)
 
 	@classmethod
-	def load(cls, path):
+	def load(cls, path, workers=None):
 		'''Load a .trfont folder and return a populated FontFile
 		(delegates to TrFontIO).
 
 		Args:
-			path (str) : path to .trfont folder
+			path (str)    : path to .trfont folder
+			workers (int) : glyph parsing processes (0: all cores)
 
 		Returns:
 			FontFile
 		'''
-		return cls(font=TrFontIO.read(path))
+		return cls(font=TrFontIO.read(path, workers=workers))
@@ -9,6 +9,8 @@
 # that you use it at your own risk!
 
 # - Dependencies ------------------------
+import hashlib
+
 from typerig.core.objects.transform import Transform
 from typerig.core.objects.utils import Bounds
 from typerig.core.objects.delta import DeltaScale
@@ -21,7 +23,7 @@ from typerig.core.objects.layer import Layer
 from typerig.core.objects.guideline import Guideline
 
 # - Init -------------------------------
-__version__ = '0.4.0'
+__version__ = '0.5.1'
 
 # - Mark Color Palette ------------------
 # Predefined glyph flag colors stored as hex strings in XML.
@@ -46,7 +48,7 @@ MARK_COLORS_REV = {v: k for k, v in MARK_COLORS.items()}
 # - Classes -----------------------------
 @register_xml_class
 class Glyph(Container, XMLSerializable):
-	__slots__ = ('name', 'mark', 'unicodes', 'selected', 'note', 'guidelines')
+	__slots__ = ('_name', 'mark', 'unicodes', 'selected', 'note', 'guidelines')
 
 	XML_TAG = 'glyph'
 	XML_ATTRS = ['name', 'identifier', 'unicodes', 'selected', 'mark']
@@ -62,7 +64,7 @@ class Glyph(Container, XMLSerializable):
 		if not kwargs.pop('proxy', False): # Initialize in proxy mode
 			self.identifier = kwargs.pop('identifier', None)
 			self.mark = kwargs.pop('mark', None)  # Hex color string (e.g. '#FF3B30') or empty
-			self.name = kwargs.pop('name', hash(self))
+			self.name = kwargs.pop('name') if 'name' in kwargs else hash(self)
 			self.unicodes = kwargs.pop('unicodes', [])
 			self.selected = kwargs.pop('selected', False)
 			self.note = kwargs.pop('note', None)  # Free-text glyph note (UFO-style)
@@ -74,6 +76,20 @@ class Glyph(Container, XMLSerializable):
 	def __repr__(self):
 		return '<{}: Name={}, Unicode={}, Layers={}>'.format(self.__class__.__name__,self.name, self.unicode, repr(self.data))
 
+	# -- Properties -----------------------------
+	@property
+	def name(self):
+		return self._name
+
+	@name.setter
+	def name(self, other):
+		old_name = getattr(self, '_name', None)
+		self._name = other
+
+		# - Let the parent font patch its name index on renames
+		if old_name is not None and old_name != other and hasattr(self.parent, '_glyph_renamed'):
+			self.parent._glyph_renamed(self, old_name)
+
 	# -- Functions ------------------------------
 	def layer(self, layer_name=None):
 		if layer_name is None and hasattr(self, 'active_layer'): 
@@ -250,6 +266,17 @@ class Glyph(Container, XMLSerializable):
 		return all([layer.is_compatible(self.layers[0]) for layer in self.layers])
 
 	# - Functions -------------------------------
+	def digest(self, precision=3):
+		'''Hex SHA-1 over the glyph name, its sorted unicodes and the
+		digests of its layers (see Layer.digest), taken in layer name order.
+		Two glyphs are geometrically equal when their digests are; when they
+		are not, comparing layer digests tells which layers differ.
+		'''
+		layers = sorted((str(layer.name), layer.digest(precision)) for layer in self.layers)
+		canonical = (str(self.name), sorted(int(uni) for uni in self.unicodes or []), layers)
+
+		return hashlib.sha1(repr(canonical).encode('utf-8')).hexdigest()
+
 	def set_mark(self, value):
 		
 		if isinstance(value, str) and '#' not in value and value in MARK_COLORS.keys():
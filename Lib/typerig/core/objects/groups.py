@@ -30,11 +30,15 @@ from typerig.core.objects.atom import Member, Container
 from typerig.core.fileio.xmlio import XMLSerializable, register_xml_class
 
 # - Init --------------------------------
-__version__ = '0.2.0'
+__version__ = '0.5.1'
 
 KERN1_PREFIX = 'public.kern1.'
 KERN2_PREFIX = 'public.kern2.'
 
+# Conflict policies for Groups.update_from
+GROUP_POLICIES = ('replace', 'keep', 'merge', 'error')
+GROUP_SIDES = {None: ('',), 'first': (KERN1_PREFIX,), 'second': (KERN2_PREFIX,), 'both': (KERN1_PREFIX, KERN2_PREFIX)}
+
 
 # - Classes -----------------------------
 @register_xml_class
@@ -51,7 +55,7 @@ class Group(Member, XMLSerializable):
 		                 for kerning classes; anything else is a user group.
 		members (list) : ordered list of glyph name strings
 	'''
-	__slots__ = ('name', 'members', 'identifier', 'parent', 'lib')
+	__slots__ = ('name', 'members')
 
 	XML_TAG = 'group'
 	XML_ATTRS = ['name']	# members serialized as space-separated string
@@ -132,10 +136,11 @@ class Groups(Container, XMLSerializable):
 		groups.set('uppercase', ['A', 'B', 'C'])
 		groups.set('public.kern1.H', ['H', 'I', 'N'])
 		groups['public.kern1.H']           # → Group object
+		groups.update_from(CLAparser(path), side='both')	# bulk load
 		groups.members('uppercase')        # → ['A', 'B', 'C']
 		list(groups.kern1())               # → [Group, Group, ...] (kern1 only)
 	'''
-	__slots__ = ('identifier', 'parent', 'lib')
+	__slots__ = ('_version', '_group_index', '_membership')
 
 	XML_TAG = 'groups'
 	XML_ATTRS = []
@@ -145,6 +150,9 @@ class Groups(Container, XMLSerializable):
 	def __init__(self, data=None, **kwargs):
 		factory = kwargs.pop('default_factory', Group)
 		super(Groups, self).__init__(data, default_factory=factory, **kwargs)
+		self._version = 0
+		self._group_index = None
+		self._membership = None
 
 	def __repr__(self):
 		k1 = sum(1 for g in self.data if g.is_kern1)
@@ -153,13 +161,70 @@ class Groups(Container, XMLSerializable):
 		return '<{}: {} kern1, {} kern2, {} user>'.format(
 			self.__class__.__name__, k1, k2, other)
 
+	# -- Index --------------------------
+	# Two lazily built indices: group name → Group, and the reverse
+	# membership glyph name → [group names]. set/remove patch them in
+	# place; list edits drop them for a rebuild on next access.
+
+	def _groups(self):
+		'''name → Group, first group wins (as the former scan did).
+		Rebuilt if the backing list was replaced or resized directly.
+		'''
+		cache = self._group_index
+
+		if cache is None or cache[0] is not self.data or cache[1] != len(self.data):
+			index = {}
+
+			for group in self.data:
+				index.setdefault(group.name, group)
+
+			cache = self._group_index = (self.data, len(self.data), index)
+			self._membership = None
+			self._version += 1
+
+		return cache[2]
+
+	def _members(self):
+		'''glyph name → [names of groups listing it].'''
+		self._groups()
+
+		if self._membership is None:
+			membership = {}
+
+			for group in self.data:
+				for glyph_name in group.members:
+					membership.setdefault(glyph_name, []).append(group.name)
+
+			self._membership = membership
+
+		return self._membership
+
+	def _link(self, name, members):
+		for glyph_name in members:
+			self._membership.setdefault(glyph_name, []).append(name)
+
+	def _unlink(self, name, members):
+		for glyph_name in set(members):
+			names = self._membership.get(glyph_name)
+
+			if names is not None:
+				names[:] = [n for n in names if n != name]
+
+				if not names:
+					del self._membership[glyph_name]
+
+	def _in_order(self, names):
+		'''Group names sorted by group position (names is rarely > 1 long).'''
+		if len(names) < 2:
+			return list(names)
+
+		groups = self._groups()
+		return sorted(set(names), key=lambda name: self.index(groups[name]))
+
 	# -- Dict-like access ---------------
 	def get(self, name):
 		'''Return Group by name, or None.'''
-		for group in self.data:
-			if group.name == name:
-				return group
-		return None
+		return self._groups().get(name)
 
 	def __getitem__(self, key):
 		if isinstance(key, str):
@@ -167,7 +232,7 @@ class Groups(Container, XMLSerializable):
 		return super(Groups, self).__getitem__(key)
 
 	def __contains__(self, name):
-		return self.get(name) is not None
+		return name in self._groups()
 
 	def members(self, name):
 		'''Return member list for a group, or []. '''
@@ -176,19 +241,155 @@ class Groups(Container, XMLSerializable):
 
 	def set(self, name, members):
 		'''Add or replace a group.'''
-		existing = self.get(name)
+		groups = self._groups()
+		existing = groups.get(name)
+		members = list(members)
+		linked = self._membership is not None
+
 		if existing is not None:
-			existing.members = list(members)
+			if linked:
+				# - Patch only glyphs entering or leaving the group
+				old, new = set(existing.members), set(members)
+				self._unlink(name, old - new)
+				self._link(name, new - old)
+
+			existing.members = members
 		else:
-			self.data.append(Group(name, list(members)))
+			groups[name] = Group(name, members)
+			self.data.append(groups[name])
+			self._group_index = (self.data, len(self.data), groups)
+
+			if linked:
+				self._link(name, members)
+
+		self._version += 1
+
+	def update_from(self, iterable, side=None, policy='replace'):
+		'''Bulk load (name, members) items - CLAparser output, dict items
+		of groups.plist - indexing once instead of once per group.
+
+		side maps class names to kerning groups:
+			None     - names are used as they are (UFO groups)
+			'first'  - @NAME / NAME becomes public.kern1.NAME
+			'second' - @NAME / NAME becomes public.kern2.NAME
+			'both'   - one group on each side (DTL .cla classes are sideless;
+			           this matches the @NAME pair sides Kerning.update_from
+			           maps to public.kern1 / public.kern2)
+		Names that already carry a public.kern prefix are kept as they are.
+
+		policy for a name that is already defined with other members:
+			replace - the later definition wins (set semantics)
+			keep    - the first definition wins
+			merge   - members are united, first definition order kept
+			error   - raise ValueError
+
+		Returns {'added': n, 'updated': n, 'kept': n}.
+		'''
+		if policy not in GROUP_POLICIES:
+			raise ValueError('Unknown group policy: {} (use one of {})'.format(policy, ', '.join(GROUP_POLICIES)))
+
+		if side not in GROUP_SIDES:
+			raise ValueError('Unknown group side: {} (use None, first, second or both)'.format(side))
+
+		prefixes = GROUP_SIDES[side]
+		groups = self._groups()
+		added = updated = kept = 0
+
+		try:
+			for name, members in iterable:
+				if side is not None and name[:1] == '@':
+					name = name[1:]
+
+				members = list(members)
+
+				for prefix in prefixes:
+					key = name if name.startswith((KERN1_PREFIX, KERN2_PREFIX)) else prefix + name
+					existing = groups.get(key)
+
+					if existing is None:
+						group = groups[key] = Group(key, members)
+						self.data.append(group)
+						added += 1
+
+					elif existing.members == members or policy == 'keep':
+						kept += 1
+
+					elif policy == 'replace':
+						existing.members = list(members)
+						updated += 1
+
+					elif policy == 'merge':
+						known = set(existing.members)
+						existing.members += [m for m in members if m not in known and not known.add(m)]
+						updated += 1
+
+					else:
+						raise ValueError('Conflicting group {}: {} vs {}'.format(key, existing.members, members))
+
+		finally:
+			# - One rebuild of membership for the whole load
+			self._group_index = (self.data, len(self.data), groups)
+			self._membership = None
+			self._version += 1
+
+		return {'added': added, 'updated': updated, 'kept': kept}
 
 	def remove(self, name):
 		'''Remove group by name. No-op if not found.'''
+		groups = self._groups()
+		group = groups.pop(name, None)
+
+		if group is None:
+			return
+
 		self.data = [g for g in self.data if g.name != name]
+		self._group_index = (self.data, len(self.data), groups)
+
+		if self._membership is not None:
+			self._unlink(name, group.members)
+
+		self._version += 1
 
 	def names(self):
 		return [g.name for g in self.data]
 
+	# -- Change tracking ----------------
+	@property
+	def version(self):
+		'''Edit counter: bumped by set/remove and list edits. Caches built
+		from membership (e.g. Kerning.lookup) compare it to stay valid.
+		Call touch() after editing Group.members in place.
+		'''
+		self._groups()
+		return self._version
+
+	def touch(self):
+		'''Mark membership as changed.'''
+		self._version += 1
+		self._group_index = None
+		self._membership = None
+
+	def append(self, item):
+		super(Groups, self).append(item)
+		self.touch()
+
+	def insert(self, i, item):
+		super(Groups, self).insert(i, item)
+		self.touch()
+
+	def pop(self, i=-1):
+		result = super(Groups, self).pop(i)
+		self.touch()
+		return result
+
+	def __setitem__(self, i, item):
+		super(Groups, self).__setitem__(i, item)
+		self.touch()
+
+	def __delitem__(self, i):
+		super(Groups, self).__delitem__(i)
+		self.touch()
+
 	# -- Kerning class views ------------
 	def kern1(self):
 		'''Iterate kerning groups for the first (left) side of pairs.'''
@@ -201,3 +402,48 @@ class Groups(Container, XMLSerializable):
 	def user_groups(self):
 		'''Iterate non-kerning user groups.'''
 		return [g for g in self.data if not g.is_kern_class]
+
+	# -- Reverse membership -------------
+	def groups_of(self, glyph_name):
+		'''Names of all groups listing glyph_name, in group order.'''
+		return self._in_order(self._members().get(glyph_name, ()))
+
+	def kern_class(self, glyph_name, side):
+		'''Kerning class of glyph_name on side ('first' or 'second'), or None.
+		A glyph listed in several classes of one side resolves to the first
+		(see validate).
+		'''
+		prefix = KERN1_PREFIX if side == 'first' else KERN2_PREFIX
+		names = [n for n in self._members().get(glyph_name, ()) if n.startswith(prefix)]
+		return self._in_order(names)[0] if names else None
+
+	def kern1_of(self, glyph_name):
+		'''public.kern1.* class of glyph_name, or None.'''
+		return self.kern_class(glyph_name, 'first')
+
+	def kern2_of(self, glyph_name):
+		'''public.kern2.* class of glyph_name, or None.'''
+		return self.kern_class(glyph_name, 'second')
+
+	def user_groups_of(self, glyph_name):
+		'''Names of non-kerning groups listing glyph_name, in group order.'''
+		names = self._members().get(glyph_name, ())
+		return self._in_order([n for n in names if not n.startswith((KERN1_PREFIX, KERN2_PREFIX))])
+
+	def validate(self):
+		'''Glyphs listed in more than one kerning class of the same side.
+
+		UFO allows a glyph in at most one kern1 and one kern2 group.
+		Returns {'first': {glyph: [kern1 names]}, 'second': {glyph: [kern2 names]}};
+		both dicts are empty for valid groups.
+		'''
+		report = {'first': {}, 'second': {}}
+
+		for glyph_name, names in self._members().items():
+			for side, prefix in (('first', KERN1_PREFIX), ('second', KERN2_PREFIX)):
+				classes = set(n for n in names if n.startswith(prefix))
+
+				if len(classes) > 1:
+					report[side][glyph_name] = self._in_order(classes)
+
+		return report
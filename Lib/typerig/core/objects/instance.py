@@ -36,7 +36,7 @@ class Instance(Member, XMLSerializable):
 		location (dict) : {axis_name: value, ...}
 		identifier (str): optional unique id
 	'''
-	__slots__ = ('name', 'location', 'identifier', 'parent', 'lib')
+	__slots__ = ('name', 'location')
 
 	XML_TAG = 'instance'
 	XML_ATTRS = ['name', 'identifier']
@@ -85,7 +85,7 @@ class Instance(Member, XMLSerializable):
 @register_xml_class
 class Instances(Container, XMLSerializable):
 	'''Ordered list of Instance objects.'''
-	__slots__ = ('identifier', 'parent', 'lib')
+	__slots__ = ()
 
 	XML_TAG = 'instances'
 	XML_ATTRS = []
@@ -27,7 +27,22 @@ from typerig.core.fileio.xmlio import XMLSerializable, register_xml_class
 from typerig.core.objects.groups import KERN1_PREFIX, KERN2_PREFIX
 
 # - Init --------------------------------
-__version__ = '0.3.0'
+__version__ = '0.5.1'
+
+# Conflict policies for bulk loads (Kerning.update_from / Groups.update_from):
+#   replace - the value loaded last wins (add_pair semantics)
+#   keep    - the first value wins; existing pairs/groups are never changed
+#   add     - kern values are summed (Groups: 'merge' unites members)
+#   error   - a differing value raises ValueError
+KERN_POLICIES = ('replace', 'keep', 'add', 'error')
+
+# - Helpers -----------------------------
+def _kern_value(value):
+	return int(round(float(value)))
+
+def _kern_side(name, prefix):
+	'''DTL/FontLab @class tokens to UFO kern group names.'''
+	return prefix + name[1:] if name[:1] == '@' else name
 
 # - Classes -----------------------------
 @register_xml_class
@@ -49,7 +64,7 @@ class KernPair(Member, XMLSerializable):
 		second (str) : right glyph or kern2 group name
 		value (int)  : kern value in font units
 	'''
-	__slots__ = ('first', 'second', 'value', 'identifier', 'parent', 'lib')
+	__slots__ = ('first', 'second', 'value')
 
 	XML_TAG = 'pair'
 	XML_ATTRS = ['first', 'second', 'value']
@@ -98,22 +113,38 @@ class KernPair(Member, XMLSerializable):
 	def key(self):
 		return (self.first, self.second)
 
+	@classmethod
+	def _bind(cls, first, second, value):
+		'''Lightweight constructor for bulk loading: no kwargs processing.'''
+		pair = cls.__new__(cls)
+		pair._uid = pair.parent = pair.identifier = pair._lib = None
+		pair.first = first
+		pair.second = second
+		pair.value = value
+		return pair
+
 
 @register_xml_class
 class Kerning(Container, XMLSerializable):
 	'''Kerning table — flat list of kern pairs (UFO model).
 
 	Dict-like access: kerning[('A', 'V')] → kern value or None.
-	Class membership is resolved against Font.groups by the caller;
-	this object stores raw pairs only.
+	Pairs keep their insertion order (and XML order); a (first, second)
+	→ KernPair index makes pair access O(1). Class membership is resolved
+	by lookup() against a Groups object (usually Font.groups).
 
 	Usage:
 		kern = Kerning()
 		kern.add_pair('A', 'V', -50)
 		kern[('public.kern1.H', 'public.kern2.A')] = -30
 		kern.value('A', 'V')    # → -50
+		kern.lookup('N', 'A', font.groups)  # → -30 if N in kern1.H, A in kern2.A
+		kern.update_from([('A', 'W', -40), ('@T', 'o', -60)])	# bulk load
+
+	NOTE: Pairs are indexed by (first, second) when added. Change sides
+	through remove_pair/add_pair, not by editing KernPair.first/second.
 	'''
-	__slots__ = ('identifier', 'parent', 'lib')
+	__slots__ = ('_pair_index', '_lookup_cache')
 
 	XML_TAG = 'kerning'
 	XML_ATTRS = []
@@ -125,6 +156,8 @@ class Kerning(Container, XMLSerializable):
 	def __init__(self, data=None, **kwargs):
 		factory = kwargs.pop('default_factory', KernPair)
 		super(Kerning, self).__init__(data, default_factory=factory, **kwargs)
+		self._pair_index = None
+		self._lookup_cache = None
 
 	def __repr__(self):
 		return '<{}: {} pairs>'.format(self.__class__.__name__, len(self.data))
@@ -137,14 +170,55 @@ class Kerning(Container, XMLSerializable):
 
 	def __setitem__(self, key, value):
 		if isinstance(key, tuple):
-			first, second = key
-			entry = self.get_pair(first, second)
-			if entry is not None:
-				entry.value = int(value)
-			else:
-				self.add_pair(first, second, value)
+			self.add_pair(key[0], key[1], value)
 		else:
 			super(Kerning, self).__setitem__(key, value)
+			self._invalidate()
+
+	def __delitem__(self, i):
+		super(Kerning, self).__delitem__(i)
+		self._invalidate()
+
+	# -- Index --------------------------
+	def _invalidate(self):
+		self._pair_index = None
+		self._lookup_cache = None
+
+	def _index(self):
+		'''(first, second) → KernPair, built on demand. Rebuilt if the
+		backing list was replaced or resized behind our back. Duplicate
+		keys resolve to the first pair, as the former linear scan did.
+		'''
+		cache = self._pair_index
+
+		if cache is None or cache[0] is not self.data or cache[1] != len(self.data):
+			index = {}
+
+			for pair in self.data:
+				index.setdefault((pair.first, pair.second), pair)
+
+			cache = self._pair_index = (self.data, len(self.data), index)
+			self._lookup_cache = None
+
+		return cache[2]
+
+	# -- Container overrides ------------
+	def append(self, item):
+		super(Kerning, self).append(item)
+		self._invalidate()
+
+	def insert(self, i, item):
+		super(Kerning, self).insert(i, item)
+		self._invalidate()
+
+	def pop(self, i=-1):
+		result = super(Kerning, self).pop(i)
+		self._invalidate()
+		return result
+
+	def remove(self, item):
+		super(Kerning, self).remove(item)
+		self._invalidate()
 
 	# -- Properties ---------------------
 	@property
@@ -154,25 +228,165 @@ class Kerning(Container, XMLSerializable):
 	# -- Pair management ----------------
 	def add_pair(self, first, second, value):
 		'''Add or overwrite a kern pair.'''
-		existing = self.get_pair(first, second)
+		index = self._index()
+		existing = index.get((first, second))
+
 		if existing is not None:
 			existing.value = int(value)
-		else:
-			self.data.append(KernPair(first, second, int(value)))
+			return
+
+		pair = KernPair(first, second, int(value))
+		self.data.append(pair)
+		index[pair.key] = pair
+		self._pair_index = (self.data, len(self.data), index)
+		self._lookup_cache = None
+
+	def update_from(self, iterable, policy='replace'):
+		'''Bulk load kern pairs, streamed: items are consumed one at a time
+		and go straight into the pair index, so memory is bounded by the
+		table itself. Accepts parser output and dict items alike:
+			(first, second, value)    KRNparser, AFM KPX rows
+			((first, second), value)  kerning_dict.items() (UFO)
+		Pair sides written as @NAME (DTL / FontLab classes) become
+		public.kern1.NAME on the first and public.kern2.NAME on the second
+		side - see Groups.update_from for loading the class definitions.
+		Items without a value (KRN pair lists for proofing) are skipped.
+
+		policy decides between a loaded value and one already present,
+		either in the table or earlier in the stream: see KERN_POLICIES.
+
+		Returns {'added': n, 'updated': n, 'kept': n, 'skipped': n}.
+
+		Example:
+			with KRNparser('Font.krn') as pairs:
+				font.kerning.update_from(pairs, policy='keep')
+		'''
+		if policy not in KERN_POLICIES:
+			raise ValueError('Unknown kerning policy: {} (use one of {})'.format(policy, ', '.join(KERN_POLICIES)))
+
+		index = self._index()
+		data = self.data
+		bind = KernPair._bind
+		added = updated = kept = skipped = 0
+
+		try:
+			for item in iterable:
+				if len(item) == 2 and isinstance(item[0], tuple):
+					(first, second), value = item
+
+				elif len(item) >= 3:
+					first, second, value = item[:3]
+
+				else:
+					skipped += 1
+					continue
+
+				if first[:1] == '@':
+					first = _kern_side(first, KERN1_PREFIX)
+
+				if second[:1] == '@':
+					second = _kern_side(second, KERN2_PREFIX)
+
+				value = _kern_value(value)
+				key = (first, second)
+				pair = index.get(key)
+
+				if pair is None:
+					pair = index[key] = bind(first, second, value)
+					data.append(pair)
+					added += 1
+
+				elif pair.value == value or policy == 'keep':
+					kept += 1
+
+				elif policy == 'replace':
+					pair.value = value
+					updated += 1
+
+				elif policy == 'add':
+					pair.value += value
+					updated += 1
+
+				else:
+					raise ValueError('Conflicting kern pair {} + {}: {} vs {}'.format(first, second, pair.value, value))
+
+		finally:
+			# - Keep the index valid for whatever was loaded, even on errors
+			self._pair_index = (data, len(data), index)
+			self._lookup_cache = None
+
+		return {'added': added, 'updated': updated, 'kept': kept, 'skipped': skipped}
 
 	def remove_pair(self, first, second):
 		'''Remove a kern pair by first/second. No-op if not found.'''
+		if (first, second) not in self._index():
+			return
+
 		self.data = [p for p in self.data
 		             if not (p.first == first and p.second == second)]
+		self._invalidate()
 
 	def get_pair(self, first, second):
 		'''Return KernPair for (first, second), or None.'''
-		for pair in self.data:
-			if pair.first == first and pair.second == second:
-				return pair
-		return None
+		return self._index().get((first, second))
 
 	def value(self, first, second):
 		'''Return kern value for (first, second), or None.'''
 		pair = self.get_pair(first, second)
 		return pair.value if pair else None
+
+	# -- Class-aware lookup -------------
+	def lookup_pair(self, left, right, groups=None):
+		'''Resolve the KernPair that applies between two glyphs, or None.
+
+		Precedence follows UFO: glyph + glyph, glyph + kern2 class,
+		kern1 class + glyph, kern1 class + kern2 class. Classes are taken
+		from groups (public.kern1.* / public.kern2.* membership).
+
+		Results are cached until pairs are added or removed, or groups
+		change; value edits on existing pairs are seen immediately.
+		'''
+		index = self._index()
+		cache = self._lookup_cache
+		version = groups.version if groups is not None else None
+
+		if cache is None or cache[0] is not groups or cache[1] != version:
+			cache = self._lookup_cache = (groups, version, {})
+
+		resolved = cache[2]
+		key = (left, right)
+
+		if key in resolved:
+			return resolved[key]
+
+		first_class = second_class = None
+
+		if groups is not None:
+			first_class = groups.kern1_of(left)
+			second_class = groups.kern2_of(right)
+		candidates = [key]
+
+		if second_class is not None:
+			candidates.append((left, second_class))
+
+		if first_class is not None:
+			candidates.append((first_class, right))
+
+			if second_class is not None:
+				candidates.append((first_class, second_class))
+
+		pair = None
+
+		for candidate in candidates:
+			pair = index.get(candidate)
+
+			if pair is not None:
+				break
+
+		resolved[key] = pair
+		return pair
+
+	def lookup(self, left, right, groups=None):
+		'''Resolved kern value between two glyphs (see lookup_pair), or None.'''
+		pair = self.lookup_pair(left, right, groups)
+		return pair.value if pair is not None else None
@@ -10,6 +10,7 @@
 
 # - Dependencies ------------------------
 import math
+import hashlib
 
 from typerig.core.objects.atom import Container
 from typerig.core.objects.array import PointArray
@@ -29,12 +30,15 @@ from typerig.core.func.math import slerp_angle, interpolate_directional
 from typerig.core.func.transform import adaptive_scale_directional, timer
 
 # - Init -------------------------------
-__version__ = '0.9.0'
+__version__ = '0.13.0'
+
+# Hobby knot parameters that shape the curve (see Layer.digest)
+_KNOT_PARAMS = ('segment_type', 'alpha', 'beta', 'dir_in', 'dir_out', 'fixed_bcp_out', 'fixed_bcp_in')
 
 # - Classes -----------------------------
 @register_xml_class
 class Layer(Container, XMLSerializable): 
-	__slots__ = ('name', 'stx', 'sty', 'transform', 'mark', 'advance_width', 'advance_height', 'anchors', 'guidelines', '_sdf',
+	__slots__ = ('name', 'stx', 'sty', 'transform', 'mark', 'advance_width', 'advance_height', 'anchors', 'guidelines', '_sdf', '_digest',
 	             '_scale_factors', '_scale_residual', '_scale_converged')
 
 	XML_TAG = 'layer'
@@ -53,7 +57,7 @@ class Layer(Container, XMLSerializable):
 
 		# - Metadata
 		if not kwargs.pop('proxy', False): # Initialize in proxy mode
-			self.name = kwargs.pop('name', hash(self))
+			self.name = kwargs.pop('name') if 'name' in kwargs else hash(self)
 			self.identifier = kwargs.pop('identifier', None)
 			self.mark = kwargs.pop('mark', 0)
 			self.advance_width = kwargs.pop('width', 0.)
@@ -61,8 +65,9 @@ class Layer(Container, XMLSerializable):
 			self.anchors = kwargs.pop('anchors', [])
 			self.guidelines = kwargs.pop('guidelines', [])
 
-		# - SDF cache (not serialized)
+		# - SDF cache and digest memo (not serialized)
 		self._sdf = None
+		self._digest = None
 
 		# - scale_with_axis diagnostics (not serialized; read by host panels
 		#   via getattr(layer, '_scale_converged', None))
@@ -146,6 +151,13 @@ class Layer(Container, XMLSerializable):
 		assert len(self.data) > 0, 'Cannot return bounds for <{}> with length {}'.format(self.__class__.__name__, len(self.data))
 		return Bounds.from_bounds([shape.bounds for shape in self.data])
 
+	@property
+	def version(self):
+		'''Modification token of the outlines: the Shape.version of every
+		shape, in order. Anchors, guidelines and metrics are not included.
+		'''
+		return tuple([shape.version for shape in self.data])
+
 	@property
 	def tight_bounds(self):
 		'''True (curve-accurate) bounding box — see Contour.tight_bounds.
@@ -541,6 +553,51 @@ class Layer(Container, XMLSerializable):
 	def is_compatible(self, other):
 		return self.signature == other.signature
 
+	def digest(self, precision=3):
+		'''Hex SHA-1 of the layer geometry in canonical form: name, advance
+		width and height, component names and transforms, then per shape
+		its contours - kind, closed flag, nodes (position, type) and hobby
+		knot parameters - and anchors sorted by name. Coordinates are
+		rounded to precision decimals, so layers that only differ in
+		int/float storage or float noise digest equally.
+		Selection, marks, guidelines and libs are not part of it.
+		The result is memoized until the layer changes (see Layer.version).
+		'''
+		key = (precision, self.version, self.name, self.advance_width, self.advance_height,
+			tuple([(shape.component, tuple(shape.transform)) for shape in self.data if shape.is_component]),
+			tuple([(anchor.name, anchor.x, anchor.y) for anchor in self.anchors]))
+
+		if self._digest is not None and self._digest[0] == key:
+			return self._digest[1]
+
+		# - One %-format per contour instead of a round() per coordinate
+		coord = ',%.{}f'.format(precision)
+		node_format = coord + coord + ',%s'
+		parts = [repr(str(self.name)), coord * 2 % (self.advance_width or 0, self.advance_height or 0)]
+
+		for shape in self.data:
+			if shape.is_component:
+				t = shape.transform
+				parts.append('|component' + repr(shape.component) + coord * 6 % tuple(t[i] for i in range(6)))
+				continue
+
+			parts.append('|shape')
+
+			for contour in shape.contours:
+				values = contour._node_values()
+				parts.append('|contour,{},{:d}'.format(contour.kind, bool(contour.closed)) + node_format * (len(values) // 3) % tuple(values))
+
+				if contour.is_hobby:
+					parts.extend('|knot' + repr(tuple([getattr(knot, attr, None) for attr in _KNOT_PARAMS])) for knot in contour.data)
+
+		for anchor in sorted(self.anchors, key=lambda anchor: (anchor.name or '', anchor.x, anchor.y)):
+			parts.append('|anchor' + repr(anchor.name or '') + coord * 2 % (anchor.x, anchor.y))
+
+		canonical = ''.join(parts).replace(coord % -0., coord % 0.)
+		result = hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+		self._digest = (key, result)
+		return result
+
 	def diff_compatibility(self, other):
 		'''Diagnose WHERE interpolation compatibility breaks against `other`.
 
@@ -594,7 +651,7 @@ class Layer(Container, XMLSerializable):
 		return '\n'.join(lines)
 
 	# - Hit testing -----------------------------
-	def contains_point(self, point, steps_per_segment=32):
+	def contains_point(self, point, steps_per_segment=32, tolerance=None):
 		'''Even-odd point-in-layer test across all contours.
 
 		A point is inside when it falls within an ODD number of contours —
@@ -606,11 +663,64 @@ class Layer(Container, XMLSerializable):
 		Args:
 			point: Point, Node, or (x, y) tuple/list
 			steps_per_segment (int): polygonization density per contour
+			tolerance (float): adaptive polygonization, see Contour.sample()
 
 		Returns:
 			bool
 		'''
-		return sum(c.contains_point(point, steps_per_segment) for c in self.contours) % 2 == 1
+		return sum(c.contains_point(point, steps_per_segment, tolerance) for c in self.contours) % 2 == 1
+
+	def contains_points(self, points, steps_per_segment=32, tolerance=None):
+		'''Batch even-odd point-in-layer test, see contains_point.
+
+		Returns:
+			list of bool
+		'''
+		points = list(points)
+		hits = [0] * len(points)
+
+		for contour in self.contours:
+			for i, inside in enumerate(contour.contains_points(points, steps_per_segment, tolerance)):
+				hits[i] += inside
+
+		return [count % 2 == 1 for count in hits]
+
+	def intersections(self, tolerance=0.1):
+		'''All crossings between different contours of the layer.
+
+		Segment boxes of all contours go through one sweep-and-prune pass,
+		so only overlapping segment pairs from different contours reach the
+		curve clipper. Crossings within a contour: Contour.self_intersections().
+
+		Args:
+			tolerance (float): spatial precision of reported points
+
+		Returns:
+			list of (contour_i, seg_i, contour_j, seg_j, t_i, t_j, (x, y))
+			with contour_i < contour_j, indexing self.contours and their segments.
+		'''
+		from typerig.core.algo.intersect import curve_curve_intersections, box_overlap_pairs
+
+		owners, cubics, boxes = [], [], []
+
+		for idx, contour in enumerate(self.contours):
+			contour_cubics, contour_boxes = contour._segment_cubics()
+			owners.extend((idx, seg) for seg in range(len(contour_cubics)))
+			cubics.extend(contour_cubics)
+			boxes.extend(contour_boxes)
+
+		result = []
+
+		for a, b in box_overlap_pairs(boxes):
+			(contour_a, seg_a), (contour_b, seg_b) = owners[a], owners[b]
+
+			if contour_a == contour_b:
+				continue
+
+			for t_a, t_b, pt in curve_curve_intersections(cubics[a], cubics[b], tolerance):
+				result.append((contour_a, seg_a, contour_b, seg_b, t_a, t_b, pt))
+
+		return result
 
 	# - Transformation --------------------------
 	def apply_transform(self):
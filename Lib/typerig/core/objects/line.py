@@ -19,7 +19,7 @@ from typerig.core.objects.transform import Transform
 from typerig.core.objects.point import Point, Void
 
 # - Init -------------------------------
-__version__ = '0.29.0'
+__version__ = '0.30.0'
 
 # - Classes -----------------------------
 class Line(PointsArithmetic):
@@ -164,6 +164,14 @@ class Line(PointsArithmetic):
 		Providing API call similar to the one in cubicbezier.py'''
 		return 1 - distance/self.length	
 
+	def equidistant_samples(self, step, include_end=False):
+		'''Points evenly spaced along the line, about `step` apart.
+		Providing API call similar to the one in cubicbezier.py'''
+		x0, y0, x1, y1 = self.p0.x, self.p0.y, self.p1.x, self.p1.y
+		parts = max(1, int(self.length / step))
+		count = parts + 1 if include_end else parts
+		return [(x0 + (x1 - x0) * k / parts, y0 + (y1 - y0) * k / parts) for k in range(count)]
+
 	def solve_length(self, length, mode=0):
 		'''Find a indentical line with different length. Solve for anchored p0 (mode = 0), p1 (mode = 1) or center (mode = -1)'''
 		time = length/self.length
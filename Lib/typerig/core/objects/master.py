@@ -57,7 +57,7 @@ class Master(Member, XMLSerializable):
 		location (dict)  : {axis_name: value, ...}
 		is_default (bool): fallback master for sparse glyphs
 	'''
-	__slots__ = ('name', 'layer_name', 'location', 'is_default', 'identifier', 'parent', 'lib')
+	__slots__ = ('name', 'layer_name', 'location', 'is_default')
 
 	XML_TAG = 'master'
 	# location and is_default are handled in custom _to_xml_element / from_XML
@@ -127,7 +127,7 @@ class Masters(Container, XMLSerializable):
 	Container of Master objects. The first master marked is_default=True
 	is the fallback for sparse glyphs; if none is marked, first master wins.
 	'''
-	__slots__ = ('identifier', 'parent', 'lib')
+	__slots__ = ()
 
 	XML_TAG = 'masters'
 	XML_ATTRS = []
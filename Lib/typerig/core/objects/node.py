@@ -11,6 +11,7 @@
 # - Dependencies ------------------------
 import math, copy
 from collections import namedtuple
+from operator import attrgetter
 
 from typerig.core.func.geometry import ccw
 from typerig.core.func.math import ratfrac, randomize
@@ -22,13 +23,13 @@ from typerig.core.objects.cubicbezier import CubicBezier
 from typerig.core.objects.quadraticbezier import QuadraticBezier
 from typerig.core.objects.transform import Transform
 
-from typerig.core.fileio.xmlio import XMLSerializable, register_xml_class
+from typerig.core.fileio.xmlio import XMLSerializable, register_xml_class, _convert_xml_number, _convert_xml_token, _TOKEN_CACHE
 
 from typerig.core.func.utils import isMultiInstance
 from typerig.core.objects.atom import Member, Container
 
 # - Init -------------------------------
-__version__ = '0.7.0'
+__version__ = '0.10.2'
 
 node_types = {'on':'on', 'off':'off', 'curve':'curve', 'move':'move'}
 
@@ -43,7 +44,7 @@ DirectionalNode = namedtuple('DirectionalNode',	['x', 'y', 'angle_out', 'mag_out
 
 @register_xml_class
 class Node(Member, XMLSerializable): 
-	__slots__ = ('x', 'y', 'type', 'name', 'smooth', 'g2', 'selected', 'angle', 'transform', 'complex_math', 'weight')
+	__slots__ = ('_x', '_y', '_type', 'name', '_smooth', 'g2', 'selected', 'angle', '_transform', 'complex_math', '_weight')
 
 	XML_TAG = 'node'
 	XML_ATTRS = ['x', 'y', 'type', 'smooth']
@@ -84,9 +85,9 @@ class Node(Member, XMLSerializable):
 
 		# - Basic
 		self.angle = kwargs.pop('angle', 0)
-		self.transform = kwargs.pop('transform', Transform())
+		self._transform = kwargs.pop('transform', None)
 		self.complex_math = kwargs.pop('complex', True)
-		self.weight = Point(kwargs.pop('weight', (0.,0.)))
+		self._weight = kwargs.pop('weight', None)
 
 		# - Metadata
 		if not kwargs.pop('proxy', False): # Initialize in proxy mode
@@ -101,6 +102,81 @@ class Node(Member, XMLSerializable):
 	def __repr__(self):
 		return '<{}: x={}, y={}, type={}>'.format(self.__class__.__name__, self.x, self.y, self.type)
 
+	# -- Geometry -------------------------------
+	# Position, type, smooth and lib assignments mark the parent contour as
+	# changed (in place lib edits are not geometry); it takes
+	# a new stamp when next read (see Contour.version), so derived geometry
+	# (segments, bounds...) is recomputed after edits only. Nodes held by
+	# other containers have no stamp to clear. Every way of building a
+	# node sets parent first. Getters are C level attrgetters.
+	def _touch(self):
+		parent = self.parent
+
+		if parent is not None:
+			try:
+				parent._version = None
+
+			except AttributeError:	# parent is not a Contour
+				pass
+
+	def _set_x(self, value):
+		self._x = value
+		parent = self.parent
+
+		if parent is not None:
+			try:
+				parent._version = None
+
+			except AttributeError:	# parent is not a Contour
+				pass
+
+	def _set_y(self, value):
+		self._y = value
+		parent = self.parent
+
+		if parent is not None:
+			try:
+				parent._version = None
+
+			except AttributeError:	# parent is not a Contour
+				pass
+
+	def _set_type(self, value):
+		self._type = value
+		parent = self.parent
+
+		if parent is not None:
+			try:
+				parent._version = None
+
+			except AttributeError:	# parent is not a Contour
+				pass
+
+	def _set_smooth(self, value):
+		self._smooth = value
+		parent = self.parent
+
+		if parent is not None:
+			try:
+				parent._version = None
+
+			except AttributeError:	# parent is not a Contour
+				pass
+
+	x = property(attrgetter('_x'), _set_x)
+	y = property(attrgetter('_y'), _set_y)
+	type = property(attrgetter('_type'), _set_type)
+	smooth = property(attrgetter('_smooth'), _set_smooth)
+
+	@property
+	def lib(self):
+		return super(Node, self).lib
+
+	@lib.setter
+	def lib(self, other):
+		self._lib = other
+		self._touch()
+
 	# -- Properties -----------------------------
 	@property
 	def index(self):
@@ -124,9 +200,39 @@ class Node(Member, XMLSerializable):
 			self.x = float(other[0])
 			self.y = float(other[1])
 
+	@property
+	def transform(self):
+		# - Allocated on first access: most nodes never carry a transform
+		if self._transform is None:
+			self._transform = Transform()
+
+		return self._transform
+
+	@transform.setter
+	def transform(self, other):
+		self._transform = other
+
+	@property
+	def weight(self):
+		# - Allocated on first access: stem weights are set by a few tools only
+		if self._weight is None:
+			self._weight = Point(0., 0.)
+
+		elif not isinstance(self._weight, Point):
+			self._weight = Point(self._weight)
+
+		return self._weight
+
+	@weight.setter
+	def weight(self, other):
+		self._weight = other
+
 	@property
 	def point(self):
-		return Point(self.x, self.y, angle=self.angle, transform=self.transform, complex=self.complex_math)
+		if self._transform is None:
+			return Point(self.x, self.y, angle=self.angle, complex=self.complex_math)
+
+		return Point(self.x, self.y, angle=self.angle, transform=self._transform, complex=self.complex_math)
 
 	@point.setter
 	def point(self, other):
@@ -171,25 +277,29 @@ class Node(Member, XMLSerializable):
 
 	@property
 	def segment_nodes(self):
-		for segment in self.parent.node_segments:
-			if self in segment[:1]: return segment
-		return
+		'''Nodes of the segment starting at this node: [on, (off...), on].
+		None if the node starts no segment (off-curve nodes, open ends).
+		'''
+		run = self.parent._segment_run(self)
+		return run[:] if run is not None else None
 	
 	@property
 	def segment(self):
-		for node_seg in self.parent.node_segments:
-			if self in node_seg[:1]:
-				points = [n.point for n in node_seg]
-				num = len(node_seg)
-
-				if num == 2:
-					return Line(*points)
-				elif num == 4 and node_seg[1].type == node_types['curve']:
-					return CubicBezier(*points)
-				elif num == 3:
-					return QuadraticBezier(*points)
-				# Complex TT: not directly representable as single segment
-				return None
+		node_seg = self.parent._segment_run(self)
+
+		if node_seg is None:
+			return None
+
+		points = [n.point for n in node_seg]
+		num = len(node_seg)
+
+		if num == 2:
+			return Line(*points)
+		elif num == 4 and node_seg[1].type == node_types['curve']:
+			return CubicBezier(*points)
+		elif num == 3:
+			return QuadraticBezier(*points)
+		# Complex TT: not directly representable as single segment
 		return None
 
 	@property
@@ -732,6 +842,22 @@ class Node(Member, XMLSerializable):
 				identifier=None
 			)
 
+	@classmethod
+	def from_XML(cls, element):
+		'''Parse a <node> element. Plain nodes - the bulk of every glyph
+		file - are built in one attribute pass without going through
+		__init__; subclasses and nodes carrying a <lib> take the generic
+		XMLSerializable path. Both give the same node.
+		'''
+		if isinstance(element, str):
+			from xml.etree import ElementTree as ET
+			element = ET.fromstring(element)
+
+		if cls is not Node or len(element):
+			return super(Node, cls).from_XML(element)
+
+		return _node_from_element(element)
+
 	@classmethod
 	def from_tuple(cls, coords, **kwargs):
 		'''Create Node from tuple/list of coordinates.'''
@@ -743,6 +869,59 @@ class Node(Member, XMLSerializable):
 		return cls(other.x, other.y, **kwargs)
 
 
+# - Functions ---------------------------
+def _node_from_element(element, _tokens=_TOKEN_CACHE):
+	'''Plain <node> element (no children) to Node. Sets the same slots,
+	to the same values, as Node(**attrs) does in the generic reader.'''
+	get = element.get
+	raw_x, raw_y, raw_type, raw_smooth = get('x'), get('y'), get('type'), get('smooth')
+
+	# - Common case inline: numeric literals, type/smooth already seen
+	try:
+		x = float(raw_x) if '.' in raw_x else int(raw_x)
+		y = float(raw_y) if '.' in raw_y else int(raw_y)
+		node_type = _tokens[raw_type]
+		smooth = _tokens[raw_smooth]
+
+	except (TypeError, ValueError, KeyError):
+		x = _convert_xml_number(raw_x) if raw_x is not None else 0.
+		y = _convert_xml_number(raw_y) if raw_y is not None else 0.
+		node_type = _convert_xml_token(raw_type) if raw_type is not None else node_types['on']
+		smooth = _convert_xml_token(raw_smooth) if raw_smooth is not None else False
+
+	return _node_from_values(x, y, node_type, smooth)
+
+def _node_from_values(x, y, node_type, smooth, parent=None, _new=Node.__new__):
+	'''Node with the given position, type and smoothness; everything else
+	at the defaults of Node.__init__. Shared by the fast readers.'''
+	node = _new(Node)
+	node._uid = None
+	node.parent = parent
+	node._lib = None
+	node._x = x
+	node._y = y
+	node.angle = 0
+	node._transform = None
+	node.complex_math = True
+	node._weight = None
+	node._type = node_type
+	node.name = ''
+	node.identifier = False
+	node._smooth = smooth
+	node.selected = False
+	node.g2 = False
+	return node
+
+def _node_values(node):
+	'''(x, y, type, smooth, parent) if the node is exactly what
+	_node_from_values would rebuild from them, else None.'''
+	if (type(node) is Node and node._uid is None and node._lib is None and node.angle == 0
+			and node._transform is None and node.complex_math is True and node._weight is None
+			and node.name == '' and node.identifier is False and node.selected is False and node.g2 is False):
+		return (node.x, node.y, node.type, node.smooth, node.parent)
+
+	return None
+
 if __name__ == '__main__':
 	# - Test initialization, normal and from VFJ
 	n0 = Node.from_VFJ('10 20 s g2')
@@ -0,0 +1,791 @@
+# MODULE: TypeRig / Core / Packed Contour (Object)
+# NOTE: Struct-of-arrays (array backed) contour representation
+# -----------------------------------------------------------
+# (C) Vassil Kateliev, 2026 		(http://www.kateliev.com)
+# (C) Karandash Type Foundry 		(http://www.karandash.eu)
+#------------------------------------------------------------
+# www.typerig.com
+
+# No warranties. By using this you agree
+# that you use it at your own risk!
+
+'''
+HELP:
+PackedContour keeps node coordinates, types and smooth flags in parallel
+contiguous buffers (array('d') / array('b')) instead of one Node object per
+point. Node objects are thin NodeView instances created on first access and
+memoized per position, so node identity is stable while the contour lives.
+
+Bulk readers (bounds, point_array, segments, signed area, XML) work on the
+buffers directly and never materialize nodes. Everything else goes through
+the regular Contour code path on NodeViews.
+
+Rules of the road:
+- A NodeView inserted into a packed contour is moved into its buffers
+  (identity preserved). Plain Node objects are kept as they are and their
+  values are synced into the buffers before every bulk read.
+- Removed / replaced views are detached into a private one-node store,
+  so a popped node keeps its values.
+- Hobby contours are not packed; PackedContour.from_XML returns a plain
+  Contour for them.
+
+Usage:
+	packed = contour.pack()				# or PackedContour.from_XML(xml)
+	plain = packed.unpack()
+	pack_contours(glyph)				# in-place, Glyph / Layer / Shape
+'''
+
+# - Dependencies ------------------------
+import copy
+from array import array
+from collections.abc import MutableSequence
+from xml.etree import ElementTree as ET
+
+from typerig.core.objects.point import Point
+from typerig.core.objects.array import PointArray
+from typerig.core.objects.utils import Bounds
+from typerig.core.objects.node import Node, node_types
+from typerig.core.objects.contour import Contour, CONTOUR_KIND_BEZIER, CONTOUR_KIND_HOBBY
+
+from typerig.core.fileio.xmlio import XMLSerializable, _convert_xml_attr, _format_xml_attr, _parse_plist_dict
+
+# - Init -------------------------------
+__version__ = '0.2.2'
+
+# Node type <-> buffer code. Unknown types get a code on first use.
+_type_names = ['on', 'curve', 'off', 'move']
+_type_codes = {name: code for code, name in enumerate(_type_names)}
+
+def _type_code(name):
+	code = _type_codes.get(name)
+
+	if code is None:
+		code = len(_type_names)
+		_type_names.append(name)
+		_type_codes[name] = code
+
+	return code
+
+_CODE_ON = _type_codes[node_types['on']]
+_CODE_CURVE = _type_codes[node_types['curve']]
+_CODE_OFF = _type_codes[node_types['off']]
+
+# Per-node attributes that live outside the buffers
+_node_meta = ('name', 'identifier', 'selected', 'g2', 'angle', 'complex_math')
+
+# Pickled per-view state
+_view_state = _node_meta + ('_uid', 'parent', '_lib', '_transform', '_weight', '_store', '_i')
+
+def _has_metadata(node):
+	'''True if node carries anything besides x, y, type and smooth.'''
+	# - Reads the lazy slots directly, so probing allocates nothing
+	return bool(node.name or node.identifier or node.selected or node.g2 or node._lib or node.angle
+				or (node._weight is not None and (node.weight.x or node.weight.y)))
+
+# - Classes -----------------------------
+class NodeView(Node):
+	'''Node whose x, y, type and smooth live in a NodeStore buffer.
+	Behaves as a regular Node; all other attributes are per-view.
+	'''
+	__slots__ = ('_store', '_i')
+
+	def __init__(self, *args, **kwargs):
+		store = NodeStore()
+		store._append_values(0., 0., _CODE_ON, False)
+		store.views[0] = self
+		self._store, self._i = store, 0
+
+		super(NodeView, self).__init__(*args, **kwargs)
+
+	@classmethod
+	def _bind(cls, store, i, parent=None):
+		'''Lightweight constructor: view on store[i] with default metadata.'''
+		view = cls.__new__(cls)
+		view._store, view._i = store, i
+		view._init_metadata(parent)
+		return view
+
+	def _init_metadata(self, parent=None):
+		# - Same defaults as Node.__init__, without touching the buffers
+		self._uid = None
+		self.parent = parent
+		self._lib = None
+		self.angle = 0
+		self._transform = None
+		self.complex_math = True
+		self._weight = None
+		self.name = ''
+		self.identifier = False
+		self.selected = False
+		self.g2 = False
+
+	# -- Buffered attributes --------------------
+	@property
+	def x(self):
+		return self._store.x[self._i]
+
+	@x.setter
+	def x(self, value):
+		self._store.x[self._i] = value
+		self._touch()
+
+	@property
+	def y(self):
+		return self._store.y[self._i]
+
+	@y.setter
+	def y(self, value):
+		self._store.y[self._i] = value
+		self._touch()
+
+	@property
+	def type(self):
+		return _type_names[self._store.types[self._i]]
+
+	@type.setter
+	def type(self, value):
+		self._store.types[self._i] = _type_code(value)
+		self._touch()
+
+	@property
+	def smooth(self):
+		return bool(self._store.smooth[self._i])
+
+	@smooth.setter
+	def smooth(self, value):
+		self._store.smooth[self._i] = bool(value)
+		self._touch()
+
+	# -- Internals ------------------------------
+	def _copy_metadata(self, other, deep=False, memo=None):
+		for attr in _node_meta:
+			setattr(self, attr, getattr(other, attr))
+
+		self._lib = copy.deepcopy(other._lib, memo) if deep else other._lib
+		self._transform = copy.deepcopy(other._transform, memo) if deep else other._transform
+		self._weight = copy.deepcopy(other._weight, memo) if deep else other._weight
+		self._uid = other._uid
+
+	def _detach(self):
+		'''Move this view into a private one-node store.'''
+		store = NodeStore()
+		store._append_values(self.x, self.y, self._store.types[self._i], self._store.smooth[self._i])
+		store.views[0] = self
+		self._store, self._i = store, 0
+
+	def __getstate__(self):
+		# - Buffered attributes travel with the store, not with the view
+		return {attr: getattr(self, attr) for attr in _view_state}
+
+	def __setstate__(self, state):
+		for attr, value in state.items():
+			setattr(self, attr, value)
+
+		self._uid = None
+
+	def __deepcopy__(self, memo):
+		clone = self.__class__._bind(None, 0)
+		clone._store = NodeStore()
+		clone._store._append_values(self.x, self.y, self._store.types[self._i], self._store.smooth[self._i])
+		clone._store.views[0] = clone
+		clone._copy_metadata(self, True, memo)
+		clone._uid = None
+		memo[id(self)] = clone
+		return clone
+
+class NodeStore(MutableSequence):
+	'''Parallel node buffers of a PackedContour.
+	Indexing returns memoized NodeView objects; see module HELP.
+	'''
+	__slots__ = ('x', 'y', 'types', 'smooth', 'views', 'owner', '_has_foreign')
+
+	def __init__(self, x=None, y=None, types=None, smooth=None):
+		self.x = array('d', x or [])
+		self.y = array('d', y or [])
+		self.types = array('b', types or [])
+		self.smooth = array('b', smooth or [])
+		self.views = [None] * len(self.x)
+		self.owner = None
+		self._has_foreign = False
+
+	@classmethod
+	def from_nodes(cls, nodes):
+		'''Build a store from Nodes, Points or (x, y) pairs, adopting
+		NodeViews and plain Nodes by identity.
+		'''
+		store = cls()
+
+		for item in nodes:
+			store._append_values(0., 0., _CODE_ON, False)
+			store._put(len(store.x) - 1, item)
+
+		return store
+
+	@classmethod
+	def from_buffers(cls, x, y, types, smooth):
+		'''Build a store from raw machine-order buffers (bytes-like:
+		doubles for x / y, signed bytes for type codes and smooth flags).
+		Each buffer is copied in one step, no per-node work.
+		'''
+		store = cls()
+		store.x.frombytes(x)
+		store.y.frombytes(y)
+		store.types.frombytes(types)
+		store.smooth.frombytes(smooth)
+		store.views = [None] * len(store.x)
+		return store
+
+	# -- Internals ------------------------------
+	def __len__(self):
+		return len(self.x)
+
+	def __repr__(self):
+		return '<{}: {} nodes>'.format(self.__class__.__name__, len(self.x))
+
+	def __getitem__(self, i):
+		if isinstance(i, slice):
+			return [self[j] for j in range(*i.indices(len(self.x)))]
+
+		view = self.views[i]
+
+		if view is None:
+			if i < 0: i += len(self.x)
+			view = NodeView._bind(self, i, self.owner)
+			self.views[i] = view
+
+		return view
+
+	def __setitem__(self, i, item):
+		if isinstance(i, slice):
+			indices = range(*i.indices(len(self.x)))
+
+			if i.step in (None, 1):
+				for j in reversed(indices):
+					del self[j]
+
+				for offset, value in enumerate(item):
+					self.insert(indices.start + offset, value)
+			else:
+				for j, value in zip(indices, item):
+					self[j] = value
+			return
+
+		if i < 0: i += len(self.x)
+		old = self.views[i]
+
+		if old is not None and old is not item and self._is_native(old, i):
+			old._detach()
+
+		self.views[i] = None
+		self._put(i, item)
+
+	def __delitem__(self, i):
+		if isinstance(i, slice):
+			for j in sorted(range(*i.indices(len(self.x))), reverse=True):
+				del self[j]
+			return
+
+		if i < 0: i += len(self.x)
+		old = self.views[i]
+
+		if old is not None and self._is_native(old, i):
+			old._detach()
+
+		del self.x[i], self.y[i], self.types[i], self.smooth[i], self.views[i]
+		self._renumber(i)
+
+	def __iter__(self):
+		for i in range(len(self.x)):
+			yield self[i]
+
+	def __contains__(self, item):
+		return any(view is item for view in self.views)
+
+	def __add__(self, other):
+		return list(self) + list(other)
+
+	def __radd__(self, other):
+		return list(other) + list(self)
+
+	def __deepcopy__(self, memo):
+		self.sync()
+		clone = self.__class__(self.x, self.y, self.types, self.smooth)
+		memo[id(self)] = clone
+
+		for i, view in enumerate(self.views):
+			if view is None:
+				continue
+
+			if self._is_native(view, i):
+				if not _has_metadata(view):
+					continue
+
+				new_view = NodeView._bind(clone, i)
+				new_view._copy_metadata(view, True, memo)
+				new_view._uid = None
+				memo[id(view)] = new_view
+			else:
+				new_view = copy.deepcopy(view, memo)
+				clone._has_foreign = True
+
+			clone.views[i] = new_view
+
+		return clone
+
+	# -- Helpers --------------------------------
+	def _is_native(self, view, i):
+		return isinstance(view, NodeView) and view._store is self and view._i == i
+
+	def _append_values(self, x, y, type_code, smooth):
+		self.x.append(x)
+		self.y.append(y)
+		self.types.append(type_code)
+		self.smooth.append(smooth)
+		self.views.append(None)
+
+	def _renumber(self, start):
+		'''Refresh buffer positions of native views from start onward.'''
+		views = self.views
+
+		for j in range(start, len(views)):
+			view = views[j]
+
+			if isinstance(view, NodeView) and view._store is self:
+				view._i = j
+
+	def _put(self, i, item):
+		'''Place item at (already allocated) position i.'''
+		if isinstance(item, NodeView):
+			source, k = item._store, item._i
+			self.x[i], self.y[i] = source.x[k], source.y[k]
+			self.types[i], self.smooth[i] = source.types[k], source.smooth[k]
+
+			if source.views[k] is item and (source is not self or k != i):
+				source.views[k] = None
+
+			item._store, item._i = self, i
+			self.views[i] = item
+
+		elif isinstance(item, Node):
+			self.x[i], self.y[i] = item.x, item.y
+			self.types[i] = _type_code(getattr(item, 'type', node_types['on']))
+			self.smooth[i] = bool(getattr(item, 'smooth', False))
+			self.views[i] = item
+			self._has_foreign = True
+
+		else:
+			x, y = item.tuple if isinstance(item, Point) else item
+			self.x[i], self.y[i] = x, y
+
+	def sync(self):
+		'''Copy values of plain (foreign) Node objects into the buffers.'''
+		if not self._has_foreign:
+			return
+
+		found = False
+
+		for i, view in enumerate(self.views):
+			if view is not None and not isinstance(view, NodeView):
+				self.x[i], self.y[i] = view.x, view.y
+				self.types[i] = _type_code(getattr(view, 'type', node_types['on']))
+				self.smooth[i] = bool(getattr(view, 'smooth', False))
+				found = True
+
+		self._has_foreign = found
+
+	# -- Sequence API ---------------------------
+	def insert(self, i, item):
+		n = len(self.x)
+		if i < 0: i = max(0, i + n)
+		i = min(i, n)
+
+		self.x.insert(i, 0.)
+		self.y.insert(i, 0.)
+		self.types.insert(i, _CODE_ON)
+		self.smooth.insert(i, False)
+		self.views.insert(i, None)
+		self._renumber(i + 1)
+		self._put(i, item)
+
+	def append(self, item):
+		self._append_values(0., 0., _CODE_ON, False)
+		self._put(len(self.x) - 1, item)
+
+	def index(self, item, *args):
+		if isinstance(item, NodeView) and item._store is self and self.views[item._i] is item:
+			return item._i
+
+		for i, view in enumerate(self.views):
+			if view is item:
+				return i
+
+		raise ValueError('{} is not in {}'.format(item, self.__class__.__name__))
+
+	def reverse(self):
+		for buffer in (self.x, self.y, self.types, self.smooth):
+			buffer.reverse()
+
+		self.views.reverse()
+		self._renumber(0)
+
+class PackedContour(Contour):
+	'''Contour whose nodes are held in a NodeStore (see module HELP).
+	Drop-in for bezier Contours; serializes to the same <contour> XML.
+	'''
+	__slots__ = ('_store',)
+
+	# Nodes are written by _to_xml_element straight from the buffers
+	XML_CHILDREN = {}
+
+	def __init__(self, nodes=None, **kwargs):
+		if kwargs.get('kind', CONTOUR_KIND_BEZIER) != CONTOUR_KIND_BEZIER or 'knots' in kwargs:
+			raise ValueError('{}: only bezier contours can be packed'.format(self.__class__.__name__))
+
+		has_winding = 'clockwise' in kwargs
+		is_proxy = kwargs.get('proxy', False)
+
+		super(PackedContour, self).__init__(None, **kwargs)
+
+		if nodes is not None:
+			self.data = nodes
+
+			if not has_winding and not is_proxy:
+				self.clockwise = self.get_winding()
+
+	# -- Storage --------------------------------
+	@property
+	def data(self):
+		return self._store
+
+	@data.setter
+	def data(self, other):
+		if not isinstance(other, NodeStore):
+			other = NodeStore.from_nodes(other)
+
+		self._store = other
+		other.owner = self
+
+		for view in other.views:
+			if view is not None:
+				view.parent = self
+
+		self._index_cache = None
+		self.touch()
+
+	@property
+	def nodes(self):
+		return self._store
+
+	@nodes.setter
+	def nodes(self, other):
+		self.data = other.data if isinstance(other, Contour) else other
+
+	@property
+	def store(self):
+		'''The synced NodeStore: read-only access to the raw buffers.'''
+		self._store.sync()
+		return self._store
+
+	def index(self, item, *args):
+		if args:
+			return super(PackedContour, self).index(item, *args)
+
+		return self._store.index(item)
+
+	def _coerce(self, item):
+		if isinstance(item, Node):
+			item.parent = self
+
+		return item
+
+	def __getitem__(self, i):
+		return self._store[i]
+
+	def __setitem__(self, i, item):
+		self._store[i] = self._coerce(item)
+		self.touch()
+
+	# -- Conversion -----------------------------
+	@classmethod
+	def from_contour(cls, contour):
+		'''Compact copy of a bezier Contour. Nodes carrying metadata
+		(name, selection, lib, weights...) keep it on their views.
+		'''
+		store = NodeStore(
+			[node.x for node in contour.nodes],
+			[node.y for node in contour.nodes],
+			[_type_code(node.type) for node in contour.nodes],
+			[bool(node.smooth) for node in contour.nodes])
+
+		for i, node in enumerate(contour.nodes):
+			if _has_metadata(node):
+				view = NodeView._bind(store, i)
+				view._copy_metadata(node, True)
+				store.views[i] = view
+
+		return cls._copy_identifier(contour, cls(store, **cls._contour_attrs(contour)))
+
+	def unpack(self):
+		'''Regular Contour with one Node object per point.'''
+		nodes = []
+
+		for i, view in enumerate(self._store):
+			node = Node(view.x, view.y, type=view.type, smooth=view.smooth)
+
+			for attr in _node_meta:
+				setattr(node, attr, getattr(view, attr))
+
+			node._lib = copy.deepcopy(view._lib)
+
+			if view._weight is not None:
+				node.weight = Point(view.weight.x, view.weight.y)
+			nodes.append(node)
+
+		return self._copy_identifier(self, Contour(nodes, **self._contour_attrs(self)))
+
+	@staticmethod
+	def _contour_attrs(contour):
+		return {'name': contour.name, 'closed': contour.closed, 'clockwise': contour.clockwise,
+				'lib': copy.deepcopy(contour.lib), 'transform': copy.deepcopy(contour.transform)}
+
+	@staticmethod
+	def _copy_identifier(source, target):
+		identifier = getattr(source, 'identifier', None)
+
+		if identifier is not None:
+			target.identifier = identifier
+
+		return target
+
+	# -- Bulk readers ---------------------------
+	# Contour memoizes their results (see Contour.version)
+	def _bounds(self):
+		store = self.store
+		return Bounds(list(zip(store.x, store.y)))
+
+	@property
+	def point_array(self):
+		store = self.store
+		return PointArray([Point(x, y) for x, y in zip(store.x, store.y)])
+
+	@point_array.setter
+	def point_array(self, other):
+		store = self._store
+
+		if isinstance(other, PointArray) and len(other) == len(store):
+			if store._has_foreign:
+				for node, point in zip(store, other):
+					node.point = point
+				return
+
+			for i, point in enumerate(other):
+				store.x[i], store.y[i] = point.x, point.y
+
+			self.touch()
+
+	def _node_values(self):
+		store = self.store
+		values = [None] * (3 * len(store))
+		values[0::3] = store.x
+		values[1::3] = store.y
+		values[2::3] = [_type_names[code] for code in store.types]
+		return values
+
+	@property
+	def has_quadratic(self):
+		return _CODE_OFF in self.store.types
+
+	@property
+	def is_mixed(self):
+		types = self.store.types
+		return _CODE_CURVE in types and _CODE_OFF in types
+
+	def _signed_area(self, mode):
+		if mode not in ('on', 'knots'):
+			return super(PackedContour, self)._signed_area(mode)
+
+		store = self.store
+		pts = [(store.x[i], store.y[i]) for i in range(len(store)) if mode == 'knots' or store.types[i] == _CODE_ON]
+		n = len(pts)
+
+		if n < 3:
+			return 0.
+
+		area = 0.
+		for i in range(n):
+			j = (i + 1) % n
+			area += pts[i][0]*pts[j][1] - pts[j][0]*pts[i][1]
+
+		return area * 0.5
+
+	def _segment_runs(self):
+		'''Buffer index runs of each segment - same walk as get_segments.'''
+		store = self.store
+		count = len(store)
+		assert count > 1, 'Cannot return segments for contour with length {}'.format(count)
+
+		types = store.types
+		order = list(range(count)) + ([0] if self.closed else [])
+		runs, pos = [], 0
+
+		while pos < len(order):
+			run = [order[pos]]
+
+			for i in order[pos + 1:]:
+				run.append(i)
+				if types[i] == _CODE_ON: break
+
+			runs.append(run)
+
+			if len(run) == 1: break
+			pos += len(run) - 1
+
+		return runs[:-1]
+
+	def get_segments(self, get_point=False):
+		if not get_point:
+			return super(PackedContour, self).get_segments(get_point)
+
+		store = self._store
+		return [[Point(store.x[i], store.y[i]) for i in run] for run in self._segment_runs()]
+
+	def _segments(self):
+		store = self._store
+		obj_segments = []
+
+		for run in self._segment_runs():
+			points = [Point(store.x[i], store.y[i]) for i in run]
+			self._append_segment(obj_segments, points, _type_names[store.types[run[1]]])
+
+		return obj_segments
+
+	# -- Bulk writers ---------------------------
+	def shift(self, delta_x, delta_y):
+		store = self._store
+
+		if store._has_foreign:
+			return super(PackedContour, self).shift(delta_x, delta_y)
+
+		store.x = array('d', [x + delta_x for x in store.x])
+		store.y = array('d', [y + delta_y for y in store.y])
+		self.touch()
+
+	def apply_transform(self):
+		store = self._store
+
+		if store._has_foreign:
+			return super(PackedContour, self).apply_transform()
+
+		for i in range(len(store)):
+			store.x[i], store.y[i] = self.transform.applyTransformation(store.x[i], store.y[i])
+
+		self.touch()
+
+	# -- XML ------------------------------------
+	def _to_xml_element(self, exclude_attrs=None):
+		if exclude_attrs is None:
+			exclude_attrs = []
+
+		elem = super(PackedContour, self)._to_xml_element(exclude_attrs)
+		store = self.store
+		node_attrs = [attr for attr in Node.XML_ATTRS if attr not in exclude_attrs]
+
+		for i in range(len(store)):
+			view = store.views[i]
+
+			if view is not None and (view._lib or not store._is_native(view, i)):
+				elem.insert(i, view._to_xml_element(exclude_attrs))
+				continue
+
+			values = {'x': store.x[i], 'y': store.y[i], 'type': _type_names[store.types[i]], 'smooth': bool(store.smooth[i])}
+			elem.insert(i, ET.Element(Node.XML_TAG, {attr: _format_xml_attr(values[attr]) for attr in node_attrs}))
+
+		return elem
+
+	@classmethod
+	def from_XML(cls, element):
+		'''Parse a <contour> element straight into buffers.
+		Hobby contours fall back to a plain Contour.
+		'''
+		if isinstance(element, str):
+			element = ET.fromstring(element)
+
+		attrs = {}
+		for attr_name in cls.XML_ATTRS:
+			value = element.get(attr_name)
+			if value is not None:
+				attrs[attr_name] = _convert_xml_attr(value)
+
+		if attrs.get('kind', CONTOUR_KIND_BEZIER) == CONTOUR_KIND_HOBBY:
+			return Contour.from_XML(element)
+
+		store = NodeStore()
+
+		for node_elem in element.iterfind(Node.XML_TAG):
+			if node_elem.find('lib') is not None:
+				store.append(NodeView.from_XML(node_elem))
+				continue
+
+			get = node_elem.get
+			x, y = get('x'), get('y')
+			node_type, smooth = get('type'), get('smooth')
+
+			store._append_values(
+				float(_convert_xml_attr(x)) if x is not None else 0.,
+				float(_convert_xml_attr(y)) if y is not None else 0.,
+				_type_code(_convert_xml_attr(node_type)) if node_type is not None else _CODE_ON,
+				bool(_convert_xml_attr(smooth)) if smooth is not None else False)
+
+		lib_elem = element.find('lib')
+		if lib_elem is not None:
+			dict_elem = lib_elem.find('dict')
+			if dict_elem is not None:
+				lib_data = _parse_plist_dict(dict_elem)
+				if lib_data:
+					attrs['lib'] = lib_data
+
+		return cls(store, **attrs)
+
+# - Functions ---------------------------
+def pack_contours(obj):
+	'''Replace bezier Contours with PackedContours in place.
+	obj: Glyph, Layer or Shape. Returns the number of contours packed.
+	'''
+	if hasattr(obj, 'layers'):
+		return sum(pack_contours(layer) for layer in obj.layers)
+
+	if hasattr(obj, 'shapes'):
+		return sum(pack_contours(shape) for shape in obj.shapes)
+
+	count = 0
+
+	for i, contour in enumerate(obj.data):
+		if isinstance(contour, Contour) and not isinstance(contour, PackedContour) and contour.is_bezier and len(contour):
+			packed = contour.pack()
+			packed.parent = obj
+			obj.data[i] = packed
+			count += 1
+
+	obj._index_cache = None
+	return count
+
+def unpack_contours(obj):
+	'''Inverse of pack_contours. Returns the number of contours unpacked.'''
+	if hasattr(obj, 'layers'):
+		return sum(unpack_contours(layer) for layer in obj.layers)
+
+	if hasattr(obj, 'shapes'):
+		return sum(unpack_contours(shape) for shape in obj.shapes)
+
+	count = 0
+
+	for i, contour in enumerate(obj.data):
+		if isinstance(contour, PackedContour):
+			plain = contour.unpack()
+			plain.parent = obj
+			obj.data[i] = plain
+			count += 1
+
+	obj._index_cache = None
+	return count
+
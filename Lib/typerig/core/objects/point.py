@@ -15,7 +15,7 @@ from typerig.core.func.utils import isMultiInstance
 from typerig.core.objects.transform import Transform
 
 # - Init -------------------------------
-__version__ = '0.28.0'
+__version__ = '0.28.1'
 
 # - Classes -----------------------------
 class Point(object): 
@@ -35,7 +35,7 @@ class Point(object):
 			self.x, self.y = 0., 0.
 
 		self.angle = kwargs.get('angle', 0)
-		self.transform = kwargs.get('transform', Transform())
+		self.transform = kwargs['transform'] if 'transform' in kwargs else Transform()
 		self.complex_math = kwargs.get('complex', True)
 
 	# -- Operators
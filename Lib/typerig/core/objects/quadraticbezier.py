@@ -13,13 +13,14 @@ import math
 from typerig.core.func.math import linInterp as lerp
 from typerig.core.func.math import ratfrac
 from typerig.core.func.utils import isMultiInstance
+from typerig.core.func.geometry import arc_length_table, arc_length_solve
 from typerig.core.objects.atom import PointsArithmetic
 from typerig.core.objects.transform import Transform
 from typerig.core.objects.point import Point
 from typerig.core.objects.line import Line
 
 # - Init -------------------------------
-__version__ = '0.3.0'
+__version__ = '0.4.0'
 
 # - Classes -----------------------------
 class QuadraticBezier(PointsArithmetic):
@@ -449,7 +450,7 @@ class QuadraticBezier(PointsArithmetic):
 		return length * c
 
 	def get_arc_length(self):
-		return self._arc_length_between(0., 1.)
+		return self._arc_table()[0][1][-1]
 
 	def get_arc_length_by_parts(self, parts=50):
 		step = 1.0 / parts
@@ -462,42 +463,71 @@ class QuadraticBezier(PointsArithmetic):
 
 		return lengths
 
-	def solve_t_at_length(self, length, tolerance=1e-6, max_iterations=32):
-		'''Find t such that arc length from p0 to B(t) equals `length`.
-		Newton on F(t) = arclen(0,t) - length; F'(t) = |B'(t)|.
-		Clamps to [0,1]; falls back to bisection when Newton steps outside
-		the bracket or |F'| < 1e-12.'''
-		total = self._arc_length_between(0., 1.)
+	def _speed(self):
+		'''Speed |B'(t)| as a plain float function of t.'''
+		x0, y0, x1, y1, x2, y2 = self.p0.x, self.p0.y, self.p1.x, self.p1.y, self.p2.x, self.p2.y
+		bx, by = 2. * (x1 - x0), 2. * (y1 - y0)
+		ax, ay = 2. * (x2 - 2. * x1 + x0), 2. * (y2 - 2. * y1 + y0)
+		hypot = math.hypot
 
-		if length <= 0.:
-			return 0.
+		def speed(t):
+			return hypot(ax * t + bx, ay * t + by)
 
-		if length >= total:
-			return 1.
+		return speed
 
-		lo, hi = 0., 1.
-		t = length / total
+	def _arc_table(self, tolerance=1e-6):
+		'''Arc length table and speed function, kept on the curve until its
+		control points change.'''
+		key = (self.p0.x, self.p0.y, self.p1.x, self.p1.y, self.p2.x, self.p2.y, tolerance)
+		cache = getattr(self, '_arc_cache', None)
 
-		for _ in range(max_iterations):
-			err = self._arc_length_between(0., t) - length
+		if cache is None or cache[0] != key:
+			speed = self._speed()
+			cache = self._arc_cache = (key, arc_length_table(speed, tolerance), speed)
 
-			if abs(err) <= tolerance:
-				return t
+		return cache[1], cache[2]
 
-			if err > 0.:
-				hi = t
-			else:
-				lo = t
+	def get_arc_length_table(self, tolerance=1e-6):
+		'''Cumulative arc length table of the curve as (ts, lengths).
+		Built once by adaptive subdivision and reused until the curve changes.'''
+		ts, lengths = self._arc_table(tolerance)[0]
+		return ts[:], lengths[:]
 
-			deriv = self._arc_length_integrand(t)
+	def solve_t_at_length(self, length, tolerance=1e-6, max_iterations=32):
+		'''Find t such that arc length from p0 to B(t) equals `length`.
+		Binary search in the cached arc length table, then Newton on
+		F(t) = arclen(0,t) - length; F'(t) = |B'(t)|. Clamps to [0,1].'''
+		table, speed = self._arc_table()
+		return arc_length_solve(table, speed, length, tolerance=tolerance, max_iterations=max_iterations)[0]
+
+	def equidistant_samples(self, step, include_end=False):
+		'''Points evenly spaced by arc length, about `step` apart.
+		The curve is divided into as many equal arc length parts as fit
+		without going below step (at least one). The end point is left
+		out unless include_end, so consecutive segments chain without doubles.
+
+		Returns:
+			list of tuple(x, y)
+		'''
+		table, speed = self._arc_table()
+		total = table[1][-1]
+		parts = max(1, int(total / step)) if total > 0. else 1
+		count = parts + 1 if include_end else parts
+		x0, y0, x1, y1, x2, y2 = self.p0.x, self.p0.y, self.p1.x, self.p1.y, self.p2.x, self.p2.y
 
-			if deriv < 1e-12:
-				t = (lo + hi) * 0.5
-			else:
-				t_new = t - err / deriv
-				t = t_new if lo < t_new < hi else (lo + hi) * 0.5
+		def point(t):
+			r = 1. - t
+			a, b, c = r * r, 2. * r * t, t * t
+			return (a * x0 + b * x1 + c * x2, a * y0 + b * y1 + c * y2)
+
+		samples = []
+		i = 1
+
+		for k in range(count):
+			t, i = arc_length_solve(table, speed, total * k / parts, i)
+			samples.append(point(t))
 
-		return t
+		return samples
 
 	def get_bbox(self):
 		extremes = self.solve_extremes()
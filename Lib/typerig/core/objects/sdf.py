@@ -11,8 +11,10 @@
 # - Dependencies ------------------------
 import math
 
+from typerig.core.func.geometry import polygon_edge_table, point_in_edge_table
+
 # - Init -------------------------------
-__version__ = '0.1.0'
+__version__ = '0.2.0'
 
 # - Classes -----------------------------
 class SignedDistanceField(object):
@@ -48,6 +50,7 @@ class SignedDistanceField(object):
 
 		# Precompute polylines
 		self._polylines = [c.sample(steps_per_segment) for c in contours]
+		self._edges = None
 
 		# Compute bounds
 		all_pts = sum(self._polylines, [])
@@ -84,6 +87,7 @@ class SignedDistanceField(object):
 		instance.padding = padding
 		instance._steps = 0
 		instance._polylines = polylines
+		instance._edges = None
 
 		all_pts = sum(polylines, [])
 
@@ -252,20 +256,8 @@ class SignedDistanceField(object):
 		return min_d
 
 	def _is_inside(self, px, py):
-		'''Ray casting: odd crossings = inside.'''
-		crossings = 0
-
-		for poly in self._polylines:
-			n = len(poly)
-			for i in range(n):
-				ax, ay = poly[i]
-				bx, by = poly[(i + 1) % n]
-
-				if (ay <= py < by) or (by <= py < ay):
-					t = (py - ay) / (by - ay)
-					ix = ax + t * (bx - ax)
-
-					if px < ix:
-						crossings += 1
+		'''Ray casting over the polyline edge table: odd crossings = inside.'''
+		if self._edges is None:
+			self._edges = polygon_edge_table(self._polylines)
 
-		return (crossings % 2) == 1
+		return point_in_edge_table((px, py), self._edges)
@@ -24,7 +24,7 @@ from typerig.core.func.math import slerp_angle, interpolate_directional
 from typerig.core.objects.sdf import SignedDistanceField
 
 # - Init -------------------------------
-__version__ = '0.7.0'
+__version__ = '0.8.0'
 
 # - Classes -----------------------------
 @register_xml_class
@@ -118,6 +118,14 @@ class Shape(Container, XMLSerializable):
 	def signature(self):
 		return hash(tuple([node.type for node in self.nodes]))
 
+	@property
+	def version(self):
+		'''Modification token: the stamps of the contours, in order
+		(see Contour.version). Differs after any contour edit and after
+		contours are added, removed, replaced or reordered.
+		'''
+		return tuple([contour.version for contour in self.data])
+
 	# -- SDF -----------------------------
 	@property
 	def sdf(self):
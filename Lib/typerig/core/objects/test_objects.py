@@ -19,10 +19,14 @@ import sys
 __version__ = '0.2.0'
 
 # - Path bootstrap (repo checkout without install) ---
+# objects/array.py shadows the stdlib array module when run from this folder
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [path for path in sys.path if os.path.abspath(path or os.curdir) != _HERE]
+
 try:
 	import typerig.core
 except ImportError:
-	_LIB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+	_LIB_DIR = os.path.abspath(os.path.join(_HERE, '..', '..', '..'))
 	sys.path.insert(0, _LIB_DIR)
 
 from typerig.core.func.math import normalize2max, renormalize, isclose
@@ -659,8 +663,8 @@ check('F7 import typerig.core.objects.fontfile', hasattr(_fontfile_mod, 'FontFil
 
 from typerig.core.objects.font import Font, FontInfo, FontMetrics
 from typerig.core.objects.master import Master, Masters
-from typerig.core.objects.kern import Kerning
-from typerig.core.objects.groups import Groups
+from typerig.core.objects.kern import Kerning, KernPair
+from typerig.core.objects.groups import Group, Groups
 
 def _s3_glyph(name, dx=0):
 	sq = Contour([Node(0+dx,0,type='on'), Node(100+dx,0,type='on'),
@@ -720,6 +724,971 @@ check('F8 scale_with_axis duck-type', abs(_scaled.bounds.width - 300.) <= 1.0)
 check('F8 scale_with_axis converged', _scaled._scale_converged is True)
 
 
+# ===========================================================
+# - P1: cached member positions -----------------------------
+# ===========================================================
+
+_p1 = Contour([Node(float(i), 0., type='on') for i in range(8)], closed=True)
+_p1_nodes = list(_p1.nodes)
+check('P1 idx matches position', all(n.idx == i for i, n in enumerate(_p1_nodes)))
+check('P1 next / prev wrap', _p1_nodes[-1].next is _p1_nodes[0] and _p1_nodes[0].prev is _p1_nodes[-1])
+
+_p1.insert(2, Node(99., 99., type='on'))
+check('P1 idx after insert', _p1_nodes[2].idx == 3 and _p1[2].next is _p1_nodes[2])
+_p1.pop(0)
+check('P1 idx after pop', _p1_nodes[1].idx == 0 and _p1_nodes[-1].next is _p1_nodes[1])
+_p1.append(Node(50., 50., type='on'))
+check('P1 idx after append', _p1[-1].idx == len(_p1) - 1 and _p1_nodes[-1].idx == len(_p1) - 2)
+_p1.reverse()
+check('P1 idx after Contour.reverse', all(n.idx == i for i, n in enumerate(_p1.nodes)))
+_p1.nodes.insert(0, _p1.nodes.pop())	# direct list edit, bypasses Container
+check('P1 idx after raw data edit', all(n.idx == i for i, n in enumerate(_p1.nodes)))
+_p1_shape = Shape([_p1, Contour([Node(0, 0), Node(10, 0)])])
+check('P1 Contour.idx in Shape', _p1_shape[1].idx == 1 and _p1_shape[1].prev is _p1_shape[0])
+
+
+# ===========================================================
+# - P2: array-backed PackedContour --------------------------
+# ===========================================================
+import copy, pickle
+from typerig.core.objects.packedcontour import PackedContour, NodeView, pack_contours, unpack_contours
+
+_p2_plain = _s3_circle()
+_p2 = _p2_plain.pack()
+_p2_xml = _p2_plain.to_XML()
+check('P2 pack keeps XML', _p2.to_XML() == _p2_xml)
+check('P2 from_XML round-trip', PackedContour.from_XML(_p2_xml).to_XML() == _p2_xml)
+check('P2 nodes are views', isinstance(_p2.nodes[0], NodeView) and _p2.nodes[0] is _p2[0])
+check('P2 bounds / point_array', _p2.bounds.align_matrix == _p2_plain.bounds.align_matrix
+	and _p2.point_array.tuple == _p2_plain.point_array.tuple)
+check('P2 segments', [seg.tuple for seg in _p2.segments] == [seg.tuple for seg in _p2_plain.segments])
+check('P2 winding / area', _p2.clockwise == _p2_plain.clockwise and close(_p2.signed_area, _p2_plain.signed_area))
+
+_p2_edit, _p2_ref = _p2.clone(), _p2_plain.clone()
+for _c in (_p2_edit, _p2_ref):
+	_c[3].corner_mitre(10)
+	_c[0].insert_after(0.5)
+	_c.reverse()
+	_c.set_start(2)
+	_c.shift(5, -5)
+check('P2 node edits match plain contour', _p2_edit.to_XML() == _p2_ref.to_XML())
+
+_p2_node = _p2_edit[1]
+_p2_popped = _p2_edit.pop(1)
+check('P2 popped view detached', _p2_popped is _p2_node and _p2_popped.tuple == _p2_ref[1].tuple and _p2_popped.parent is None)
+_p2_foreign = Node(-50., -50., type='on')
+_p2_edit.insert(1, _p2_foreign)
+_p2_foreign.x = -60.
+check('P2 plain Node kept by identity', _p2_edit[1] is _p2_foreign and _p2_edit.index(_p2_foreign) == 1)
+check('P2 plain Node synced into buffers', _p2_edit.bounds.x == -60.)
+
+check('P2 deepcopy', copy.deepcopy(_p2).to_XML() == _p2_xml)
+check('P2 pickle', pickle.loads(pickle.dumps(_p2)).to_XML() == _p2_xml)
+
+_p2_glyph = Glyph([Layer([Shape([_s3_circle()])], name='A')], name='g')
+check('P2 pack_contours', pack_contours(_p2_glyph) == 1 and isinstance(_p2_glyph.layers[0].contours[0], PackedContour))
+check('P2 Shape.nodes over packed', len(_p2_glyph.layers[0].shapes[0].nodes) == 12)
+check('P2 unpack_contours', unpack_contours(_p2_glyph) == 1 and _p2_glyph.layers[0].contours[0].to_XML() == _p2_xml)
+
+
+# ===========================================================
+# - P3: lazy identity and per-node attributes --------------
+# ===========================================================
+_p3 = Node(10., 20.)
+check('P3 nothing allocated upfront', _p3._uid is None and _p3._lib is None and _p3._transform is None and _p3._weight is None)
+_p3_hash = hash(_p3)
+check('P3 uid created once, hash stable', _p3.uid is _p3.uid and hash(_p3) == _p3_hash and _p3 in {_p3})
+_p3.lib['note'] = 'x'
+check('P3 lib persists', _p3.lib == {'note': 'x'} and _p3.lib is _p3.lib)
+check('P3 transform / weight defaults', _p3.transform.applyTransformation(1., 2.) == (1., 2.) and _p3.weight.tuple == (0., 0.))
+_p3.weight.x = 12.
+check('P3 weight edits persist', Node(0., 0., weight=(3., 4.)).weight.tuple == (3., 4.) and _p3.weight.x == 12.)
+check('P3 slotted, no __dict__', not hasattr(_p3, '__dict__') and not hasattr(Contour(), '__dict__'))
+check('P3 point without transform', Node(1., 2.).point.tuple == (1., 2.) and Node(1., 2.)._transform is None)
+_p3_clone = _p3.clone()
+check('P3 clone copies lib and weight', _p3_clone.lib == _p3.lib and _p3_clone.lib is not _p3.lib and _p3_clone.weight.x == 12.)
+_p3_unread = Contour([Node(0., 0.), Node(5., 5.)])
+_p3_read = Contour([Node(0., 0.), Node(5., 5.)])
+_p3_read.uid, _p3_read[0].uid
+check('P3 clones get a fresh uid whether or not it was read', all(clone._uid is None and clone[0]._uid is None
+	for clone in (_p3_unread.clone(), _p3_read.clone(), copy.deepcopy(_p3_read)))
+	and copy.copy(_p3_read)._uid is None and _p3_read.clone().uid != _p3_read.uid and _p3.clone().uid != _p3.uid)
+check('P3 lib only serialized when set', '<lib>' not in Node(1., 2.).to_XML() and Node(1., 2.)._lib is None)
+_p3_xml = Node(1., 2., lib={'k': 1}).to_XML()
+check('P3 lib round-trip', Node.from_XML(_p3_xml).lib == {'k': 1})
+
+
+# ===========================================================
+# - P4: incremental glyph-name index ------------------------
+# ===========================================================
+def _p4_consistent(font):
+	expected = {}
+	for i, g in enumerate(font.data):
+		expected[g.name] = i
+	return font._name_index == expected
+
+_p4 = Font([Glyph(name=n) for n in ('a', 'b', 'c')])
+_p4.append(Glyph(name='d'))
+_p4.insert(1, Glyph(name='x'))
+_p4.insert(-1, Glyph(name='y'))
+check('P4 append / insert', _p4.glyph_names == ['a', 'x', 'b', 'c', 'y', 'd'] and _p4_consistent(_p4))
+_p4.pop(1)
+_p4.pop()
+check('P4 pop', _p4.glyph_names == ['a', 'b', 'c', 'y'] and _p4_consistent(_p4) and 'd' not in _p4)
+_p4.extend([Glyph(name='e'), Glyph(name='f')])
+check('P4 extend', _p4['f'] is _p4.data[-1] and _p4_consistent(_p4))
+_p4['b'].name = 'B'
+check('P4 rename', _p4['B'] is _p4.data[1] and 'b' not in _p4 and _p4_consistent(_p4))
+_p4.append(Glyph(name='a'))
+_p4.pop()
+check('P4 duplicate falls back', _p4['a'] is _p4.data[0] and _p4_consistent(_p4))
+_p4['c'].name = 'a'
+_p4['a'].name = 'z'
+check('P4 rename with duplicates', _p4.glyph_names == ['a', 'B', 'z', 'y', 'e', 'f'] and _p4_consistent(_p4))
+_p4.remove(_p4['y'])
+_p4.reverse()
+check('P4 remove / reverse', _p4.glyph_names == ['f', 'e', 'z', 'B', 'a'] and _p4_consistent(_p4))
+_p4_orphan = _p4.pop(0)
+_p4_orphan.name = 'f2'
+check('P4 popped glyph rename ignored', 'f2' not in _p4 and _p4_consistent(_p4))
+
+
+# ===========================================================
+# - P5: indexed Kerning and class-aware lookup --------------
+# ===========================================================
+_p5_groups = Groups()
+_p5_groups.set('public.kern1.H', ['H', 'N'])
+_p5_groups.set('public.kern2.O', ['O', 'C'])
+_p5 = Kerning()
+_p5.add_pair('public.kern1.H', 'public.kern2.O', -10)
+_p5.add_pair('H', 'public.kern2.O', -20)
+_p5.add_pair('public.kern1.H', 'C', -30)
+_p5.add_pair('H', 'C', -40)
+_p5[('A', 'V')] = -50
+_p5_xml = _p5.to_XML()
+check('P5 insertion order / XML kept', [p.key for p in _p5.pairs][-1] == ('A', 'V') and Kerning.from_XML(_p5_xml).to_XML() == _p5_xml)
+check('P5 get_pair / overwrite', _p5.get_pair('H', 'C').value == -40 and (_p5.add_pair('A', 'V', -55) or _p5.value('A', 'V') == -55) and len(_p5) == 5)
+check('P5 lookup precedence', [_p5.lookup('H', 'C', _p5_groups), _p5.lookup('H', 'O', _p5_groups),
+	_p5.lookup('N', 'C', _p5_groups), _p5.lookup('N', 'O', _p5_groups), _p5.lookup('N', 'X', _p5_groups)] == [-40, -20, -30, -10, None])
+check('P5 lookup without groups', _p5.lookup('H', 'C') == -40 and _p5.lookup('N', 'O') is None)
+_p5.remove_pair('H', 'C')
+check('P5 remove invalidates lookup', _p5.lookup('H', 'C', _p5_groups) == -20 and _p5.get_pair('H', 'C') is None)
+_p5_groups.set('public.kern2.O', ['O'])
+check('P5 groups edit invalidates lookup', _p5.lookup('H', 'C', _p5_groups) == -30 and _p5.lookup('N', 'C', _p5_groups) == -30)
+_p5.get_pair('H', 'public.kern2.O').value = -25
+check('P5 value edit seen by cached lookup', _p5.lookup('H', 'O', _p5_groups) == -25)
+_p5.pairs.append(KernPair('X', 'Y', 5))
+check('P5 raw list edit reindexed', _p5.value('X', 'Y') == 5)
+
+
+# ===========================================================
+# - P6: indexed Encoding ------------------------------------
+# ===========================================================
+from typerig.core.objects.encoding import Encoding, EncodingEntry
+
+_p6 = Encoding([EncodingEntry('A', [0x41]), EncodingEntry('Alt', [0x41, 0xE000])])
+check('P6 name / codepoint lookup', _p6.unicodes('Alt') == [0x41, 0xE000] and _p6.glyph(0x41) == 'Alt' and 'A' in _p6)
+_p6.set('B', 0x42)
+_p6.set('A', 'C0')
+check('P6 set patches indices', _p6.glyph(0x42) == 'B' and _p6.glyph(0xC0) == 'A' and _p6.glyph(0x41) == 'Alt')
+_p6.remove('Alt')
+check('P6 remove', _p6.glyph(0x41) is None and _p6.glyph(0xE000) is None and 'Alt' not in _p6)
+_p6.append(EncodingEntry('C', [0x42]))
+check('P6 append: last wins', _p6.glyph(0x42) == 'C' and _p6.reverse() == {0xC0: 'A', 0x42: 'C'})
+_p6.pop(0)
+check('P6 pop', _p6.glyph(0xC0) is None and _p6.get_entry('A') is None and len(_p6) == 2)
+_p6.entries.append(EncodingEntry('D', [0x44]))
+check('P6 raw list edit reindexed', _p6.glyph(0x44) == 'D' and _p6.unicode('D') == 0x44)
+check('P6 XML round-trip', Encoding.from_XML(_p6.to_XML()).to_XML() == _p6.to_XML())
+
+
+# ===========================================================
+# - P7: Groups reverse membership ---------------------------
+# ===========================================================
+_p7 = Groups()
+_p7.set('public.kern1.H', ['H', 'N'])
+_p7.set('public.kern2.O', ['O', 'C'])
+_p7.set('round', ['O', 'C', 'Q'])
+check('P7 reverse lookup', _p7.kern1_of('H') == 'public.kern1.H' and _p7.kern2_of('C') == 'public.kern2.O'
+	and _p7.kern1_of('O') is None and _p7.user_groups_of('O') == ['round'])
+check('P7 groups_of in group order', _p7.groups_of('C') == ['public.kern2.O', 'round'] and _p7.groups_of('Z') == [])
+_p7.set('public.kern2.O', ['O'])
+_p7.set('public.kern2.C', ['C', 'G'])
+check('P7 set keeps index consistent', _p7.kern2_of('C') == 'public.kern2.C' and _p7.kern2_of('G') == 'public.kern2.C' and _p7.kern2_of('O') == 'public.kern2.O')
+_p7.remove('round')
+check('P7 remove keeps index consistent', _p7.user_groups_of('Q') == [] and 'round' not in _p7 and len(_p7) == 3)
+check('P7 validate clean', _p7.validate() == {'first': {}, 'second': {}})
+_p7.set('public.kern1.HN', ['N', 'M'])
+check('P7 validate reports conflicts', _p7.validate() == {'first': {'N': ['public.kern1.H', 'public.kern1.HN']}, 'second': {}}
+	and _p7.kern1_of('N') == 'public.kern1.H')
+_p7_version = _p7.version
+_p7.data.append(Group('public.kern1.M', ['M']))
+check('P7 raw list edit reindexed', _p7.get('public.kern1.M') is not None and _p7.version != _p7_version)
+_p7['public.kern1.H'].members.append('X')
+_p7.touch()
+check('P7 touch after in-place edit', _p7.kern1_of('X') == 'public.kern1.H')
+_p7.set('public.kern1.H', ['H', 'N', 'I', 'I'])
+_p7.set('public.kern1.H', ['I', 'H', 'K'])
+_p7_fresh = Groups([Group(group.name, group.members) for group in _p7.data])
+check('P7 re-set keeps overlapping members indexed', _p7.groups_of('H') == ['public.kern1.H'] and _p7.groups_of('I') == ['public.kern1.H']
+	and _p7.groups_of('N') == ['public.kern1.HN'] and all(_p7.groups_of(name) == _p7_fresh.groups_of(name) for name in 'HIKNMXOCG'))
+
+
+# ===========================================================
+# - P8: lazy .trfont reading --------------------------------
+# ===========================================================
+import os, shutil, tempfile
+from typerig.core.fileio.trfont import TrFontIO, TrGlyphSource, GlyphManifest
+from typerig.core.objects.font import GlyphSource
+
+_p8_dir = tempfile.mkdtemp()
+_p8_path = os.path.join(_p8_dir, 'Lazy.trfont')
+_p8_names = ['g{}'.format(i) for i in range(8)]
+_p8_font = Font([_s3_glyph(name, i) for i, name in enumerate(_p8_names)], info=FontInfo('Lazy', 'Regular'))
+_p8_font.encoding.set('g1', 0x41)
+TrFontIO.write(_p8_font, _p8_path)
+
+_p8 = TrFontIO.read(_p8_path, lazy=True, cache_size=3)
+check('P8 lazy read keeps names, parses nothing', _p8.glyph_names == _p8_names and all(isinstance(g, TrGlyphSource) for g in _p8.data))
+check('P8 load on access by name', _p8['g1'].to_XML() == TrFontIO.read(_p8_path)['g1'].to_XML() and _p8['g1'].unicodes == [0x41])
+check('P8 load on access by index', _p8[2].name == 'g2' and _p8[2] is _p8.data[2] and _p8[2].parent is _p8)
+_p8_edit = _p8['g3']
+_p8_edit.layers[0].shapes[0].contours[0].shift(5, 0)
+check('P8 iteration loads in order', [g.name for g in _p8] == _p8_names)
+check('P8 LRU evicts clean glyphs only', sum(not isinstance(g, GlyphSource) for g in _p8.data) <= 4
+	and _p8.data[3] is _p8_edit and isinstance(_p8.data[0], GlyphSource))
+check('P8 evicted glyph reloads', _p8['g0'].name == 'g0' and _p8.glyph_names == _p8_names and _p8.index(_p8['g5']) == 5)
+_p8_meta = TrFontIO.read(_p8_path, lazy=True, cache_size=1)
+_p8_meta['g0'].layers[0].nodes[0].smooth = True
+_p8_meta['g1'].layers[0].nodes[1].lib['k'] = 1
+_p8_meta['g2'].note = 'edited'
+_p8_to_xml, Glyph.to_XML = Glyph.to_XML, None
+_p8_meta['g3'], _p8_meta['g4']
+Glyph.to_XML = _p8_to_xml
+check('P8 eviction compares state without serializing', isinstance(_p8_meta.data[3], GlyphSource) and isinstance(_p8_meta.data[4], Glyph))
+check('P8 smooth, node lib and note edits are never evicted', all(isinstance(_p8_meta.data[i], Glyph) for i in (0, 1, 2)))
+_p8_popped = _p8.pop(6)
+check('P8 pop returns a loaded glyph', isinstance(_p8_popped, Glyph) and _p8_popped.name == 'g6' and 'g6' not in _p8)
+_p8_gone = [_p8_popped, _p8['g5'], _p8['g0']]
+del _p8[5]
+_p8[0] = _s3_glyph('g0', 0)
+_p8_full = TrFontIO.read(_p8_path)
+_p8_full.remove(_p8_full['g7'])
+del _p8_full[:2]
+check('P8 glyphs leaving the font are untracked', all(id(g) not in _p8._sources and id(g) not in _p8._loaded for g in _p8_gone)
+	and len(_p8_full._sources) == len(_p8_full) == 5)
+
+try:
+	GlyphSource('g0')
+	check('P8 GlyphSource is abstract', False)
+
+except TypeError:
+	check('P8 GlyphSource is abstract', True)
+
+_p8.load_all()
+check('P8 load_all', not _p8.is_lazy and len(_p8.glyphs) == 6)
+shutil.rmtree(_p8_dir)
+
+
+# ===========================================================
+# - P9: parallel .trfont read / write -----------------------
+# ===========================================================
+def _p9_files(path):
+	result = {}
+	for root, _, files in os.walk(path):
+		for name in files:
+			with open(os.path.join(root, name), 'rb') as fh:
+				result[os.path.relpath(os.path.join(root, name), path)] = fh.read()
+	return result
+
+_p9_dir = tempfile.mkdtemp()
+_p9_font = Font([_s3_glyph(name, i) for i, name in enumerate(['A', 'a', 'B', 'b', 'C', 'c'])], info=FontInfo('Par', 'Regular'))
+_p9_font.encoding.set('B', 0x42)
+TrFontIO.write(_p9_font, os.path.join(_p9_dir, 'serial.trfont'))
+TrFontIO.write(_p9_font, os.path.join(_p9_dir, 'parallel.trfont'), workers=2)
+check('P9 parallel write byte-identical', _p9_files(os.path.join(_p9_dir, 'serial.trfont')) == _p9_files(os.path.join(_p9_dir, 'parallel.trfont')))
+import io
+from typerig.core.fileio.trfont import _detach, _DetachedUnpickler
+_p9_detached = _DetachedUnpickler(io.BytesIO(_detach(_p9_font['A']))).load()
+check('P9 write workers get the glyph without its font', _p9_detached.parent is None and _p9_font['A'].parent is _p9_font
+	and _p9_detached.to_XML() == _p9_font['A'].to_XML() and len(_detach(_p9_font['A'])) * 3 < len(pickle.dumps(_p9_font['A'])))
+_p9_serial = TrFontIO.read(os.path.join(_p9_dir, 'serial.trfont'))
+_p9_parallel = TrFontIO.read(os.path.join(_p9_dir, 'serial.trfont'), workers=2)
+check('P9 parallel read matches serial', _p9_parallel.glyph_names == _p9_serial.glyph_names
+	and [g.to_XML() for g in _p9_parallel] == [g.to_XML() for g in _p9_serial] and _p9_parallel['B'].unicodes == [0x42]
+	and all(g.parent is _p9_parallel for g in _p9_parallel))
+shutil.rmtree(_p9_dir)
+
+# ===========================================================
+# - P10: incremental .trfont save ---------------------------
+# ===========================================================
+def _p10_inodes(path):
+	glyph_dir = os.path.join(path, 'glyphs')
+	return dict((name, os.stat(os.path.join(glyph_dir, name)).st_ino) for name in os.listdir(glyph_dir))
+
+_p10_dir = tempfile.mkdtemp()
+_p10_path = os.path.join(_p10_dir, 'inc.trfont')
+_p10_font = Font([_s3_glyph(name, i) for i, name in enumerate(['A', 'B', 'C', 'D'])], info=FontInfo('Inc', 'Regular'))
+TrFontIO.write(_p10_font, _p10_path)
+_p10_before = _p10_inodes(_p10_path)
+check('P10 manifest stores content digests', all(e.digest for e in GlyphManifest.read(os.path.join(_p10_path, 'glyphs.xml')).entries))
+
+_p10_font['B'].layers[0].width = 777
+_p10_font.remove(_p10_font['D'])
+TrFontIO.write(_p10_font, _p10_path)
+_p10_after = _p10_inodes(_p10_path)
+check('P10 unchanged glyph files untouched', _p10_after['A_.trglyph'] == _p10_before['A_.trglyph'] and _p10_after['C_.trglyph'] == _p10_before['C_.trglyph'])
+check('P10 changed glyph rewritten', _p10_after['B_.trglyph'] != _p10_before['B_.trglyph'] and TrFontIO.read(_p10_path)['B'].layers[0].width == 777)
+check('P10 orphaned glyph file removed, no temp files', sorted(_p10_after) == ['A_.trglyph', 'B_.trglyph', 'C_.trglyph'])
+
+_p10_lazy = TrFontIO.read(_p10_path, lazy=True)
+_p10_lazy['C'].layers[0].width = 333
+TrFontIO.write(_p10_lazy, _p10_path)
+_p10_reread = TrFontIO.read(_p10_path)
+check('P10 lazy save writes loaded glyphs, keeps the rest unparsed', isinstance(_p10_lazy.data[0], GlyphSource)
+	and _p10_inodes(_p10_path)['A_.trglyph'] == _p10_before['A_.trglyph']
+	and _p10_reread['C'].layers[0].width == 333 and _p10_reread['B'].layers[0].width == 777)
+
+TrFontIO.write(_p10_lazy, os.path.join(_p10_dir, 'copy.trfont'))
+check('P10 lazy save-as copies unloaded glyph files', [g.to_XML() for g in TrFontIO.read(os.path.join(_p10_dir, 'copy.trfont'))] == [g.to_XML() for g in _p10_reread]
+	and _p10_lazy.data[0].font_dir == os.path.join(_p10_dir, 'copy.trfont'))
+
+_p10_eager = TrFontIO.read(_p10_path)
+_p10_x = _p10_eager['A'].layers[0].nodes[0].x + 1
+_p10_eager['A'].layers[0].nodes[0].x = _p10_x
+_p10_eager['C'].note = 'edited'
+_p10_serialized, _p10_to_xml = [], Glyph.to_XML
+Glyph.to_XML = lambda self, *args: _p10_serialized.append(self.name) or _p10_to_xml(self, *args)
+TrFontIO.write(_p10_eager, _p10_path)
+TrFontIO.write(_p10_eager, _p10_path)
+Glyph.to_XML = _p10_to_xml
+_p10_reread = TrFontIO.read(_p10_path)
+check('P10 save serializes edited glyphs only, once', _p10_serialized == ['A', 'C']
+	and _p10_reread['A'].layers[0].nodes[0].x == _p10_x and _p10_reread['C'].note == 'edited' and _p10_reread['B'].layers[0].width == 777)
+
+if os.name == 'posix':
+	_p10_umask = os.umask(0o022)
+	_p10_a = os.path.join(_p10_path, 'glyphs', 'A_.trglyph')
+	_p10_copy = os.path.join(_p10_dir, 'modes.trfont')
+	os.chmod(_p10_a, 0o640)
+	_p10_eager['A'].layers[0].width = 555
+	TrFontIO.write(_p10_eager, _p10_path)
+	TrFontIO.write(_p10_eager, _p10_copy)
+	os.umask(_p10_umask)
+	check('P10 saves keep file modes, new files follow the umask', os.stat(_p10_a).st_mode & 0o777 == 0o640
+		and TrFontIO.read(_p10_path)['A'].layers[0].width == 555
+		and all(os.stat(os.path.join(root, name)).st_mode & 0o777 == 0o644 for root, _, files in os.walk(_p10_copy) for name in files))
+
+shutil.rmtree(_p10_dir)
+
+# ===========================================================
+# - P11: fast XML reader matches the generic path -----------
+# ===========================================================
+from typerig.core.fileio.xmlio import XMLSerializable
+from typerig.core.objects.anchor import Anchor
+_generic_from_XML = XMLSerializable.from_XML.__func__
+
+def _p11_state(node):
+	return [repr(getattr(node, name, None)) for name in Node.__slots__ + ('_uid', 'identifier', '_lib')]
+
+_p11_nodes = ['<node x="10" y="-20.5" type="on" smooth="False" />', '<node x="1e3" y="True" type="1" smooth="yes" />',
+	'<node />', '<node x="nan" y="matrix(1 0 0 1 0 0)" type="curve" />',
+	'<node x="3" y="4"><lib><dict><key>tag</key><string>t</string></dict></lib></node>']
+check('P11 Node.from_XML matches generic reader', all(_p11_state(Node.from_XML(xml)) == _p11_state(_generic_from_XML(Node, xml)) for xml in _p11_nodes))
+
+_p11_glyph = Glyph([Layer([Shape([Contour([Node(0, 0), Node(10.5, 20, type='curve'), Node(30, 40, smooth=True)], closed=True),
+	Contour([Node(1, 2), Node(3, 4)])], name='s'), Shape(component='A')], name='Regular', width=500),
+	Layer([Shape([Contour([Node(0, 0), Node(5, 5)], closed=True)])], name='Bold', width=600)], name='A', unicodes=[65])
+_p11_glyph.layers[0].shapes[0].contours[0].lib['k'] = 1
+_p11_glyph.layers[0].anchors = [Anchor(10, 20, 'top')]
+_p11_glyph.note = 'note'
+_p11_xml = _p11_glyph.to_XML()
+_p11_fast, _p11_slow = Glyph.from_XML(_p11_xml), _generic_from_XML(Glyph, _p11_xml)
+check('P11 Glyph.from_XML round-trips identically', _p11_fast.to_XML() == _p11_slow.to_XML() == _p11_xml)
+check('P11 fast nodes equal generic nodes', [_p11_state(n) for l in _p11_fast.layers for n in l.nodes] == [_p11_state(n) for l in _p11_slow.layers for n in l.nodes]
+	and all(n.parent is c for l in _p11_fast.layers for c in l.contours for n in c.nodes))
+
+# ===========================================================
+# - P12: streaming pretty XML writer ------------------------
+# ===========================================================
+from xml.dom import minidom
+from xml.etree import ElementTree as ET
+from typerig.core.fileio.trfont import _pretty_xml
+
+def _p12_minidom(element):
+	lines = minidom.parseString(ET.tostring(element, encoding='unicode')).toprettyxml(indent='\t').split('\n')
+	return '\n'.join(lines[1:])
+
+_p12_elem = ET.Element('a', {'q': 'x"y&<>\n\t\r z', 'u': '\u00fc'})
+_p12_elem.text = 'mixed & "quoted" <text>\r\nline'
+ET.SubElement(_p12_elem, 'b').text = 'inline'
+_p12_elem[0].tail = 'tail'
+ET.SubElement(ET.SubElement(_p12_elem, 'c'), 'd')
+_p12_elem.append(ET.Comment(' note '))
+check('P12 pretty writer matches minidom on edge cases', _pretty_xml(_p12_elem) == _p12_minidom(_p12_elem))
+check('P12 pretty writer matches minidom on font.xml', _pretty_xml(_font._to_xml_element()) == _p12_minidom(_font._to_xml_element()))
+
+# ===========================================================
+# - P13: binary glyph cache ---------------------------------
+# ===========================================================
+import pickle
+from typerig.core.fileio.trfont import GlyphCache, _CACHE_HEADER
+
+_p13_dir = tempfile.mkdtemp()
+_p13_path = os.path.join(_p13_dir, 'cached.trfont')
+_p13_font = Font([_s3_glyph(name, i) for i, name in enumerate(['A', 'B', 'C'])], info=FontInfo('Cache', 'Regular'))
+_p13_font.encoding.set('B', 0x42)
+TrFontIO.write(_p13_font, _p13_path)
+_p13_plain = [g.to_XML() for g in TrFontIO.read(_p13_path)]
+_p13_cold = TrFontIO.read(_p13_path, cache=True)
+_p13_cache = GlyphCache(_p13_path)
+_p13_a = os.path.join(_p13_path, 'glyphs', 'A_.trglyph')
+check('P13 cold read fills the cache, XML untouched', len(_p13_cache.entries()) == 3 and [g.to_XML() for g in _p13_cold] == _p13_plain
+	and os.path.isfile(os.path.join(_p13_path, '.cache', '.gitignore')))
+
+if os.name == 'posix':
+	_p13_umask = os.umask(0o022)
+	_p13_cache.clear()
+	TrFontIO.read(_p13_path, cache=True)
+	os.umask(_p13_umask)
+	check('P13 cache entries follow the umask', all(os.stat(_p13_cache.entry_path(os.path.join(_p13_path, 'glyphs', name))).st_mode & 0o777 == 0o644
+		for name in os.listdir(os.path.join(_p13_path, 'glyphs'))))
+
+_p13_warm = TrFontIO.read(_p13_path, cache=True)
+_p13_node = _p13_warm['A'].layers[0].nodes[0]
+check('P13 warm read matches XML read', [g.to_XML() for g in _p13_warm] == _p13_plain and _p13_warm['B'].unicodes == [0x42]
+	and _p13_node.parent.parent.parent.parent is _p13_warm['A'] and type(_p13_node.x) is type(TrFontIO.read(_p13_path)['A'].layers[0].nodes[0].x))
+
+os.utime(_p13_a, ns=(0, 0))
+check('P13 touched but unchanged file stays cached', _p13_cache.load(_p13_a) is not None and _p13_cache.verify()['valid'] == 3)
+
+_p13_font['A'].layers[0].width = 999
+TrFontIO.write(_p13_font, _p13_path)
+check('P13 changed glyph file invalidates its entry', _p13_cache.load(_p13_a) is None and _p13_cache.verify()['stale'] == 1
+	and TrFontIO.read(_p13_path, cache=True)['A'].layers[0].width == 999 and _p13_cache.verify(deep=True)['valid'] == 3)
+
+with open(_p13_cache.entry_path(_p13_a), 'r+b') as _fh:
+	_p13_header = _fh.read(_CACHE_HEADER.size)
+	_fh.seek(0)
+	_fh.truncate()
+	_fh.write(_p13_header + pickle.dumps(os.system, protocol=4))
+check('P13 entry with foreign globals is refused', _p13_cache.load(_p13_a) is None and TrFontIO.read(_p13_path, cache=True)['A'].layers[0].width == 999)
+
+check('P13 trim keeps the cache under its limit', _p13_cache.trim(limit=1) == 3 and _p13_cache.entries() == [])
+TrFontIO.read(_p13_path, cache=True)
+check('P13 clear removes the cache folder', _p13_cache.clear() == 3 and not os.path.exists(os.path.join(_p13_path, '.cache')))
+shutil.rmtree(_p13_dir)
+
+# ===========================================================
+# - P14: memory mapped .trpack store ------------------------
+# ===========================================================
+from typerig.core.fileio.trpack import GlyphPack, PackGlyphSource
+
+_p14_dir = tempfile.mkdtemp()
+_p14_src, _p14_out = os.path.join(_p14_dir, 'src.trfont'), os.path.join(_p14_dir, 'out.trfont')
+_p14_pack = os.path.join(_p14_dir, 'font.trpack')
+_p14_named = _s3_glyph('N')
+_p14_named.layers[0].nodes[1].lib['corner'] = 1
+_p14_font = Font([Glyph.from_XML(_p11_xml), _p14_named] + [_s3_glyph(name, i) for i, name in enumerate(['B', 'C'])],
+	info=FontInfo('Pack', 'Regular'), kerning=_kern, groups=_groups, features=_features)
+_p14_font.encoding.set('B', 0x42)
+TrFontIO.write(_p14_font, _p14_src)
+_p14_xml = [g.to_XML() for g in TrFontIO.read(_p14_src)]
+
+TrFontIO.write_packed(TrFontIO.read(_p14_src, lazy=True), _p14_pack)
+_p14_lazy = TrFontIO.open_packed(_p14_pack)
+check('P14 open_packed is lazy and keeps the font descriptor', all(isinstance(item, PackGlyphSource) for item in _p14_lazy.data)
+	and _p14_lazy.info.family_name == 'Pack' and _p14_lazy.kerning[('A', 'V')] == -50
+	and _p14_lazy.groups.members('public.kern1.H') == ['H', 'I', 'N'] and _p14_lazy.features == _features)
+check('P14 glyphs read back as written', [g.to_XML() for g in _p14_lazy] == _p14_xml and _p14_lazy['B'].unicodes == [0x42])
+
+_p14_contours = [c for g in TrFontIO.open_packed(_p14_pack, lazy=False) for l in g.layers for c in l.contours]
+_p14_plain = [c for g in TrFontIO.open_packed(_p14_pack, lazy=False, packed=False) for l in g.layers for c in l.contours]
+check('P14 plain-node contours come back packed, others as parsed', sum(isinstance(c, PackedContour) for c in _p14_contours) == len(_p14_contours) - 1
+	and not any(isinstance(c, PackedContour) for c in _p14_plain) and _p14_contours[3].nodes[1].lib == {'corner': 1})
+
+TrFontIO.write(TrFontIO.open_packed(_p14_pack), _p14_out)
+check('P14 .trfont -> .trpack -> .trfont keeps every glyph file', [g.to_XML() for g in TrFontIO.read(_p14_out)] == _p14_xml
+	and sorted(os.listdir(os.path.join(_p14_out, 'glyphs'))) == sorted(os.listdir(os.path.join(_p14_src, 'glyphs'))))
+
+_p14_store = GlyphPack(_p14_pack)
+_p14_arrays = _p14_store.arrays('A')
+_p14_nodes = _p14_lazy['A'].layers[0].nodes
+check('P14 arrays are zero-copy views of the layer nodes', [row[0] for row in _p14_arrays] == ['Regular', 'Bold']
+	and isinstance(_p14_arrays[0][1], memoryview) and list(_p14_arrays[0][1]) == [n.x for n in _p14_nodes]
+	and [_p14_store.types[code] for code in _p14_arrays[0][3]] == [n.type for n in _p14_nodes]
+	and _p14_store.metrics('A') == [('Regular', 500., 1000.), ('Bold', 600., 1000.)])
+
+try:
+	_p14_store.close()
+	_p14_refused = False
+except BufferError:
+	_p14_refused = True
+
+del _p14_arrays
+_p14_store.close()
+check('P14 close waits for released views', _p14_refused and len(_p14_store) == 4 and 'N' in _p14_store)
+del _p14_lazy
+
+if os.name == 'posix':
+	_p14_umask = os.umask(0o022)
+	_p14_new = os.path.join(_p14_dir, 'new.trpack')
+	os.chmod(_p14_pack, 0o640)
+	TrFontIO.write_packed(_p14_font, _p14_pack)
+	TrFontIO.write_packed(_p14_font, _p14_new)
+	os.umask(_p14_umask)
+	check('P14 rewritten pack keeps its mode, new one follows the umask', os.stat(_p14_pack).st_mode & 0o777 == 0o640
+		and os.stat(_p14_new).st_mode & 0o777 == 0o644)
+
+shutil.rmtree(_p14_dir)
+
+# ===========================================================
+# - P15: parallel UFO / designspace import ------------------
+# ===========================================================
+from typerig.core.fileio.ufo import UfoConverter
+from typerig.core.objects.axis import Axis
+
+def _p15_glyph(name, dx=0):
+	glyph = _s3_glyph(name, dx)
+	bold = _s3_glyph(name, dx + 5).layers[0]
+	bold.name = 'Bold'
+	glyph.layers.append(bold)
+	return glyph
+
+_p15_dir = tempfile.mkdtemp()
+_p15_font = Font([_p15_glyph(name, i) for i, name in enumerate(['Z', 'A', 'a', 'M', 'B'])], info=FontInfo('Ufo', 'Regular'),
+	axes=[Axis(name='wght', tag='wght', minimum=400, default=400, maximum=700)],
+	masters=Masters([Master('Regular', 'Regular', location={'wght': 400}, is_default=True), Master('Bold', 'Bold', location={'wght': 700})]))
+_p15_font['A'].unicodes = [65]
+UfoConverter(verbose=False).tr_to_designspace(_p15_font, os.path.join(_p15_dir, 'ds', 'par.designspace'))
+UfoConverter(verbose=False).tr_to_ufo(_p15_font, os.path.join(_p15_dir, 'par.ufo'))
+
+for _p15_path in (os.path.join(_p15_dir, 'ds', 'par.designspace'), os.path.join(_p15_dir, 'par.ufo')):
+	_p15_conv = UfoConverter(verbose=False)
+	_p15_serial = _p15_conv.to_tr(_p15_path)
+	_p15_stages = list(_p15_conv.timings)
+	_p15_parallel = _p15_conv.to_tr(_p15_path, workers=2)
+	check('P15 parallel import matches serial ({})'.format(os.path.splitext(_p15_path)[1]), _p15_parallel.glyph_names == _p15_serial.glyph_names == ['Z', 'A', 'a', 'M', 'B']
+		and [g.to_XML() for g in _p15_parallel] == [g.to_XML() for g in _p15_serial] and _p15_parallel['A'].unicodes == [65]
+		and [l.name for l in _p15_parallel['M'].layers] == ['Regular', 'Bold'])
+	check('P15 per-stage timings ({})'.format(os.path.splitext(_p15_path)[1]), 'glyphs' in _p15_stages and list(_p15_conv.timings) == _p15_stages
+		and all(seconds >= 0 for seconds in _p15_conv.timings.values()))
+
+shutil.rmtree(_p15_dir)
+
+# ===========================================================
+# - P16: parallel / incremental designspace export ----------
+# ===========================================================
+_p16_dir = tempfile.mkdtemp()
+_p16_serial, _p16_parallel = os.path.join(_p16_dir, 's', 'par.designspace'), os.path.join(_p16_dir, 'p', 'par.designspace')
+UfoConverter(verbose=False).tr_to_designspace(_p15_font, _p16_serial)
+UfoConverter(verbose=False).tr_to_designspace(_p15_font, _p16_parallel, workers=2)
+check('P16 parallel export byte-identical', _p9_files(os.path.dirname(_p16_serial)) == _p9_files(os.path.dirname(_p16_parallel)))
+
+_p16_record = os.path.join(_p16_dir, 's', 'par-Bold.ufo', 'data', 'com.typerig.export-digest.json')
+check('P16 plain export writes no digest record', not os.path.exists(_p16_record))
+
+_p16_conv = UfoConverter(verbose=False)
+_p16_bold = os.path.join(_p16_dir, 's', 'par-Bold.ufo', 'glyphs', 'A_.glif')
+_p16_conv.tr_to_designspace(_p15_font, _p16_serial, changed_only=True)
+check('P16 first changed_only export records digests', _p16_conv.unchanged == [] and os.path.isfile(_p16_record))
+os.utime(_p16_bold, ns=(0, 0))
+_p16_conv.tr_to_designspace(_p15_font, _p16_serial, changed_only=True)
+check('P16 changed_only keeps up to date masters', _p16_conv.unchanged == ['Regular', 'Bold'] and os.stat(_p16_bold).st_mtime_ns == 0)
+
+_p15_font['A'].layer('Bold').width = 321
+_p16_conv.tr_to_designspace(_p15_font, _p16_serial, changed_only=True, workers=2)
+check('P16 changed_only rewrites only changed masters', _p16_conv.unchanged == ['Regular'] and os.stat(_p16_bold).st_mtime_ns != 0
+	and 'masters' in _p16_conv.timings and _p16_conv.to_tr(_p16_serial)['A'].layer('Bold').width == 321)
+shutil.rmtree(_p16_dir)
+
+# ===========================================================
+# - P17: trconvert batch ------------------------------------
+# ===========================================================
+import contextlib, importlib.util, io, json
+
+_p17_spec = importlib.util.spec_from_file_location('trconvert', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+	'..', '..', '..', '..', 'Scripts', 'TypeRig Tools', 'trconvert.py'))
+_p17_cli = sys.modules['trconvert'] = importlib.util.module_from_spec(_p17_spec)	# Workers unpickle jobs by module name
+_p17_spec.loader.exec_module(_p17_cli)
+
+_p17_dir = tempfile.mkdtemp()
+for _p17_name in ('One', 'Two'):
+	TrFontIO.write(_p15_font, os.path.join(_p17_dir, _p17_name + '.trfont'))
+
+def _p17_run(*argv):
+	with contextlib.redirect_stdout(io.StringIO()):
+		code = _p17_cli.main(list(argv) + ['--json', os.path.join(_p17_dir, 'summary.json')])
+
+	with open(os.path.join(_p17_dir, 'summary.json')) as f:
+		return code, json.load(f)
+
+_p17_code, _p17_sum = _p17_run('batch', 'tr2ufo', os.path.join(_p17_dir, '*.trfont'), os.path.join(_p17_dir, 'Nope.trfont'),
+	'--output-dir', os.path.join(_p17_dir, 'ufo'), '-j', '2')
+check('P17 batch converts every match, reports missing inputs', _p17_code == 2 and (_p17_sum['ok'], _p17_sum['error']) == (2, 1)
+	and [os.path.basename(r['input']) for r in _p17_sum['results']] == ['One.trfont', 'Two.trfont', 'Nope.trfont']
+	and os.path.isfile(os.path.join(_p17_dir, 'ufo', 'Two.designspace')) and _p17_sum['glyphs'] == 2 * len(_p15_font))
+
+with open(os.path.join(_p17_dir, 'fonts.txt'), 'w') as f:
+	f.write('# family\nufo/*.designspace\n')
+
+_p17_code, _p17_sum = _p17_run('batch', 'roundtrip', '--manifest', os.path.join(_p17_dir, 'fonts.txt'), '-j', '1')
+check('P17 batch roundtrip from manifest', _p17_code == 0 and _p17_sum['ok'] == _p17_sum['fonts'] == 2
+	and all(r['seconds'] > 0 for r in _p17_sum['results']))
+shutil.rmtree(_p17_dir)
+
+# ===========================================================
+# - P18: Merkle digests -------------------------------------
+# ===========================================================
+_p18_glyph = _p15_glyph('D')
+_p18_clone = copy.deepcopy(_p18_glyph)
+_p18_clone.layers[0].shapes[0].contours[0].nodes[1].x = 100.0002	# int -> float, noise below precision
+_p18_clone.data.reverse()
+check('P18 digest ignores storage type, float noise and layer order', _p18_clone.digest() == _p18_glyph.digest()
+	and _p18_clone.layer('Bold').digest() == _p18_glyph.layer('Bold').digest() and _p18_clone.digest(4) != _p18_glyph.digest(4))
+
+_p18_packed = copy.deepcopy(_p18_glyph)
+_p18_packed.layers[0].shapes[0].data[0] = PackedContour.from_contour(_p18_packed.layers[0].shapes[0].contours[0])
+check('P18 packed contours digest like plain ones', _p18_packed.digest() == _p18_glyph.digest())
+
+_p18_clone.layer('Bold').shapes[0].contours[0].nodes[2].y = -5
+check('P18 edits change layer, glyph and font digests', _p18_clone.layer('Bold').digest() != _p18_glyph.layer('Bold').digest()
+	and _p18_clone.layer('Regular').digest() == _p18_glyph.layer('Regular').digest() and _p18_clone.digest() != _p18_glyph.digest()
+	and Font([_p18_clone]).digest() != Font([copy.deepcopy(_p18_glyph)]).digest())
+
+_p18_font = copy.deepcopy(_p15_font)
+_p18_font['M'].layer('Bold').shapes[0].contours[0].nodes[0].x += 1
+_p18_font['a'].note = 'changed'
+check('P18 roundtrip diff narrows to changed glyphs', _p17_cli._glyph_diffs(_p15_font, copy.deepcopy(_p15_font)) == []
+	and _p17_cli._glyph_diffs(_p15_font, _p18_font) == ["glyphs[2].note: '' vs 'changed'", 'glyphs[3].layers.Bold.shapes[0][1][0][0][0]: 8.0 vs 9.0'])
+
+from typerig.core.objects.hobbyspline import HobbyKnot
+_p18_pair = [Contour([Node(0, 0), Node(10, 0), Node(10, 10)], closed=True), Contour([Node(20, 0), Node(30, 0), Node(30, 10)], closed=True)]
+_p18_one = Layer([Shape(copy.deepcopy(_p18_pair))], name='Regular')
+_p18_two = Layer([Shape([contour]) for contour in copy.deepcopy(_p18_pair)], name='Regular')
+check('P18 regrouped contours change the digest and show in the diff', _p18_one.digest() != _p18_two.digest()
+	and _p17_cli._glyph_diffs(Font([Glyph([_p18_one], name='R')]), Font([Glyph([_p18_two], name='R')])) == ['glyphs[0].layers.Regular.shapes: length mismatch 1 vs 2'])
+
+_p18_hobby = Layer([Shape([Contour(knots=[HobbyKnot(0, 0), HobbyKnot(100, 0), HobbyKnot(50, 80)], closed=True)])], name='Regular')
+_p18_tense = copy.deepcopy(_p18_hobby)
+_p18_tense.shapes[0].contours[0].data[1].alpha = 2.
+check('P18 hobby knot tension changes the digest', _p18_hobby.digest() != _p18_tense.digest())
+
+_p18_calls, _p18_node_values = [], Contour._node_values
+Contour._node_values = lambda self: _p18_calls.append(self) or _p18_node_values(self)
+_p18_one.shapes[0].contours[0].nodes[0].x = 1
+_p18_digests = [_p18_one.digest(), _p18_one.digest()]
+_p18_one.anchors.append(Anchor(5, 5, name='top'))
+_p18_digests.append(_p18_one.digest())
+Contour._node_values = _p18_node_values
+check('P18 layer digest is memoized until the layer changes', len(_p18_calls) == 4 and _p18_digests[0] == _p18_digests[1] != _p18_digests[2])
+
+# ===========================================================
+# - P19: parallel / incremental SVG export ------------------
+# ===========================================================
+from typerig.core.fileio import svgio
+
+_p19_quad = Contour([Node(0, 0, type='on'), Node(-0., 50.25, type='off'), Node(50, 100.1, type='off'), Node(100.00001, -0.00004, type='on')], closed=True)
+check('P19 path data formats numbers like _format_float', svgio._contour_to_d(_p19_quad) == 'M 0 0 Q 0 50.25 25 75.175 Q 50 100.1 100 -0 L 0 0 Z'
+	and svgio._contour_to_d(_p19_quad, scale=0.5) == 'M 0 0 Q 0 25.125 12.5 37.5875 Q 25 50.05 50 -0 L 0 0 Z')
+
+_p19_dir = tempfile.mkdtemp()
+_p19_serial, _p19_parallel = os.path.join(_p19_dir, 's'), os.path.join(_p19_dir, 'p')
+svgio.font_to_SVG(_p15_font, _p19_serial, changed_only=True)
+svgio.font_to_SVG(_p15_font, _p19_parallel, workers=2, changed_only=True)
+check('P19 parallel export identical', _p9_files(_p19_serial) == _p9_files(_p19_parallel) and len(os.listdir(_p19_serial)) == 2 * len(_p15_font) + 1)
+
+import typerig.core.fileio.trfont as _p19_trfont
+_p19_tasks, _p19_map = [], _p19_trfont._map_chunks
+_p19_trfont._map_chunks = lambda func, tasks, workers: _p19_tasks.extend(tasks) or func(tasks)
+svgio.font_to_SVG(_p15_font, os.path.join(_p19_dir, 'd'), workers=2)
+_p19_trfont._map_chunks = _p19_map
+check('P19 workers get detached glyphs, not the font', len(_p19_tasks) == len(_p15_font)
+	and all(_DetachedUnpickler(io.BytesIO(data)).load().parent is None for data, options, fontname in _p19_tasks)
+	and _p9_files(os.path.join(_p19_dir, 'd')).items() <= _p9_files(_p19_parallel).items())
+
+_p19_a, _p19_b = os.path.join(_p19_serial, 'A_Bold.svg'), os.path.join(_p19_serial, 'B_Bold.svg')
+for _p19_path in (_p19_a, _p19_b):
+	os.utime(_p19_path, ns=(0, 0))
+
+_p19_font = copy.deepcopy(_p15_font)
+_p19_font['A'].layer('Bold').shapes[0].contours[0].nodes[0].y = -20
+svgio.font_to_SVG(_p19_font, _p19_serial, changed_only=True)
+svgio.font_to_SVG(_p19_font, os.path.join(_p19_dir, 'f'))
+check('P19 changed_only rewrites only changed glyphs', os.stat(_p19_b).st_mtime_ns == 0 and os.stat(_p19_a).st_mtime_ns != 0
+	and _p9_files(_p19_serial)['A_Bold.svg'] == _p9_files(os.path.join(_p19_dir, 'f'))['A_Bold.svg'])
+shutil.rmtree(_p19_dir)
+
+# ===========================================================
+# - P20: bulk kerning / class load --------------------------
+# ===========================================================
+from typerig.core.fileio.krn import KRNparser
+from typerig.core.fileio.cla import CLAparser
+
+_p20_dir = tempfile.mkdtemp()
+_p20_krn, _p20_cla = os.path.join(_p20_dir, 'f.krn'), os.path.join(_p20_dir, 'f.cla')
+
+with open(_p20_krn, 'w') as f:
+	f.write('Comment DTL Kern file\n' * 3000 + 'StartKernPairs 4\n\nKPX A V -50\nKPX @T o -60\nKPX P A\nKPX A V -40\nEndKernPairs\n')
+
+with open(_p20_cla, 'w') as f:
+	f.write('# DTL Kern class file\n@T = [T  Tcaron];\n@o = [o ograve];\n@T = [T Tcedilla];\n')
+
+_p20_kern = Kerning()
+_p20_kern.add_pair('A', 'V', -10)
+
+with KRNparser(_p20_krn) as _p20_pairs:
+	_p20_stats = _p20_kern.update_from(_p20_pairs, policy='keep')
+
+check('P20 KRN streamed, @class sides mapped, valueless pairs skipped',
+	_p20_stats == {'added': 1, 'updated': 0, 'kept': 2, 'skipped': 1}
+	and _p20_kern.value('A', 'V') == -10 and _p20_kern.value('public.kern1.T', 'o') == -60)
+
+check('P20 kerning policies', Kerning().update_from([('A', 'V', '-50'), ('A', 'V', -40.6)]) == {'added': 1, 'updated': 1, 'kept': 0, 'skipped': 0})
+def _p20_value(value):
+	kerning = Kerning()
+	kerning.update_from([('A', 'V', value)])
+	return kerning.value('A', 'V')
+
+check('P20 numeric and text values round alike', [_p20_value(value) for value in (-40.6, '-40.6', 12.7, '12.7')] == [-41, -41, 13, 13])
+_p20_kern.update_from([(('A', 'V'), -5)], policy='add')
+_p20_sum = _p20_kern.value('A', 'V')
+_p20_kern.add_pair('A', 'V', 3)
+check('P20 add policy sums and index stays valid', _p20_sum == -15 and len(_p20_kern) == 2 and _p20_kern.value('A', 'V') == 3)
+
+try:
+	_p20_kern.update_from([('A', 'V', 7)], policy='error')
+	check('P20 error policy raises', False)
+except ValueError:
+	check('P20 error policy raises', _p20_kern.value('A', 'V') == 3)
+
+_p20_groups = Groups()
+_p20_groups.set('public.kern1.T', ['T'])
+
+with CLAparser(_p20_cla) as _p20_classes:
+	_p20_stats = _p20_groups.update_from(_p20_classes, side='both', policy='merge')
+
+check('P20 CLA classes into Groups', _p20_stats == {'added': 3, 'updated': 3, 'kept': 0}
+	and _p20_groups.members('public.kern1.T') == ['T', 'Tcaron', 'Tcedilla'] and _p20_groups.members('public.kern2.o') == ['o', 'ograve']
+	and _p20_groups.kern1_of('Tcedilla') == 'public.kern1.T')
+check('P20 bulk loaded kerning resolves through groups', _p20_kern.lookup('Tcaron', 'o', _p20_groups) == -60)
+shutil.rmtree(_p20_dir)
+
+# ===========================================================
+# - P21: versioned contour geometry memo --------------------
+# ===========================================================
+def _p21_contour():
+	return Contour([Node(0, 0), Node(0, 50, type='curve'), Node(50, 100, type='curve'), Node(100, 100), Node(100, 0)], closed=True)
+
+_p21 = _p21_contour()
+_p21_segments = _p21.segments
+check('P21 repeated reads served from the memo', _p21._memo_segments() is _p21._memo_segments() and _p21.segments is not _p21_segments
+	and _p21.sample(8) == _p21.sample(8) and _p21.node_segments[0][0] is _p21[0])
+
+_p21_segments.pop()
+_p21_segments[0].p0.x += 1
+_p21.on_curve_points[0].x += 1
+_p21.sample(8).append((1, 1))
+_p21.node_segments[0].append(None)
+check('P21 returned lists do not alias the memo', len(_p21.segments) == 3 and len(_p21.sample(8)) == 24 and len(_p21.node_segments[0]) == 4)
+check('P21 returned segments and points do not alias the memo', _p21.segments[0].p0.x == 0 and _p21.on_curve_points[0].x == 0
+	and _p21.tight_bounds.x == 0 and _p21[0].x == 0)
+
+_p21_box = _p21.bounds
+_p21_box.x = -999
+_p21_version = _p21.version
+_p21[3].x = 150
+check('P21 node edit restamps and refreshes', _p21.version != _p21_version and _p21.bounds.xmax == 150 and _p21.bounds.x == 0
+	and _p21.segments[1].p0.x == 150 and _p21.tight_bounds.xmax == 150)
+
+_p21[1].type = 'on'
+_p21[2].type = 'on'
+check('P21 type edit refreshes segments', len(_p21.segments) == 5 and all(isinstance(seg, Line) for seg in _p21.segments))
+
+_p21_area = _p21.signed_area
+_p21.closed = False
+_p21.insert(1, Node(-10, 25))
+check('P21 structural edits refresh', len(_p21.segments) == 5 and _p21.bounds.x == -10 and _p21.signed_area != _p21_area)
+
+_p21.reverse()
+check('P21 reverse refreshes', _p21.node_segments[0][0] is _p21[0] and _p21.on_curve_points[0].tuple == _p21[0].tuple)
+
+_p21.data.reverse()
+_p21.touch()
+check('P21 raw list edit + touch', _p21.node_segments[0][0] is _p21[0])
+
+_p21_clone = _p21.clone()
+_p21_clone[0].y = 500
+check('P21 clones own a fresh stamp and memo', _p21_clone.version != _p21.version and _p21_clone.bounds.ymax == 500 and _p21.bounds.ymax == 100)
+
+_p21_packed = _p21_contour().pack()
+_p21_packed.bounds
+_p21_packed[0].x = -20
+_p21_shifted = _p21_packed.bounds.x
+_p21_packed.shift(5, 0)
+check('P21 packed views and bulk writers restamp', _p21_shifted == -20 and _p21_packed.bounds.x == -15 and _p21_packed.segments[0].p0.x == -15)
+
+_p21_shape = Shape([_p21_contour(), _p21_contour()])
+_p21_layer = Layer([_p21_shape], name='L')
+_p21_token = _p21_layer.version
+_p21_shape.contours[1][0].y = 1
+_p21_edited = _p21_layer.version
+_p21_shape.data.reverse()
+check('P21 shape / layer aggregate contour stamps', _p21_token != _p21_edited != _p21_layer.version and _p21_layer.version == (_p21_shape.version,))
+
+_p21_libs = _p21_contour()
+_p21_libs_version, _p21_libs_state = _p21_libs.version, _p21_libs._xml_state()
+_p21_libs[1].lib.get('k')
+_p21_libs_read = _p21_libs.version == _p21_libs_version and _p21_libs._xml_state() == _p21_libs_state
+_p21_libs[1].lib['k'] = 1
+check('P21 node lib reads keep the stamp, in place edits still show in the XML state', _p21_libs_read
+	and _p21_libs.version == _p21_libs_version and _p21_libs._xml_state() != _p21_libs_state)
+
+from typerig.core.objects.atom import Container
+_p21_bag = Container([Node(1, 2)], default_factory=Node)
+_p21_bag[0].x, _p21_bag[0].smooth = 5, True
+_p21_bag[0].lib = {'k': 1}
+check('P21 nodes outside contours take edits', _p21_bag[0].x == 5 and _p21_bag[0].smooth and _p21_bag[0].lib == {'k': 1})
+
+from typerig.core.objects.hobbyspline import HobbyKnot
+_p21_hobby = Contour(knots=[HobbyKnot(0, 0), HobbyKnot(100, 0), HobbyKnot(100, 100), HobbyKnot(0, 100)], closed=True)
+_p21_hobby_before = (_p21_hobby.bounds.width, _p21_hobby.get_signed_area('knots'))
+_p21_hobby.data[2].x = 500
+check('P21 hobby knot edits are not memoized', _p21_hobby_before == (100, 10000)
+	and (_p21_hobby.bounds.width, abs(_p21_hobby.get_signed_area('knots'))) == (500, 30000))
+
+# ===========================================================
+# - P22: O(1) node -> segment lookup ------------------------
+# ===========================================================
+import time as _time
+
+def _p22_brute(node):
+	for run in node.parent.get_segments():
+		if run[0] is node:
+			return run
+
+_p22 = Contour([Node(0, 0), Node(10, 20, type='off'), Node(30, 20, type='off'), Node(40, 0), Node(50, 10, type='curve'),
+	Node(60, 10, type='curve'), Node(70, 0), Node(70, -10)], closed=True)
+check('P22 segment_nodes matches the segment walk', all(node.segment_nodes == _p22_brute(node) for node in _p22)
+	and _p22[1].segment_nodes is None and _p22[0].segment is None and isinstance(_p22[3].segment, CubicBezier)
+	and isinstance(_p22[7].segment, Line) and _p22.segment_index(_p22[6]) == 2 and _p22.segment_index(Node(0, 0)) is None)
+
+_p22[5].type = 'on'
+_p22.pop(1)
+check('P22 map follows edits', all(node.segment_nodes == _p22_brute(node) for node in _p22) and _p22.segment_index(_p22[5]) == 3
+	and _p22[4].segment.p1.tuple == (70., 0.))
+
+_p22_open = Contour([Node(0, 0), Node(10, 0), Node(20, 0)])
+check('P22 open contour end starts no segment', _p22_open[2].segment_nodes is None and _p22_open[1].segment.p1.tuple == (20., 0.))
+
+_p22_long = Contour([Node(i, i % 7) for i in range(4000)], closed=True)
+_p22_start = _time.time()
+_p22_found = sum(1 for node in _p22_long if node.segment_nodes is not None)
+check('P22 per node lookups stay linear', _p22_found == 4000 and _time.time() - _p22_start < 2.)
+
+# ===========================================================
+# - P23: Arc length tables and equidistant samples ----------
+# ===========================================================
+from typerig.core.func.geometry import arc_length_quad
+from typerig.core.algo.mat import sample_contour
+
+_p23_line = CubicBezier((0, 0), (30, 0), (70, 0), (100, 0))
+check('P23 straight cubic samples every step', all(close(p[0], 10. * i) and p[1] == 0. for i, p in enumerate(_p23_line.equidistant_samples(10)))
+	and len(_p23_line.equidistant_samples(10)) == 10
+	and len(_p23_line.equidistant_samples(10, include_end=True)) == 11 and close(_p23_line.equidistant_samples(30, True)[-1][0], 100.))
+
+_p23_cusp = CubicBezier((191.65, 414.09), (158.1, 135.44), (474.96, 471.9), (158.7, 196.27))
+_p23_speed = _p23_cusp._speed()
+_p23_ref = lambda t: sum(arc_length_quad(_p23_speed, t * i / 4000., t * (i + 1) / 4000.) for i in range(4000))
+_p23_total = _p23_ref(1.)
+check('P23 table length and inverse match a fine reference', close(_p23_cusp.get_arc_length(), _p23_total, 1e-5)
+	and all(close(_p23_ref(_p23_cusp.solve_t_at_length(_p23_total * f)), _p23_total * f, 1e-5) for f in (.1, .35, .5, .8, .99)))
+
+_p23_table = _p23_cusp._arc_table()
+_p23_same = _p23_cusp._arc_table() is not None and _p23_cusp._arc_cache[1] is _p23_table[0]
+_p23_cusp.p1.x += 10
+check('P23 table is cached until the control points move', _p23_same and _p23_cusp._arc_table()[0] is not _p23_table[0])
+
+_p23_quad = QuadraticBezier((0, 0), (50, 0), (100, 0))
+check('P23 quadratic and line samples', [p[0] for p in _p23_quad.equidistant_samples(25)] == [0., 25., 50., 75.]
+	and Line((0, 0), (0, 100)).equidistant_samples(40, True) == [(0., 0.), (0., 50.), (0., 100.)])
+
+_p23_box = Contour([Node(0, 0), Node(0, 100), Node(0, 100), Node(100, 100), Node(100, 0)], closed=True)
+_p23_samples = _p23_box.equidistant_samples(10)
+check('P23 contour samples skip empty segments and are memoized', len(_p23_samples) == 40 and len(set(_p23_samples)) == 40
+	and _p23_box.equidistant_samples(10) == _p23_samples and sample_contour(_p23_box, 10) == _p23_samples)
+
+_p23_box[3].x = 200
+check('P23 contour samples follow edits', len(_p23_box.equidistant_samples(10)) == 54)
+
+# ===========================================================
+# - P24: Adaptive polygons and batch point tests ------------
+# ===========================================================
+from typerig.core.func.geometry import point_in_polygon
+from typerig.core.objects.sdf import SignedDistanceField
+
+_p24_box = Contour([Node(0, 0), Node(30, 0, type='curve'), Node(70, 0, type='curve'), Node(100, 0), Node(100, 100), Node(0, 100)], closed=True)
+check('P24 straight segments give only their start points', _p24_box.sample(tolerance=.5) == [(0., 0.), (100., 0.), (100., 100.), (0., 100.)])
+
+_p24_quadlike = CubicBezier((0, 0), (100, 200), (200, 200), (300, 0))
+check('P24 flatness test catches quadratic-like cubics', len(_p24_quadlike.flatten(.5)) > 8)
+
+def _p24_seg_dist(px, py, a, b):
+	dx, dy = b[0] - a[0], b[1] - a[1]
+	t = max(0., min(1., ((px - a[0]) * dx + (py - a[1]) * dy) / float(dx * dx + dy * dy)))
+	return math.hypot(px - a[0] - t * dx, py - a[1] - t * dy)
+
+_p24_circle = _s3_circle()
+_p24_poly = _p24_circle.sample(tolerance=.5)
+check('P24 adaptive polygon stays within tolerance', 8 < len(_p24_poly) < 4 * 64 and all(
+	min(_p24_seg_dist(x, y, _p24_poly[i - 1], _p24_poly[i]) for i in range(len(_p24_poly))) <= .5 + 1e-6
+	for x, y in _p24_circle.sample(64)))
+
+_p24_same = _p24_circle.sample(tolerance=.5) == _p24_poly
+_p24_circle[0].x += 20
+check('P24 adaptive polygon is memoized per version', _p24_same and _p24_circle.sample(tolerance=.5) != _p24_poly)
+
+_p24_grid = [(x, y) for x in range(150, 660, 17) for y in range(310, 830, 13)]
+_p24_ref = [point_in_polygon(p, _p24_circle.sample(32)) and _p24_circle.tight_bounds.contains(*p) for p in _p24_grid]
+check('P24 contains_points matches the single ray caster', _p24_circle.contains_points(_p24_grid) == _p24_ref
+	and [_p24_circle.contains_point(Point(*p)) for p in _p24_grid] == _p24_ref and any(_p24_ref) and not all(_p24_ref))
+
+check('P24 layer batch test is even-odd', _hole_layer.contains_points([(50, 50), (20, 20), (150, 50), Point(99, 99)]) == [False, True, False, True]
+	and _hole_layer.contains_points([(50, 50), (20, 20)], tolerance=.5) == [False, True])
+
+_p24_sdf = SignedDistanceField.from_polylines([[(0, 0), (100, 0), (100, 100), (0, 100)], [(40, 40), (40, 60), (60, 60), (60, 40)]])
+check('P24 SDF sign uses the edge table', _p24_sdf._is_inside(20, 20) and not _p24_sdf._is_inside(50, 50) and not _p24_sdf._is_inside(120, 50))
+
+# ===========================================================
+# - P25: Sweep-and-prune intersections ----------------------
+# ===========================================================
+def _p25_brute(a, b=None):
+	cubics_a = [a._segment_to_cubic_tuple(seg) for seg in a.segments]
+	cubics_b = cubics_a if b is None else [b._segment_to_cubic_tuple(seg) for seg in b.segments]
+	return [(i, j, t_i, t_j, pt) for i in range(len(cubics_a)) for j in range(len(cubics_b))
+		for t_i, t_j, pt in curve_curve_intersections(cubics_a[i], cubics_b[j], .1)]
+
+_p25_a = _s3_circle()
+_p25_b = _s3_circle()
+_p25_b.shift(150, 90)
+check('P25 contour intersections match all pairs', len(_p25_a.intersections(_p25_b)) == 2
+	and _p25_a.intersections(_p25_b) == _p25_brute(_p25_a, _p25_b) and _outer.intersections(_sq2) == _p25_brute(_outer, _sq2))
+
+_p25_zig = Contour([Node(0, 0), Node(100, 100), Node(100, 0), Node(0, 100), Node(50, -20), Node(60, 120)], closed=True)
+check('P25 self intersections keep their order', len(_p25_zig.self_intersections()) >= 3
+	and [hit[:2] for hit in _p25_zig.self_intersections()] == sorted(hit[:2] for hit in _p25_zig.self_intersections()))
+
+_p25_far = Contour([Node(900, 900), Node(950, 900), Node(950, 950)], closed=True)
+_p25_layer = Layer([Shape([_outer, _p25_far]), Shape([_sq2])])
+_p25_hits = _p25_layer.intersections()
+check('P25 layer intersections pair contours', [hit[:4] for hit in _p25_hits] == [(0, i, 2, j) for i, j, _t_i, _t_j, _pt in _outer.intersections(_sq2)]
+	and [hit[6] for hit in _p25_hits] == [hit[4] for hit in _outer.intersections(_sq2)])
+
+_p25_cells = Layer([Shape([Contour([Node(x, y), Node(x + 8, y), Node(x + 8, y + 8), Node(x, y + 8)], closed=True)
+	for x in range(0, 1000, 10) for y in range(0, 200, 10)])])
+_p25_start = _time.time()
+check('P25 disjoint layer stays near-linear', _p25_cells.intersections() == [] and _time.time() - _p25_start < 2.)
+
 # - Finish -----------------------------
 print()
 if fails:
@@ -18,7 +18,7 @@ from typerig.core.objects.contour import Contour
 from typerig.core.objects.node import Node
 
 # - Init ---------------------------------
-__version__ = '0.1.0'
+__version__ = '0.1.1'
 
 # - Helpers ------------------------------
 def _build_gs_path(core_contour):
@@ -72,6 +72,9 @@ class trContour(Contour):
 	__meta__ = {'closed': 'closed'}
 	__meta_keys = frozenset(__meta__.keys())
 
+	# Host nodes change outside TypeRig: never memoize derived geometry
+	CACHE_GEOMETRY = False
+
 	# - Initialize ---------------------------
 	def __init__(self, path, **kwargs):
 		self.host = path
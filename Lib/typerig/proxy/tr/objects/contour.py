@@ -20,7 +20,7 @@ from typerig.core.objects.contour import Contour
 from typerig.core.objects.node import Node
 
 # - Init --------------------------------
-__version__ = '0.2.0'
+__version__ = '0.2.1'
 
 # - Keep compatibility for basestring checks
 try:
@@ -59,6 +59,9 @@ class trContour(Contour):
 	__meta__ = {'closed':'closed', 'clockwise':'clockwise', 'name':'name'}
 	__meta_keys = frozenset(__meta__.keys())
 
+	# Host nodes change outside TypeRig: never memoize derived geometry
+	CACHE_GEOMETRY = False
+
 	# - Initialize -----------------------------
 	def __init__(self, contour, **kwargs):
 		self.host = contour
@@ -11,25 +11,36 @@
 # that you use it at your own risk!
 
 # - Overview ----------------------------
-# Pure-Python CLI: ufo2tr, tr2ufo, roundtrip.
+# Pure-Python CLI: ufo2tr, tr2ufo, roundtrip, cache, batch.
 # Requires fontTools (UFO and designspace support).
 #
-#   python trconvert.py ufo2tr input.ufo output.trfont [--verbose]
-#   python trconvert.py tr2ufo input.trfont output.ufo [--verbose]
+#   python trconvert.py ufo2tr input.ufo output.trfont [--workers N] [--verbose]
+#   python trconvert.py tr2ufo input.trfont output.ufo|.designspace [--workers N] [--changed-only] [--verbose]
 #   python trconvert.py roundtrip input.trfont|input.ufo [--keep-tmp]
+#   python trconvert.py cache info|verify|clear input.trfont [--prune] [--deep]
+#   python trconvert.py batch ufo2tr|tr2ufo|roundtrip "fonts/*.ufo" [--manifest FILE] [--output-dir DIR] [--workers N] [--json FILE]
 #
 # `roundtrip` runs both directions on a temporary copy and prints
 # PASS / FAIL with a structural diff summary; exit code is non-zero
 # on failure.
+#
+# `batch` runs one of the above per input font in a process pool, so
+# interpreter start-up and imports are paid once for a whole family.
+# It prints a per-font table followed by a JSON summary; the exit code
+# is that of the worst font (0: all ok, 1: a roundtrip failed, 2: an
+# input was missing or raised).
 
 # - Dependencies ------------------------
 from __future__ import absolute_import, print_function, division
 
 import argparse
+import glob
+import json
 import os
 import shutil
 import sys
 import tempfile
+import time
 
 # Wire the lib path when run from inside the repo (no install needed)
 HERE = os.path.dirname(os.path.abspath(__file__))
@@ -37,7 +48,7 @@ LIB_PATH = os.path.normpath(os.path.join(HERE, '..', '..', 'Lib'))
 if os.path.isdir(LIB_PATH) and LIB_PATH not in sys.path:
 	sys.path.insert(0, LIB_PATH)
 
-from typerig.core.fileio.trfont import TrFontIO
+from typerig.core.fileio.trfont import TrFontIO, GlyphCache, _pool_size
 from typerig.core.fileio.ufo import UfoConverter
 
 
@@ -95,7 +106,8 @@ def _layer_signature(layer):
 	}
 
 
-def _glyph_signature(glyph):
+def _glyph_meta(glyph):
+	'''Glyph-level fields of the signature; layers are compared separately.'''
 	# UFO has no glyph-vs-layer guideline distinction — all guidelines live
 	# in .glif files. Combine glyph-level + every-layer guidelines into one
 	# sorted set so the round-trip is comparable.
@@ -110,11 +122,17 @@ def _glyph_signature(glyph):
 		'note':       (glyph.note or '').strip(),
 		'mark':       (glyph.mark or '').upper(),
 		'guidelines': tuple(sorted(all_guides, key=lambda x: tuple(str(v) for v in x))),
-		'layers':     {l.name: _layer_signature(l) for l in glyph.layers},
 	}
 
 
+def _glyph_signature(glyph):
+	signature = _glyph_meta(glyph)
+	signature['layers'] = {l.name: _layer_signature(l) for l in glyph.layers}
+	return signature
+
+
 def _font_signature(font):
+	'''Descriptor-level signature; glyphs are compared by _glyph_diffs.'''
 	groups = {g.name: tuple(g.members) for g in font.groups.data}
 	kern = sorted((p.first, p.second, int(p.value)) for p in font.kerning.pairs)
 
@@ -158,7 +176,6 @@ def _font_signature(font):
 		'groups':    {k: tuple(sorted(v)) for k, v in groups.items()},
 		'kerning':   tuple(kern),
 		'features':  (font.features or '').strip(),
-		'glyphs':    [_glyph_signature(g) for g in font.glyphs],
 	}
 
 
@@ -203,22 +220,75 @@ def _diff(a, b, path='', diffs=None):
 	return diffs
 
 
+def _glyph_diffs(a, b):
+	'''Structural differences between the glyphs of fonts a and b, with the
+	paths _diff would report. Geometry is compared through Merkle digests:
+	equal glyph digest lists (equal Font.digest roots) settle all glyphs at
+	once, otherwise layer digests of the differing glyphs narrow the
+	signature diff down to the layers that actually changed. Digests round
+	like _layer_signature, so they can only send more layers to _diff,
+	never hide a difference.
+	'''
+	glyphs_a, glyphs_b = a.glyphs, b.glyphs
+	if len(glyphs_a) != len(glyphs_b):
+		return ['glyphs: length mismatch {} vs {}'.format(len(glyphs_a), len(glyphs_b))]
+
+	diffs = []
+	digests_a = [glyph.digest() for glyph in glyphs_a]
+	digests_b = [glyph.digest() for glyph in glyphs_b]
+
+	for i, (glyph_a, glyph_b) in enumerate(zip(glyphs_a, glyphs_b)):
+		path = 'glyphs[{}]'.format(i)
+		_diff(_glyph_meta(glyph_a), _glyph_meta(glyph_b), path, diffs)
+
+		if digests_a[i] == digests_b[i]:
+			continue
+
+		layers_a = {l.name: l for l in glyph_a.layers}
+		layers_b = {l.name: l for l in glyph_b.layers}
+
+		for name in sorted(set(layers_a) | set(layers_b), key=str):
+			sub = '{}.layers.{}'.format(path, name)
+			if name not in layers_a:
+				diffs.append('{}: only in B'.format(sub))
+			elif name not in layers_b:
+				diffs.append('{}: only in A'.format(sub))
+			elif layers_a[name].digest() != layers_b[name].digest():
+				_diff(_layer_signature(layers_a[name]), _layer_signature(layers_b[name]), sub, diffs)
+
+	return diffs
+
+
 # - Commands ----------------------------
+def _print_timings(timings):
+	for stage, seconds in timings.items():
+		print('  {:<12} {:>8.2f} s'.format(stage, seconds))
+
+
 def cmd_ufo2tr(args):
 	converter = UfoConverter(verbose=args.verbose)
-	font = converter.to_tr(args.input)
-	TrFontIO.write(font, args.output)
+	font = converter.to_tr(args.input, workers=args.workers)
+	TrFontIO.write(font, args.output, workers=args.workers)
 	if args.verbose:
+		print('Read: {}'.format(args.input))
+		_print_timings(converter.timings)
 		print('Wrote: {}'.format(args.output))
 	return 0
 
 
 def cmd_tr2ufo(args):
-	font = TrFontIO.read(args.input)
+	font = TrFontIO.read(args.input, workers=args.workers)
 	converter = UfoConverter(verbose=args.verbose)
-	out_path = converter.to_ufo(font, args.output)
+
+	if args.output.lower().endswith('.designspace'):
+		out_path = converter.tr_to_designspace(font, args.output, workers=args.workers, changed_only=args.changed_only)
+	else:
+		out_path = converter.to_ufo(font, args.output)
+
 	if args.verbose:
 		print('Wrote: {}'.format(out_path))
+		for name in converter.unchanged:
+			print('Unchanged master: {}'.format(name))
 		# If we wrote to .ufo, the sibling .designspace is informational
 		if args.output.lower().endswith('.ufo'):
 			ds = os.path.splitext(args.output)[0] + '.designspace'
@@ -234,75 +304,86 @@ def cmd_tr2ufo(args):
 	return 0
 
 
-def cmd_roundtrip(args):
-	src = args.input
-	src_low = src.rstrip(os.sep).lower()
+def _roundtrip(src, converter, tmp):
+	'''Round-trip src through both formats inside tmp. Returns the original
+	font and its structural differences to the result (known-lossy fields
+	filtered). Raises ValueError for inputs of unknown format.
+	'''
+	def _is_trfont(p):
+		return p.lower().endswith('.trfont') or os.path.isfile(os.path.join(p, 'font.xml'))
 
-	tmp = tempfile.mkdtemp(prefix='trconvert_')
+	def _is_designspace(p):
+		return p.lower().endswith('.designspace') and os.path.isfile(p)
 
-	try:
-		converter = UfoConverter(verbose=args.verbose)
+	def _is_ufo(p):
+		return p.lower().endswith('.ufo') or os.path.isfile(os.path.join(p, 'metainfo.plist'))
 
-		def _is_trfont(p):
-			return p.lower().endswith('.trfont') or os.path.isfile(os.path.join(p, 'font.xml'))
+	if _is_trfont(src):
+		# trfont → designspace + UFOs → trfont
+		original = TrFontIO.read(src)
 
-		def _is_designspace(p):
-			return p.lower().endswith('.designspace') and os.path.isfile(p)
+		ds_path = os.path.join(tmp, 'mid.designspace')
+		converter.to_ufo(original, ds_path)
 
-		def _is_ufo(p):
-			return p.lower().endswith('.ufo') or os.path.isfile(os.path.join(p, 'metainfo.plist'))
+		back = converter.to_tr(ds_path)
 
-		if _is_trfont(src):
-			# trfont → designspace + UFOs → trfont
-			original = TrFontIO.read(src)
+	elif _is_designspace(src):
+		# designspace → trfont → designspace
+		original = converter.to_tr(src)
 
-			ds_path = os.path.join(tmp, 'mid.designspace')
-			converter.to_ufo(original, ds_path)
+		tr_path = os.path.join(tmp, 'mid.trfont')
+		TrFontIO.write(original, tr_path)
 
-			back = converter.to_tr(ds_path)
+		reread = TrFontIO.read(tr_path)
+		ds_back = os.path.join(tmp, 'back.designspace')
+		converter.to_ufo(reread, ds_back)
+		back = converter.to_tr(ds_back)
 
-		elif _is_designspace(src):
-			# designspace → trfont → designspace
-			original = converter.to_tr(src)
+	elif _is_ufo(src):
+		# Single-UFO → trfont → ufo
+		original = converter.to_tr(src)
 
-			tr_path = os.path.join(tmp, 'mid.trfont')
-			TrFontIO.write(original, tr_path)
+		tr_path = os.path.join(tmp, 'mid.trfont')
+		TrFontIO.write(original, tr_path)
 
-			reread = TrFontIO.read(tr_path)
-			ds_back = os.path.join(tmp, 'back.designspace')
-			converter.to_ufo(reread, ds_back)
-			back = converter.to_tr(ds_back)
+		reread = TrFontIO.read(tr_path)
+		ufo_back = os.path.join(tmp, 'back.ufo')
+		converter.tr_to_ufo(reread, ufo_back)
+		back = converter.ufo_to_tr(ufo_back)
 
-		elif _is_ufo(src):
-			# Single-UFO → trfont → ufo
-			original = converter.to_tr(src)
+	else:
+		raise ValueError('unknown input format: {}'.format(src))
 
-			tr_path = os.path.join(tmp, 'mid.trfont')
-			TrFontIO.write(original, tr_path)
+	sig_a = _font_signature(original)
+	sig_b = _font_signature(back)
+	diffs = _diff(sig_a, sig_b)
+	diffs.extend(_glyph_diffs(original, back))
 
-			reread = TrFontIO.read(tr_path)
-			ufo_back = os.path.join(tmp, 'back.ufo')
-			converter.tr_to_ufo(reread, ufo_back)
-			back = converter.ufo_to_tr(ufo_back)
+	# Case-insensitive filesystem regression: glyph names that differ
+	# only by case (e.g. 'A' and 'a') must both survive the round-trip
+	# with distinct content. Before the filename mangler in TrFontIO,
+	# the second write clobbered the first on NTFS/APFS.
+	case_diffs = _case_collision_check(original, back)
+	diffs.extend(case_diffs)
 
-		else:
-			print('roundtrip: unknown input format: {}'.format(src), file=sys.stderr)
-			return 2
+	# Filter known-lossy fields that the format intentionally does not
+	# preserve verbatim through the inverse trip (e.g. version padding).
+	return original, [d for d in diffs if not _is_known_lossy(d)]
+
+
+def cmd_roundtrip(args):
+	src = args.input.rstrip(os.sep)
+	tmp = tempfile.mkdtemp(prefix='trconvert_')
 
-		sig_a = _font_signature(original)
-		sig_b = _font_signature(back)
-		diffs = _diff(sig_a, sig_b)
+	try:
+		converter = UfoConverter(verbose=args.verbose)
 
-		# Case-insensitive filesystem regression: glyph names that differ
-		# only by case (e.g. 'A' and 'a') must both survive the round-trip
-		# with distinct content. Before the filename mangler in TrFontIO,
-		# the second write clobbered the first on NTFS/APFS.
-		case_diffs = _case_collision_check(original, back)
-		diffs.extend(case_diffs)
+		try:
+			original, filtered = _roundtrip(src, converter, tmp)
 
-		# Filter known-lossy fields that the format intentionally does not
-		# preserve verbatim through the inverse trip (e.g. version padding).
-		filtered = [d for d in diffs if not _is_known_lossy(d)]
+		except ValueError as error:
+			print('roundtrip: {}'.format(error), file=sys.stderr)
+			return 2
 
 		if not filtered:
 			print('PASS')
@@ -322,6 +403,33 @@ def cmd_roundtrip(args):
 			shutil.rmtree(tmp, ignore_errors=True)
 
 
+def cmd_cache(args):
+	if not os.path.isdir(args.input):
+		print('cache: not a .trfont folder: {}'.format(args.input), file=sys.stderr)
+		return 2
+
+	cache = GlyphCache(args.input)
+
+	if args.action == 'clear':
+		print('Removed {} cache entries'.format(cache.clear()))
+		return 0
+
+	entries = cache.entries()
+	print('{}: {} entries, {:.1f} MiB'.format(cache.path, len(entries), sum(size for _, size, _ in entries) / 2.**20))
+
+	if args.action == 'verify':
+		report = cache.verify(prune=args.prune, deep=args.deep)
+		print(', '.join('{} {}'.format(report[key], key) for key in ('valid', 'missing', 'stale', 'broken', 'orphaned')))
+
+		if args.prune:
+			print('Pruned {} entries'.format(report['stale'] + report['broken'] + report['orphaned']))
+
+		# Stale or orphaned entries are harmless (never used); broken ones are not
+		return 1 if report['broken'] and not args.prune else 0
+
+	return 0
+
+
 def _case_collision_check(original, back):
 	'''Verify that glyph-name pairs differing only by case survive
 	the round-trip with distinct content on both sides.'''
@@ -365,6 +473,191 @@ def _is_known_lossy(diff_line):
 	return False
 
 
+# - Batch -------------------------------
+_BATCH_OUTPUT_EXT = {'ufo2tr': '.trfont', 'tr2ufo': '.designspace'}
+_BATCH_STATUS = ('ok', 'fail', 'error')	# Exit code = index of the worst status
+
+
+def _batch_inputs(patterns, manifest=None):
+	'''Expand glob patterns and manifest lines into (input, output, exists)
+	triples; output is None unless the manifest names one. Manifest lines hold an
+	input path or pattern, optionally followed by a tab and an output path;
+	blank lines and lines starting with # are skipped, relative paths are
+	taken from the manifest folder. Patterns matching nothing are kept
+	with exists False, so they are reported rather than dropped.
+	'''
+	entries = [(pattern, None) for pattern in patterns]
+
+	if manifest is not None:
+		root = os.path.dirname(os.path.abspath(manifest))
+
+		with open(manifest, 'r', encoding='utf-8') as f:
+			for line in f:
+				line = line.strip()
+
+				if not line or line.startswith('#'):
+					continue
+
+				fields = [os.path.join(root, field.strip()) for field in line.split('\t', 1)]
+				entries.append((fields[0], fields[1] if len(fields) > 1 else None))
+
+	result, seen = [], set()
+
+	for pattern, output in entries:
+		matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern] if os.path.exists(pattern) else []
+
+		if not matches:
+			result.append((pattern, None, False))
+			continue
+
+		for path in matches:
+			path = path.rstrip(os.sep)
+
+			if path not in seen:
+				seen.add(path)
+				result.append((path, output, True))
+
+	return result
+
+
+def _batch_output(action, src, output_dir):
+	stem = os.path.splitext(os.path.basename(src))[0]
+	return os.path.join(output_dir or os.path.dirname(os.path.abspath(src)), stem + _BATCH_OUTPUT_EXT[action])
+
+
+def _batch_job(job):
+	'''Run one batch conversion in a worker. Never raises: failures are
+	reported in the returned record.'''
+	action, src, dst, changed_only = job
+	record = {'input': src, 'output': dst, 'action': action, 'status': 'ok', 'glyphs': 0, 'seconds': 0., 'message': ''}
+	start = time.perf_counter()
+
+	try:
+		converter = UfoConverter(verbose=False)
+
+		if action == 'ufo2tr':
+			font = converter.to_tr(src)
+			TrFontIO.write(font, dst)
+
+		elif action == 'tr2ufo':
+			font = TrFontIO.read(src)
+
+			if dst.lower().endswith('.designspace'):
+				converter.tr_to_designspace(font, dst, changed_only=changed_only)
+				record['unchanged'] = converter.unchanged
+			else:
+				converter.tr_to_ufo(font, dst)
+
+		else:
+			tmp = tempfile.mkdtemp(prefix='trconvert_')
+
+			try:
+				font, diffs = _roundtrip(src, converter, tmp)
+
+			finally:
+				shutil.rmtree(tmp, ignore_errors=True)
+
+			if diffs:
+				record['status'] = 'fail'
+				record['message'] = '{} structural differences'.format(len(diffs))
+				record['diffs'] = diffs[:30]
+
+		record['glyphs'] = len(font)
+
+	except Exception as error:
+		record['status'] = 'error'
+		record['message'] = '{}: {}'.format(type(error).__name__, error)
+
+	record['seconds'] = time.perf_counter() - start
+	return record
+
+
+def _print_batch_table(records):
+	print('{:>4}  {:<6} {:>9} {:>8} {:>10}  {}'.format('#', 'status', 'seconds', 'glyphs', 'glyphs/s', 'input'))
+
+	for i, record in enumerate(records, 1):
+		seconds = record['seconds']
+		rate = record['glyphs'] / seconds if seconds and record['glyphs'] else 0.
+		print('{:>4}  {:<6} {:>9.2f} {:>8} {:>10.1f}  {}'.format(i, record['status'], seconds, record['glyphs'], rate, record['input']))
+
+		if record['message']:
+			print('{:>4}  {}'.format('', record['message']))
+
+
+def cmd_batch(args):
+	entries = _batch_inputs(args.inputs, args.manifest)
+
+	if not entries:
+		print('batch: no inputs given', file=sys.stderr)
+		return 2
+
+	jobs, records, outputs = [], [], {}
+
+	for src, dst, exists in entries:
+		if not exists:
+			records.append({'input': src, 'output': None, 'action': args.action, 'status': 'error', 'glyphs': 0, 'seconds': 0., 'message': 'no such input'})
+			continue
+
+		if args.action != 'roundtrip':
+			dst = dst or _batch_output(args.action, src, args.output_dir)
+
+			# Two inputs sharing a stem must not overwrite each other
+			if dst in outputs:
+				records.append({'input': src, 'output': dst, 'action': args.action, 'status': 'error', 'glyphs': 0, 'seconds': 0.,
+					'message': 'output also written by {}'.format(outputs[dst])})
+				continue
+
+			outputs[dst] = src
+
+		records.append(None)
+		jobs.append((args.action, src, dst, args.changed_only))
+
+	workers = min(_pool_size(args.workers), len(jobs)) or 1
+	start = time.perf_counter()
+
+	if workers > 1:
+		from concurrent.futures import ProcessPoolExecutor
+
+		with ProcessPoolExecutor(max_workers=workers) as pool:
+			results = list(pool.map(_batch_job, jobs))
+	else:
+		results = [_batch_job(job) for job in jobs]
+
+	wall = time.perf_counter() - start
+	results = iter(results)
+	records = [record if record is not None else next(results) for record in records]
+
+	counts = {status: sum(1 for record in records if record['status'] == status) for status in _BATCH_STATUS}
+	exit_code = max(_BATCH_STATUS.index(record['status']) for record in records)
+	glyphs = sum(record['glyphs'] for record in records)
+
+	summary = {
+		'action':       args.action,
+		'workers':      workers,
+		'fonts':        len(records),
+		'glyphs':       glyphs,
+		'wall_seconds': round(wall, 4),
+		'work_seconds': round(sum(record['seconds'] for record in records), 4),
+		'exit_code':    exit_code,
+		'results':      records,
+	}
+	summary.update(counts)
+
+	_print_batch_table(records)
+	print('{} fonts: {} ok, {} fail, {} error; {} glyphs in {:.2f} s ({:.2f} fonts/s, {:.1f} glyphs/s, {} workers)'.format(
+		len(records), counts['ok'], counts['fail'], counts['error'], glyphs, wall,
+		len(jobs) / wall if wall else 0., glyphs / wall if wall else 0., workers))
+
+	if args.json == '-':
+		print(json.dumps(summary, indent=2))
+
+	elif args.json:
+		with open(args.json, 'w', encoding='utf-8') as f:
+			json.dump(summary, f, indent=2)
+
+	return exit_code
+
+
 # - Entry point -------------------------
 def build_parser():
 	p = argparse.ArgumentParser(
@@ -376,6 +669,8 @@ def build_parser():
 	sp = subs.add_parser('ufo2tr', help='UFO 3 / designspace → .trfont')
 	sp.add_argument('input',   help='Input .designspace file or .ufo folder')
 	sp.add_argument('output',  help='Output .trfont folder')
+	sp.add_argument('--workers', '-j', type=int, default=None,
+		help='Processes reading .glif / writing .trglyph files (0: all cores)')
 	sp.add_argument('--verbose', '-v', action='store_true')
 	sp.set_defaults(func=cmd_ufo2tr)
 
@@ -383,6 +678,10 @@ def build_parser():
 	sp.add_argument('input',   help='Input .trfont folder')
 	sp.add_argument('output',
 		help='Output .designspace file (preferred — produces designspace + one UFO per master) or .ufo folder (single-UFO layout)')
+	sp.add_argument('--workers', '-j', type=int, default=None,
+		help='Processes reading .trglyph files / writing master UFOs (0: all cores)')
+	sp.add_argument('--changed-only', action='store_true',
+		help='.designspace: keep master UFOs whose content did not change since the last export')
 	sp.add_argument('--verbose', '-v', action='store_true')
 	sp.set_defaults(func=cmd_tr2ufo)
 
@@ -394,6 +693,31 @@ def build_parser():
 	sp.add_argument('--verbose', '-v', action='store_true')
 	sp.set_defaults(func=cmd_roundtrip)
 
+	sp = subs.add_parser('cache', help='Inspect, verify or clear the binary glyph cache of a .trfont')
+	sp.add_argument('action',  choices=('info', 'verify', 'clear'))
+	sp.add_argument('input',   help='Input .trfont folder')
+	sp.add_argument('--prune', action='store_true',
+		help='verify: remove stale, broken and orphaned entries')
+	sp.add_argument('--deep',  action='store_true',
+		help='verify: also compare every cached glyph with its parsed XML')
+	sp.set_defaults(func=cmd_cache)
+
+	sp = subs.add_parser('batch',
+		help='Convert or round-trip many fonts in one process pool and report per-font timings')
+	sp.add_argument('action',  choices=('ufo2tr', 'tr2ufo', 'roundtrip'))
+	sp.add_argument('inputs',  nargs='*', help='Input paths or glob patterns (quote them)')
+	sp.add_argument('--manifest', '-m', default=None,
+		help='Text file listing one input path or pattern per line, optionally followed by a tab and an output path')
+	sp.add_argument('--output-dir', '-o', default=None,
+		help='ufo2tr / tr2ufo: folder receiving <stem>.trfont / <stem>.designspace outputs (default: next to each input)')
+	sp.add_argument('--workers', '-j', type=int, default=0,
+		help='Fonts converted concurrently (default 0: all cores, 1: serial)')
+	sp.add_argument('--changed-only', action='store_true',
+		help='tr2ufo: keep master UFOs whose content did not change since the last export')
+	sp.add_argument('--json', default='-',
+		help='Write the JSON summary to this file (default -: print it after the table)')
+	sp.set_defaults(func=cmd_batch)
+
 	return p
 
 